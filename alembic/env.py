@@ -15,6 +15,15 @@ fileConfig(config.config_file_name) if config.config_file_name else None
 engine = create_engine(settings.DATABASE_URL, echo=True)
 target_metadata = Base.metadata
 
+def include_name(name, type_, parent_names):
+    """SQLite FTS5 가상 테이블과 내부 테이블은 모델 밖에서 만들므로 비교에서 제외"""
+    return not (type_ == "table" and name.startswith("question_search_fts"))
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """특정 데이터베이스에서만 만드는 객체(ddl_if)는 해당 데이터베이스에서만 비교"""
+    ddl_if = getattr(obj, "_ddl_if", None)
+    return ddl_if is None or ddl_if.dialect is None or ddl_if.dialect == engine.dialect.name
+
 def run_migrations_offline():
     """오프라인 모드 (동기 방식)"""
     context.configure(
@@ -23,6 +32,8 @@ def run_migrations_offline():
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_name=include_name,
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -35,7 +46,9 @@ def run_migrations_online():
             target_metadata=target_metadata,
             dialect_opts={"paramstyle": "named"},
             compare_type=True,
-            compare_server_default=True
+            compare_server_default=True,
+            include_name=include_name,
+            include_object=include_object,
         )
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,150 @@
+"""partition attempt answers, attempt archive
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 19:10:00.000000
+
+Postgres 에서는 user_quiz_attempt_answers 를 created_at 기준 월 단위 범위 파티션 테이블로 바꿉니다.
+기존 행의 created_at 은 응시 시작 시각으로 채우고, 기존 데이터가 있는 달부터 ATTEMPT_PARTITION_MONTHS_AHEAD
+개월 뒤까지 파티션을 만듭니다. 이후 파티션은 app.tasks.archive 가 미리 만듭니다.
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "user_quiz_attempt_answers"
+IntArray = sa.JSON().with_variant(postgresql.ARRAY(sa.Integer()), "postgresql")
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    index = day.year * 12 + day.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partition_answers() -> None:
+    bind = op.get_bind()
+    op.execute(f"""
+        CREATE TABLE {TABLE}_p (
+            id INTEGER NOT NULL,
+            user_quiz_attempt_id INTEGER NOT NULL REFERENCES user_quiz_attempts (id),
+            question_id INTEGER NOT NULL REFERENCES questions (id),
+            choice_id INTEGER NOT NULL REFERENCES choices (id),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT {TABLE}_p_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE}_p DEFAULT")
+
+    oldest = bind.execute(sa.text(
+        f"SELECT min(user_quiz_attempts.attempted_at) FROM {TABLE} "
+        f"JOIN user_quiz_attempts ON user_quiz_attempts.id = {TABLE}.user_quiz_attempt_id"
+    )).scalar()
+    today = date.today()
+    start = _month_start(oldest.date() if oldest else today)
+    while start <= _month_start(today, settings.ATTEMPT_PARTITION_MONTHS_AHEAD):
+        end = _month_start(start, 1)
+        op.execute(
+            f"CREATE TABLE {TABLE}_{start:%Y%m} PARTITION OF {TABLE}_p "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+
+    op.execute(f"""
+        INSERT INTO {TABLE}_p (id, user_quiz_attempt_id, question_id, choice_id, created_at)
+        SELECT answers.id, answers.user_quiz_attempt_id, answers.question_id, answers.choice_id,
+               COALESCE(user_quiz_attempts.attempted_at, now())
+        FROM {TABLE} AS answers
+        LEFT JOIN user_quiz_attempts ON user_quiz_attempts.id = answers.user_quiz_attempt_id
+    """)
+    # 기존 시퀀스를 그대로 이어 씁니다.
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY NONE")
+    op.execute(f"DROP TABLE {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE}_p RENAME TO {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE} RENAME CONSTRAINT {TABLE}_p_pkey TO {TABLE}_pkey")
+    op.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    op.create_index(op.f('ix_user_quiz_attempt_answers_id'), TABLE, ['id'], unique=False)
+
+
+def _unpartition_answers() -> None:
+    op.execute(f"""
+        CREATE TABLE {TABLE}_h (
+            id INTEGER NOT NULL,
+            user_quiz_attempt_id INTEGER NOT NULL REFERENCES user_quiz_attempts (id),
+            question_id INTEGER NOT NULL REFERENCES questions (id),
+            choice_id INTEGER NOT NULL REFERENCES choices (id),
+            CONSTRAINT {TABLE}_h_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute(
+        f"INSERT INTO {TABLE}_h (id, user_quiz_attempt_id, question_id, choice_id) "
+        f"SELECT id, user_quiz_attempt_id, question_id, choice_id FROM {TABLE}"
+    )
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY NONE")
+    # 파티션 테이블을 지우면 모든 파티션이 함께 지워집니다.
+    op.execute(f"DROP TABLE {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE}_h RENAME TO {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE} RENAME CONSTRAINT {TABLE}_h_pkey TO {TABLE}_pkey")
+    op.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+    op.execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    op.create_index(op.f('ix_user_quiz_attempt_answers_id'), TABLE, ['id'], unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        _partition_answers()
+    else:
+        # SQLite 는 기본값이 함수인 컬럼을 ALTER TABLE 로 추가할 수 없어 테이블을 다시 만듭니다.
+        with op.batch_alter_table(TABLE, recreate="always") as batch_op:
+            batch_op.add_column(sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False))
+    op.create_index(op.f('ix_user_quiz_attempt_answers_user_quiz_attempt_id'), TABLE, ['user_quiz_attempt_id'], unique=False)
+
+    op.create_table('user_quiz_attempt_archives',
+    sa.Column('attempt_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('quiz_id', sa.Integer(), nullable=False),
+    sa.Column('attempted_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=True),
+    sa.Column('total', sa.Integer(), nullable=True),
+    sa.Column('question_ids', IntArray, nullable=False),
+    sa.Column('choice_counts', IntArray, nullable=False),
+    sa.Column('choice_ids', IntArray, nullable=False),
+    sa.ForeignKeyConstraint(['attempt_id'], ['user_quiz_attempts.id'], ),
+    sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('attempt_id')
+    )
+    op.create_index(op.f('ix_user_quiz_attempt_archives_quiz_id'), 'user_quiz_attempt_archives', ['quiz_id'], unique=False)
+    op.create_index(op.f('ix_user_quiz_attempt_archives_user_id'), 'user_quiz_attempt_archives', ['user_id'], unique=False)
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index('ix_user_quiz_attempt_archives_question_ids', 'user_quiz_attempt_archives', ['question_ids'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index('ix_user_quiz_attempt_archives_question_ids', table_name='user_quiz_attempt_archives')
+    op.drop_index(op.f('ix_user_quiz_attempt_archives_user_id'), table_name='user_quiz_attempt_archives')
+    op.drop_index(op.f('ix_user_quiz_attempt_archives_quiz_id'), table_name='user_quiz_attempt_archives')
+    op.drop_table('user_quiz_attempt_archives')
+
+    op.drop_index(op.f('ix_user_quiz_attempt_answers_user_quiz_attempt_id'), table_name=TABLE)
+    if op.get_bind().dialect.name == "postgresql":
+        _unpartition_answers()
+    else:
+        with op.batch_alter_table(TABLE, recreate="always") as batch_op:
+            batch_op.drop_column('created_at')
@@ -0,0 +1,34 @@
+"""packed answer sheets
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 20:05:00.000000
+
+응시 스냅샷과 보관된 응시에 압축 답안지(app.utils.answer_sheet)와 컨텐츠 버전 컬럼을 추가합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('user_quiz_attempt_snapshots', 'user_quiz_attempt_archives'):
+        op.add_column(table, sa.Column('content_version', sa.BigInteger(), nullable=True))
+        op.add_column(table, sa.Column('answer_sheet', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('user_quiz_attempt_archives', 'user_quiz_attempt_snapshots'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('answer_sheet')
+            batch_op.drop_column('content_version')
@@ -0,0 +1,31 @@
+"""attempt deadline index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 23:40:00.000000
+
+자동 제출 워커가 Redis 에서 사라진 마감을 Postgres 에서 다시 찾을 수 있도록
+user_quiz_attempts (is_submit, deadline_at) 인덱스를 추가합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_user_quiz_attempts_is_submit_deadline_at', 'user_quiz_attempts', ['is_submit', 'deadline_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_quiz_attempts_is_submit_deadline_at', table_name='user_quiz_attempts')
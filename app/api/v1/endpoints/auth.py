@@ -1,26 +1,20 @@
-from datetime import timedelta, datetime
-import pytz
-
-from fastapi import APIRouter, Depends, HTTPException
+import redis
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from jose import jwt
 
-from app.core.security import verify_password, get_password_hash
-from app.core.config import settings
+from app.core.security import (
+    REFRESH_TOKEN_TYPE,
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    user_token_claims,
+    verify_password,
+)
 from app.db.session import get_db
-from app.crud.user import get_user_by_username, get_user_by_email
-from app.models.user import User
-from app.schemas.auth import LoginRequest, OAuth2EmailRequest, Token, TokenResponse
+from app.crud.user import get_user, get_user_by_email, mark_refresh_token_used, revoke_user_tokens
+from app.schemas.auth import LoginRequest, OAuth2EmailRequest, RefreshTokenRequest, Token, TokenResponse
 
 router = APIRouter()
-KST = pytz.timezone('Asia/Seoul')
-
-def create_access_token(data: dict, expires_delta: timedelta):
-    """JWT 토큰 생성 함수"""
-    to_encode = data.copy()
-    expire = datetime.now(KST) + expires_delta
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 @router.post("/token", response_model=TokenResponse)
 def login_for_access_token(
@@ -36,6 +30,7 @@ def login_for_access_token(
 
     응답 데이터:
     - access_token (str): 인증된 사용자를 위한 JWT 액세스 토큰
+    - refresh_token (str): 액세스 토큰 재발급용 리프레시 토큰
     - token_type (str): 토큰 타입 (bearer)
 
     예외 처리:
@@ -45,11 +40,59 @@ def login_for_access_token(
     if not user or not verify_password(login_data.password, user.password):
         raise HTTPException(status_code=400, detail="Invalid email or password")
     
-    access_token = create_access_token(
-        data={"sub": str(user.id)}, 
-        expires_delta=timedelta(minutes=30)
+    access_token = create_access_token(data=user_token_claims(user))
+    return TokenResponse(
+        access_token=access_token,
+        refresh_token=create_refresh_token(user),
+        token_type="bearer",
+    )
+
+@router.post("/refresh", response_model=TokenResponse)
+def refresh_access_token(request: RefreshTokenRequest, db: Session = Depends(get_db)):
+    """
+    리프레시 토큰으로 액세스 토큰을 재발급하는 API (비밀번호 검증 없음)
+
+    요청 본문:
+    - refresh_token (str): /token 에서 발급받은 리프레시 토큰
+
+    응답 데이터:
+    - access_token (str): 새 JWT 액세스 토큰
+    - refresh_token (str): 새 리프레시 토큰
+    - token_type (str): 토큰 타입 (bearer)
+
+    리프레시 토큰은 한 번만 사용할 수 있습니다. (응답의 새 리프레시 토큰으로 교체)
+    이미 사용된 토큰이 다시 들어오면 탈취된 것으로 보고 사용자의 모든 토큰을 무효화합니다.
+
+    예외 처리:
+    - 만료되었거나 권한 변경 등으로 무효화된 토큰, 이미 사용된 토큰이면 401 상태 코드를 반환합니다.
+    - Redis 장애로 사용 여부를 확인할 수 없으면 503 상태 코드를 반환합니다.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="유효하지 않은 리프레시 토큰입니다.",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = decode_token(request.refresh_token, REFRESH_TOKEN_TYPE)
+    if payload is None:
+        raise credentials_exception
+
+    user = get_user(db, user_id=int(payload["sub"]))
+    if user is None or not user.is_active or (user.token_version or 0) != payload.get("ver") or not payload.get("jti"):
+        raise credentials_exception
+
+    try:
+        first_use = mark_refresh_token_used(payload["jti"], payload["exp"])
+    except redis.RedisError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="잠시 후 다시 시도해 주세요.")
+    if not first_use:
+        revoke_user_tokens(db, user)
+        raise credentials_exception
+
+    return TokenResponse(
+        access_token=create_access_token(data=user_token_claims(user)),
+        refresh_token=create_refresh_token(user),
+        token_type="bearer",
     )
-    return TokenResponse(access_token=access_token, token_type="bearer")
 
 @router.post("/login", response_model=Token)
 def login_for_access_token(form_data: LoginRequest, db: Session = Depends(get_db)):
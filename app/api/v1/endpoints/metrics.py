@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends
+
+from app.core.security import get_admin_user
+from app.db.redis import ResilientRedis, get_redis_pool_stats
+from app.models.user import User
+from app.crud.quiz import quiz_monitor_hub
+from app.utils.cache import get_cache_stats
+from app.utils.idempotency import idempotency_store
+from app.utils.rate_limit import admission_controller, get_rate_limit_stats
+from app.utils.utils import get_redis
+
+router = APIRouter()
+
+@router.get("/")
+def get_metrics(redis: ResilientRedis = Depends(get_redis), current_user: User = Depends(get_admin_user)):
+    """
+    서버 내부 지표 조회 API
+
+    응답 데이터:
+    - caches: 캐시별 적중/미스 통계
+        - local_hits (int): 프로세스 내부 캐시 적중 수
+        - redis_hits (int): Redis 캐시 적중 수
+        - misses (int): 미스 수
+        - loads (int): DB 적재 수
+        - coalesced (int): single-flight 로 합쳐진 요청 수
+        - hit_ratio (float): 적중률
+    - redis: Redis 커넥션 풀 사용량과 서킷 브레이커 상태
+    - rate_limits: 정책별 허용/제한/Redis 오류 수와 정책
+    - admission: 워커의 진행 중인 요청 수, 최대값, 우선순위별 한도와 받은/거절한 요청 수
+    - idempotency: Idempotency-Key 응답 보관/재사용/대기/키 재사용 오류/대기 시간 초과/Redis 오류 수
+    - monitor: 진행 현황 집계를 Redis 에서 읽은 수와 스트림끼리 공유한 수
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    return {
+        "caches": get_cache_stats(),
+        "redis": get_redis_pool_stats(redis),
+        "rate_limits": get_rate_limit_stats(),
+        "admission": admission_controller.snapshot_stats(),
+        "idempotency": idempotency_store.snapshot_stats(),
+        "monitor": quiz_monitor_hub.snapshot_stats(),
+    }
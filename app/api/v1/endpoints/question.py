@@ -1,19 +1,34 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from app.core.security import get_current_user, get_admin_user
+from app.crud import question as question_crud
+from app.crud import quiz as crud_quiz
 from app.db.session import get_db
 from app.models.question import Question
 from app.models.choice import Choice
 from app.models.user import User
-from app.schemas.question import QuestionCreate, QuestionUpdate, QuestionResponse
+from app.core.config import settings
+from app.schemas.question import QuestionCreate, QuestionUpdate, QuestionResponse, QuestionSearchResponse
 from app.schemas.choice import ChoiceCreate, ChoiceUpdate
+from app.utils.rate_limit import admission
+from app.utils.etag import ANSWER_CACHE_CONTROL, quiz_etag, is_not_modified, not_modified_response, set_cache_headers
 
 router = APIRouter()
 
+def _check_duplicates(db: Session, quiz_id: int, text: str, exclude_question_id: Optional[int] = None) -> dict:
+    """
+    중복 문제가 있으면 409 를 반환하고, 허용되는 유사 중복 목록은 그대로 반환하는 함수
+    """
+    duplicates = question_crud.find_duplicate_questions(db, quiz_id, text, exclude_question_id)
+    if duplicates["exact"] or (duplicates["near"] and settings.DEDUP_REJECT_NEAR):
+        raise HTTPException(status_code=409, detail={"message": "Duplicate question", **duplicates})
+    return duplicates
+
 @router.post("/", response_model=dict)
 def create_question(
         question_data: QuestionCreate, 
+        allow_duplicate: bool = False,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_admin_user)
     ):
@@ -24,21 +39,57 @@ def create_question(
     - id (int): 퀴즈 ID
     - text (Optional[str]): 퀴즈 제목    
 
+    요청 쿼리 파라미터:
+    - allow_duplicate (bool): true 이면 중복 검사를 건너뜀
+
     인증 필요:
     - 관리자 계정만 접근 가능
 
     응답 데이터:
     - id (int): 생성한 퀴즈 ID
     - message (str): Question created successfully
+    - near_duplicates (list): 유사한 기존 문제 [{question_id, similarity}]
+
+    예외:
+    - HTTP 409: 같은 퀴즈에 같은 문제(정규화 후 동일)가 있는 경우 (DEDUP_REJECT_NEAR 이면 유사 중복도 포함)
     """    
-    new_question = Question(
-        text=question_data.text,
-        quiz_id=question_data.quiz_id
-    )
-    db.add(new_question)
-    db.commit()
-    db.refresh(new_question)
-    return {"message": "Question created successfully", "question_id": new_question.id}
+    duplicates = {"near": []}
+    if not allow_duplicate:
+        duplicates = _check_duplicates(db, question_data.quiz_id, question_data.text)
+    new_question = question_crud.create_question(db, question_data)
+    return {
+        "message": "Question created successfully",
+        "question_id": new_question.id,
+        "near_duplicates": duplicates["near"],
+    }
+
+@router.get("/search", response_model=QuestionSearchResponse, dependencies=[Depends(admission("low"))])
+def search_questions(
+        q: str = Query(..., min_length=1),
+        quiz_id: Optional[int] = None,
+        offset: int = Query(0, ge=0),
+        limit: int = Query(20, ge=1),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_admin_user),
+    ):
+    """
+    문제 내용과 선택지 내용에서 문제를 검색하는 API
+
+    - 요청 쿼리 파라미터:
+        - q (str): 검색어 (모든 단어를 포함하는 문제)
+        - quiz_id (Optional[int]): 특정 퀴즈로 한정
+        - offset, limit: 페이지 (limit 은 SEARCH_MAX_PAGE_SIZE 까지)
+
+    - 응답 데이터:
+        - items: [{question_id, quiz_id, text, rank}] (rank 내림차순)
+        - has_more: 다음 페이지 존재 여부
+
+    - 인증 필요:
+        - 관리자 계정만 접근 가능
+    """
+    limit = min(limit, settings.SEARCH_MAX_PAGE_SIZE)
+    items, has_more = question_crud.search_questions(db, q, quiz_id, offset, limit)
+    return {"items": items, "offset": offset, "limit": limit, "has_more": has_more}
 
 @router.get("/{question_id}", response_model=QuestionResponse)
 def get_question(
@@ -63,7 +114,7 @@ def get_question(
     - 인증 필요:
         - 관리자 계정만 접근 가능
     """    
-    question = db.query(Question).filter(Question.id == question_id).first()
+    question = question_crud.read_question(db, question_id)
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
     return question
@@ -71,6 +122,8 @@ def get_question(
 @router.get("/{quiz_id}/questions", response_model=List[QuestionResponse])
 def get_questions_by_quiz(
         quiz_id: int, 
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user),
     ):
@@ -89,10 +142,24 @@ def get_questions_by_quiz(
     - 응답 데이터(2):
         - 빈 리스트: 해당 퀴즈에 등록된 문제가 없는 경우
 
+    - 응답 헤더:
+        - ETag: 퀴즈 컨텐츠 버전 기반 태그 (If-None-Match 일치 시 304 반환)
+        - Cache-Control: 선택지의 정답 여부가 포함되어 private, no-cache 로 설정
+
+    - 예외 처리:
+        - 404 Not Found: 해당 quiz_id의 퀴즈가 존재하지 않을 경우
+
     - 인증 필요:
         - 관리자 또는 사용자 계정만 접근 가능
     """    
-    questions = db.query(Question).filter(Question.quiz_id == quiz_id).all()
+    if crud_quiz.read_quiz(db, quiz_id) is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    etag = quiz_etag("questions", quiz_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, ANSWER_CACHE_CONTROL)
+
+    questions = question_crud.read_questions_by_quiz(db, quiz_id)
+    set_cache_headers(response, etag, ANSWER_CACHE_CONTROL)
     return questions
 
 @router.put("/{question_id}", response_model=dict)
@@ -119,20 +186,16 @@ def update_question(
 
     예외:
     - HTTP 404: 해당 ID의 문제가 존재하지 않을 경우.
+    - HTTP 409: 변경한 문장이 같은 퀴즈의 다른 문제와 중복되는 경우.
 
     인증 필요:
     - 관리자 계정만 접근 가능
     """        
-    question = db.query(Question).filter(Question.id == question_id).first()
+    if question_data.text is not None:
+        quiz_id = db.query(Question.quiz_id).filter(Question.id == question_id).scalar()
+        if quiz_id is not None:
+            _check_duplicates(db, quiz_id, question_data.text, exclude_question_id=question_id)
+    question = question_crud.update_question(db, question_id, question_data)
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
-
-    for key, value in question_data.dict(exclude_unset=True).items():
-        if key == "choices":
-            continue
-
-        setattr(question, key, value)
-
-    db.commit()
-    db.refresh(question)
     return {"message": "Question updated successfully"}
@@ -1,4 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import redis
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from typing import Any, Dict, List, Optional
 
@@ -7,9 +14,15 @@ from app.schemas.choice import ChoiceResponse
 from app.schemas.quiz import *
 from app.schemas.question import QuestionResponse
 from app.crud import quiz as crud_quiz
+from app.core.config import settings
 from app.core.security import get_current_user, get_admin_user
 from app.models.user import User
 from app.models.question import Question
+from app.utils.idempotency import IDEMPOTENCY_HEADER, idempotency_store, request_fingerprint
+from app.utils.inflight import submissions
+from app.utils.monitor import sse_event
+from app.utils.rate_limit import admission, rate_limit
+from app.utils.etag import PUBLIC_CACHE_CONTROL, PRIVATE_CACHE_CONTROL, quiz_etag, is_not_modified, not_modified_response, set_cache_headers
 
 router = APIRouter()
 
@@ -56,6 +69,27 @@ def register_quiz(
         raise HTTPException(status_code=400, detail="Quiz registration failed")
     return registration
 
+@router.delete("/quizzes/{quiz_id}/register")
+def unregister_quiz(
+    quiz_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    사용자 특정 퀴즈 등록 취소 API
+
+    요청 경로 매개변수:
+    - quiz_id (int): 퀴즈 ID
+
+    예외 처리:
+    - 등록하지 않은 퀴즈면 404 오류 반환
+
+    인증 필요:
+    - 사용자 계정 접근 가능
+    """
+    crud_quiz.unregister_user_from_quiz(db, user_id=current_user.id, quiz_id=quiz_id)
+    return {"message": "Quiz registration cancelled successfully"}
+
 @router.post("/quizzes/{quiz_id}/attempt", response_model=QuizAttemptCreate)
 def attempt_quiz(
     quiz_id: int, 
@@ -77,7 +111,7 @@ def attempt_quiz(
         raise HTTPException(status_code=400, detail="Quiz attempt creation failed")
     return attempt
 
-@router.get("/", response_model=Dict[str, Any])
+@router.get("/", response_model=Dict[str, Any], dependencies=[Depends(admission("low"))])
 def get_quizzes(
     db: Session = Depends(get_db),
     page: int = Query(0, alias="page"),
@@ -108,8 +142,48 @@ def get_quizzes(
     return crud_quiz.read_quizzes(db, page=page, page_size=page_size, current_user=current_user)
 
 
+@router.post("/validate", response_model=Dict[str, Any], dependencies=[Depends(admission("low"))])
+def post_validate_quizzes(
+        request: QuizValidateRequest,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_admin_user),
+):
+    """
+    여러 퀴즈 일괄 검증 API
+
+    요청 본문:
+    - quiz_ids (list[int], 선택): 검증할 퀴즈 ID 목록 (생략하면 전체 퀴즈를 검증하고 잘못된 퀴즈만 반환)
+
+    응답 데이터:
+    - checked (int): 검증한 퀴즈 수
+    - invalid_count (int): 잘못 구성된 퀴즈 수
+    - results (dict): 퀴즈 ID 별 검증 결과
+        - valid (bool): 올바른 구성 여부
+        - reason (str): 첫 번째 위반 사유
+        - violations (list): 모든 위반 항목 (type, question_id, reason)
+
+    인증 필요:
+    - 관리자 계정 접근 가능
+    """
+    if request.quiz_ids is None:
+        checked, results = crud_quiz.sweep_invalid_quizzes(db)
+    else:
+        quiz_ids = list(dict.fromkeys(request.quiz_ids))
+        checked, results = len(quiz_ids), crud_quiz.validate_quizzes(db, quiz_ids)
+    return {
+        "checked": checked,
+        "invalid_count": sum(1 for result in results.values() if not result["valid"]),
+        "results": results,
+    }
+
 @router.get("/{quiz_id}", response_model=QuizResponse)
-def get_quiz(quiz_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def get_quiz(
+        quiz_id: int,
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+    ):
     """
     특정 퀴즈 조회 API
 
@@ -123,20 +197,31 @@ def get_quiz(quiz_id: int, db: Session = Depends(get_db), current_user: User = D
         - description (str): 퀴즈 설명
         - is_attempted (bool): 사용자가 응시했는지 여부
 
+    - 응답 헤더:
+        - ETag: 퀴즈 컨텐츠 버전 기반 태그 (If-None-Match 일치 시 304 반환)
+        - Cache-Control
+
     - 예외 처리:
         - 404 Not Found: 해당 quiz_id의 퀴즈가 존재하지 않을 경우
 
     - 인증 필요:
         - 관리자 또는 사용자 계정만 접근 가능
     """
+    # 없는 퀴즈는 If-None-Match 와 관계없이 404 (버전 키도 퀴즈가 있을 때만 만들어짐)
     quiz = crud_quiz.read_quiz(db, quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
+    etag = quiz_etag("quiz", quiz_id)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, PUBLIC_CACHE_CONTROL)
+    set_cache_headers(response, etag, PUBLIC_CACHE_CONTROL)
     return quiz
 
 @router.get("/{quiz_id}/question/choices", response_model=Dict[str, Any])
 def get_choices_questions_by_quiz(
         quiz_id: int, 
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         page: int = Query(0, alias="page"), 
         page_size: int = Query(10, alias="page_size"),
@@ -170,21 +255,23 @@ def get_choices_questions_by_quiz(
             - text (str): 선택지 내용
             - is_correct (bool): 정답 여부
 
+    응답 헤더:
+    - ETag: 퀴즈 컨텐츠 버전과 페이지 정보 기반 태그 (If-None-Match 일치 시 304 반환)
+    - Cache-Control: 정답 정보가 포함되어 private 으로 설정
+
     인증 필요:
     - 관리자 계정만 접근 가능
     """    
-    offset = page * page_size
-    total_count = db.query(Question).filter(Question.quiz_id == quiz_id).count()
-    questions = (
-        db.query(Question)
-        .filter(Question.quiz_id == quiz_id)
-        .options(joinedload(Question.choices))
-        .order_by(Question.id.asc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
+    if crud_quiz.read_quiz(db, quiz_id) is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    etag = quiz_etag("choices", quiz_id, page, page_size)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, PRIVATE_CACHE_CONTROL)
+
+    total_count = crud_quiz.count_questions(db, quiz_id)
+    questions = crud_quiz.read_questions_with_choices_by_quiz(db, quiz_id, offset=page * page_size, limit=page_size)
 
+    set_cache_headers(response, etag, PRIVATE_CACHE_CONTROL)
     return {
         "total_count": total_count,
         "page": page,
@@ -201,9 +288,9 @@ def get_choices_questions_by_quiz(
                         question_id=c.question_id,
                         text=c.text,
                         is_correct=c.is_correct
-                    ) for c in q.choices
+                    ) for c in choices
                 ]
-            ) for q in questions
+            ) for q, choices in questions
         ]
     }
 
@@ -229,28 +316,157 @@ def get_random_quiz_questions(
         raise HTTPException(status_code=404, detail="Quiz not found")
     return result
 
-@router.get("/{quiz_id}/start")
+@router.get("/{quiz_id}/start", dependencies=[Depends(rate_limit("quiz_start")), Depends(admission("normal"))])
 def get_start_quiz(
         quiz_id: int,
-        user_id: int,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user),        
 ):
     """
     사용자 퀴즈 시작 API
 
-    요청 본문:
-    - user_id (int): 사용자 ID
+    요청 경로 파라미터:
     - quiz_id (int): 퀴즈 ID    
+
+    응답 데이터:
+    - user_quiz_attempt_id (int): 응시 ID
+    - quiz_id, title, description, questions
+
+    응시는 인증된 사용자 본인의 것으로 만들고 찾습니다. (등록 확인과 요청 제한도 같은 사용자 기준)
+    진행 중인(마감 전, 미제출) 응시가 있으면 새 응시를 만들지 않고 같은 응시와 문제 순서를 반환합니다.
+    같은 사용자의 첫 시작 요청이 아직 처리 중이면 기다렸다가 그 응시를 반환하고, 끝나지 않으면 409 를 반환합니다.
+    REQUIRE_REGISTRATION 이면 퀴즈에 등록하지 않은 사용자는 403 을 반환합니다. (Redis 비트맵으로 확인)
     
     인증 필요:
     - 사용자 계정 접근 가능
     """        
-    result = crud_quiz.read_random_questions(db, user_id, quiz_id)
+    if settings.REQUIRE_REGISTRATION and not crud_quiz.is_user_registered(db, quiz_id, current_user.id):
+        raise HTTPException(status_code=403, detail="User is not registered for this quiz.")
+    result = crud_quiz.read_random_questions(db, current_user.id, quiz_id)
     if result is None:
         raise HTTPException(status_code=404, detail="Quiz not found")
     return result
 
+@router.get("/attempts/active", response_model=Dict[str, Any])
+def get_active_attempts(
+        user_id: Optional[int] = None,
+        current_user: User = Depends(get_current_user),
+):
+    """
+    진행 중인 응시 목록 조회 API (Redis 응시 등록부 사용, KEYS/SCAN 없음)
+
+    요청 쿼리 파라미터:
+    - user_id (Optional[int]): 조회할 사용자 ID (관리자만 다른 사용자 조회 가능, 기본값은 본인)
+
+    응답 데이터:
+    - attempts: [{quiz_id, user_quiz_attempt_id, deadline_at}] (마감 시각 순)
+
+    인증 필요:
+    - 사용자 계정 접근 가능
+    """
+    if user_id is None:
+        user_id = current_user.id
+    elif user_id != current_user.id and not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    try:
+        attempts = crud_quiz.read_user_active_attempts(user_id)
+    except redis.RedisError:
+        raise HTTPException(status_code=503, detail="응시 등록부를 사용할 수 없습니다.")
+    return {"user_id": user_id, "attempts": attempts}
+
+@router.get("/{quiz_id}/attempts/live", response_model=Dict[str, Any], dependencies=[Depends(admission("low"))])
+def get_live_attempts(
+        quiz_id: int,
+        offset: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_admin_user),
+):
+    """
+    퀴즈의 진행 중인 응시 목록 조회 API (Redis 응시 등록부 사용, KEYS/SCAN 없음)
+
+    응답 데이터:
+    - total (int): 진행 중인 응시 수
+    - attempts: [{user_quiz_attempt_id, user_id, deadline_at}] (마감 시각 순, offset/limit 페이지)
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    try:
+        return crud_quiz.read_quiz_live_attempts(db, quiz_id, offset, limit)
+    except redis.RedisError:
+        raise HTTPException(status_code=503, detail="응시 등록부를 사용할 수 없습니다.")
+
+@router.get("/{quiz_id}/monitor", response_model=Dict[str, Any], dependencies=[Depends(admission("low"))])
+def get_quiz_monitor(quiz_id: int, current_user: User = Depends(get_admin_user)):
+    """
+    퀴즈 진행 현황 조회 API (Redis 카운터, 키 스캔/DB 조회 없음)
+
+    응답 데이터:
+    - in_progress (int): 진행 중인 응시 수
+    - started / answered / answer_writes / submitted (int): 누적 응시 시작 / 답한 문제 / 답안 저장 / 제출(자동 제출 포함) 수
+    - per_minute: minutes (분 목록, 오래된 분부터)와 분당 started / answers / submitted 수
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    try:
+        return crud_quiz.quiz_monitor_hub.get(quiz_id, settings.MONITOR_INTERVAL)
+    except redis.RedisError:
+        raise HTTPException(status_code=503, detail="진행 현황을 사용할 수 없습니다.")
+
+@router.get("/{quiz_id}/monitor/stream", dependencies=[Depends(admission("low"))])
+async def stream_quiz_monitor(quiz_id: int, request: Request, current_user: User = Depends(get_admin_user)):
+    """
+    퀴즈 진행 현황 스트림 API (Server-Sent Events, text/event-stream)
+
+    MONITOR_INTERVAL 초마다 GET /quiz/{quiz_id}/monitor 와 같은 데이터를 stats 이벤트로 보냅니다.
+    대시보드 수와 관계없이 워커는 퀴즈마다 주기당 한 번만 집계를 읽습니다.
+    MONITOR_STREAM_MAX_SECONDS 가 지나면 연결을 닫으며, 브라우저 EventSource 는 자동으로 다시 연결합니다.
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    async def events():
+        deadline = time.monotonic() + settings.MONITOR_STREAM_MAX_SECONDS
+        yield f"retry: {int(settings.MONITOR_INTERVAL * 1000)}\n\n"
+        while time.monotonic() < deadline and not await request.is_disconnected():
+            try:
+                snapshot = await run_in_threadpool(crud_quiz.quiz_monitor_hub.get, quiz_id, settings.MONITOR_INTERVAL)
+                yield sse_event("stats", snapshot)
+            except redis.RedisError:
+                yield sse_event("unavailable", {"detail": "진행 현황을 사용할 수 없습니다."})
+            await asyncio.sleep(settings.MONITOR_INTERVAL)
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.get("/attempts/{user_quiz_attempt_id}/answers", response_model=Dict[str, Any])
+def get_submitted_attempt(
+        user_quiz_attempt_id: int,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_current_user),
+):
+    """
+    제출된 응시의 답안 조회 API (압축 답안지를 응시 화면 형식으로 펼쳐서 반환)
+
+    응답 데이터:
+    - quiz_id, user_quiz_attempt_id, user_id, title, description
+    - content_version (Optional[int]): 응시 시작 시의 퀴즈 컨텐츠 버전
+    - score, total
+    - questions: [{id, text, choices: [{id, text, is_selected}]}] (응시자에게 제공된 순서)
+
+    인증 필요:
+    - 본인 응시 또는 관리자 계정
+    """
+    result = crud_quiz.read_submitted_attempt(db, user_quiz_attempt_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Submitted attempt not found")
+    if result["user_id"] != current_user.id and not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    return result
+
 @router.get("/refresh/{user_quiz_attempt_id}")
 def get_refresh_quiz(
         quiz_id: int,
@@ -268,7 +484,7 @@ def get_refresh_quiz(
     인증 필요:
     - 사용자 계정 접근 가능
     """            
-    result = crud_quiz.read_quiz_attempt_cache(quiz_id, user_quiz_attempt_id)
+    result = crud_quiz.read_quiz_attempt_cache(db, quiz_id, user_quiz_attempt_id)
     if result is None:
         raise HTTPException(status_code=404, detail="UserQuizAttempt not found")
     return result
@@ -287,6 +503,7 @@ def update_quiz_api(quiz_id: int, quiz_update: QuizUpdate, db: Session = Depends
     요청 본문:
     - title (Optional[str]): 퀴즈 제목
     - description (Optional[str]): 퀴즈 설명    
+    - blueprint (Optional[list]): 출제 구성표 (예: [{"tags": ["algebra", "easy"], "count": 5}])
 
     응답 데이터:    
     - title (str): 수정된 퀴즈 제목
@@ -303,12 +520,87 @@ def update_quiz_api(quiz_id: int, quiz_update: QuizUpdate, db: Session = Depends
         raise HTTPException(status_code=404, detail="Quiz not found")
     return quiz
 
-@router.patch("/{quiz_id}/answer", response_model=QuizAnswerResponse)
+@router.get("/{quiz_id}/tags", response_model=dict, dependencies=[Depends(admission("low"))])
+def get_quiz_tags(quiz_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_admin_user)):
+    """
+    퀴즈의 태그별 문제 수 조회 API (출제 구성표 작성용)
+
+    응답 데이터:
+    - quiz_id (int): 퀴즈 ID
+    - total (int): 전체 문제 수
+    - tags (dict): 태그 -> 문제 수
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    index = crud_quiz.read_tag_index(db, quiz_id)
+    return {"quiz_id": quiz_id, "total": index.count([]), "tags": index.tag_counts()}
+
+@router.post("/{quiz_id}/prepare", response_model=Dict[str, Any])
+def post_prepare_quiz(
+        quiz_id: int,
+        starts_at: Optional[datetime] = None,
+        db: Session = Depends(get_db),
+        current_user: User = Depends(get_admin_user),
+):
+    """
+    시험 시작 전 퀴즈 준비 API (퀴즈 정보, 문제 ID 배열, 정답, 등록 사용자를 미리 적재)
+
+    요청 쿼리 파라미터:
+    - starts_at (Optional[datetime]): 시험 시작 시각, 지정하면 시작 QUIZ_PREPARE_LEAD_SECONDS 초 전에 준비하도록 예약합니다.
+      (없거나 준비할 시각이 지났으면 바로 준비)
+
+    응답 데이터:
+    - 바로 준비: GET /quiz/{quiz_id}/prepare 응답과 같으며 elapsed_ms (float) 가 추가됩니다.
+    - 예약: quiz_id (int), prepare_at (datetime)
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    try:
+        if starts_at is not None:
+            prepare_at = starts_at - timedelta(seconds=settings.QUIZ_PREPARE_LEAD_SECONDS)
+            if prepare_at.timestamp() > time.time():
+                if crud_quiz.read_quiz(db, quiz_id) is None:
+                    raise HTTPException(status_code=404, detail="Quiz not found")
+                return {"quiz_id": quiz_id, "prepare_at": crud_quiz.schedule_quiz_preparation(quiz_id, starts_at)}
+        report = crud_quiz.prepare_quiz(db, quiz_id)
+    except redis.RedisError:
+        raise HTTPException(status_code=503, detail="캐시를 사용할 수 없습니다.")
+    if report is None:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return report
+
+@router.get("/{quiz_id}/prepare", response_model=Dict[str, Any])
+def get_quiz_preparation(quiz_id: int, current_user: User = Depends(get_admin_user)):
+    """
+    시험 준비 상태 조회 API
+
+    응답 데이터:
+    - quiz_id (int): 퀴즈 ID
+    - content_version (int): 현재 퀴즈 컨텐츠 버전
+    - ready (bool): 미리 적재한 값이 모두 현재 버전으로 있는지 여부
+    - total_bytes (int): 미리 적재한 값의 Redis 크기 합계
+    - items: quiz / question_ids / answer_key -> {version, bytes, ttl} (없으면 null),
+      registrations -> {count, bytes, ttl}
+
+    인증 필요:
+    - 관리자 계정만 접근 가능
+    """
+    try:
+        return crud_quiz.read_quiz_preparation(quiz_id)
+    except redis.RedisError:
+        raise HTTPException(status_code=503, detail="캐시를 사용할 수 없습니다.")
+
+@router.patch("/{quiz_id}/answer", response_model=QuizAnswerResponse, dependencies=[Depends(rate_limit("quiz_answer")), Depends(admission("critical"))])
 def update_quiz_answer(
     quiz_id: int,
     user_quiz_attempt_id: int,
     request: QuizAnswerRequest,    
+    response: Response,
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
 ):
     """
     사용자 선택지 업데이트 API
@@ -316,22 +608,33 @@ def update_quiz_answer(
     요청 본문:
     - quiz_id (int): 퀴즈 ID    
     - user_quiz_attempt_id (int): 사용자 퀴즈 응시 ID
+
+    요청 헤더:
+    - Idempotency-Key (str, 선택): 같은 키로 재시도하면 저장하지 않고 첫 응답을 반환합니다.
     
     인증 필요:
-    - 사용자 계정 접근 가능
+    - 사용자 계정 접근 가능 (본인 응시만, 다른 사용자의 응시는 403)
+
+    응시에 제공되지 않은 문제/선택지는 400 을 반환합니다.
     """     
-    result = crud_quiz.update_quiz_answer(quiz_id, user_quiz_attempt_id, request)
-    if not result:
-        raise HTTPException(status_code=400, detail="Failed to update answer")    
-    return result
+    def handler():
+        result = crud_quiz.update_quiz_answer(db, quiz_id, current_user.id, user_quiz_attempt_id, request)
+        if not result:
+            raise HTTPException(status_code=400, detail="Failed to update answer")    
+        return result
+
+    fingerprint = request_fingerprint(quiz_id, user_quiz_attempt_id, request)
+    return idempotency_store.run("quiz_answer", current_user.id, idempotency_key, fingerprint, handler, response)
     
-@router.post("/{quiz_id}/submit", response_model=None)
+@router.post("/{quiz_id}/submit", response_model=None, dependencies=[Depends(rate_limit("quiz_submit")), Depends(admission("critical"))])
 def post_submit_quiz(
         quiz_id: int,
         user_quiz_attempt_id: int,
         data: QuizSubmissionRequest,
+        response: Response,
         db: Session = Depends(get_db),
         current_user: User = Depends(get_current_user),
+        idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_HEADER),
 ):
     """
     사용자 시험 제출 API
@@ -339,14 +642,23 @@ def post_submit_quiz(
     요청 본문:
     - quiz_id (int): 퀴즈 ID    
     - user_quiz_attempt_id (int): 사용자 퀴즈 응시 ID
+
+    요청 헤더:
+    - Idempotency-Key (str, 선택): 같은 키로 재시도하면 다시 채점하지 않고 첫 제출 결과를 반환합니다.
+      같은 키 요청이 처리 중이면 끝날 때까지 기다립니다.
     
     인증 필요:
-    - 사용자 계정 접근 가능
+    - 사용자 계정 접근 가능 (본인 응시만, 다른 사용자의 응시는 403)
     """         
-    result = crud_quiz.submit_quiz(db, quiz_id, user_quiz_attempt_id, data)
-    if result is None:
-        raise HTTPException(status_code=400, detail="Quiz submition failed")        
-    return result
+    def handler():
+        with submissions.track():
+            result = crud_quiz.submit_quiz(db, quiz_id, current_user.id, user_quiz_attempt_id, data)
+        if result is None:
+            raise HTTPException(status_code=400, detail="Quiz submition failed")        
+        return result
+
+    fingerprint = request_fingerprint(quiz_id, user_quiz_attempt_id, data)
+    return idempotency_store.run("quiz_submit", current_user.id, idempotency_key, fingerprint, handler, response)
 
 @router.post("/sample")
 def quiz_sample(
@@ -381,6 +693,11 @@ def get_validate_quiz(
 
     요청 본문:
     - quiz_id (int): 퀴즈 ID
+
+    응답 데이터:
+    - valid (bool): 올바른 구성 여부
+    - reason (str): 첫 번째 위반 사유
+    - violations (list): 선택지 2개 미만, 정답 없음, 순번 누락/중복 등 모든 위반 항목
     
     인증 필요:
     - 관리자 계정 접근 가능
@@ -7,6 +7,7 @@ from app.schemas.user import UserCreate, UserRead, UserUpdate
 from app.crud import user as user_crud
 from app.crud import quiz as quiz_crud
 from app.core.security import get_admin_user, get_current_user
+from app.utils.rate_limit import admission
 
 router = APIRouter()
 
@@ -40,7 +41,7 @@ def create_user(user_in: UserCreate, db: Session = Depends(get_db)):
         )
     return user_crud.create_user(db=db, user_in=user_in)
 
-@router.get("/", response_model=List[UserRead])
+@router.get("/", response_model=List[UserRead], dependencies=[Depends(admission("low"))])
 def get_users(
         page: int = Query(0, alias="page"),
         page_size: int = Query(10, alias="page_size"),
@@ -1,5 +1,7 @@
 # app/core/config.py
 
+from typing import Dict, Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -13,9 +15,119 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
+
+    # 워커(프로세스)별 DB 커넥션 풀
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+
+    # ES256/RS256 등 비대칭 알고리즘 사용 시 PEM 키 파일 경로
+    JWT_PRIVATE_KEY_PATH: Optional[str] = None
+    JWT_PUBLIC_KEY_PATH: Optional[str] = None
+    # 검증된 토큰 LRU 크기 (0 이면 사용하지 않음)
+    TOKEN_CACHE_MAXSIZE: int = 4096
+    # Redis 에 캐시한 토큰 버전 유지 시간(초), 버전 반영이 실패해도 이 시간이 지나면 DB 값으로 다시 채웁니다.
+    TOKEN_VERSION_CACHE_TTL: int = 300
+
+    # 퀴즈 컨텐츠 조회 응답의 Cache-Control max-age (초)
+    CONTENT_CACHE_MAX_AGE: int = 0
+
+    # 퀴즈 메타데이터 2단계 캐시 (프로세스 내부 LRU + Redis)
+    CACHE_LOCAL_MAXSIZE: int = 1024
+    CACHE_LOCAL_TTL: float = 30
+    CACHE_REDIS_TTL: int = 600
+    CACHE_LOCK_TIMEOUT_MS: int = 2000
+
+    # Redis 커넥션 풀, 타임아웃(초), 재시도, 서킷 브레이커
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT: float = 0.5
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_CONNECT_TIMEOUT: float = 0.5
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+    REDIS_RETRY_ATTEMPTS: int = 2
+    REDIS_RETRY_BACKOFF_BASE: float = 0.01
+    REDIS_RETRY_BACKOFF_CAP: float = 0.1
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_BREAKER_RESET_TIMEOUT: float = 5
+
+    # 응시 중 답안 write-behind (Redis -> Postgres)
+    WRITE_BEHIND_ENABLED: bool = True
+    WRITE_BEHIND_INTERVAL: float = 5
+    WRITE_BEHIND_BATCH_SIZE: int = 500
+
+    # 제한 시간이 지난 응시 자동 제출
+    AUTO_SUBMIT_ENABLED: bool = True
+    AUTO_SUBMIT_INTERVAL: float = 1
+    AUTO_SUBMIT_BATCH_SIZE: int = 200
+    AUTO_SUBMIT_GRACE_SECONDS: int = 5
+    # 자동 제출에 실패한 응시를 다시 시도하기까지 기다리는 시간(초)
+    AUTO_SUBMIT_RETRY_SECONDS: float = 30
+    # Redis 가 비워져 사라진 마감을 Postgres 에서 다시 예약하는 주기(초)
+    AUTO_SUBMIT_SWEEP_INTERVAL: float = 60
+
+    # 워커 간 프로세스 내부 캐시 무효화 (Redis pub/sub)
+    CACHE_PUBSUB_ENABLED: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+
+    # 문제 검색 (Postgres text search configuration, 페이지 크기 상한)
+    SEARCH_TEXT_CONFIG: str = "simple"
+    SEARCH_MAX_PAGE_SIZE: int = 100
+
+    # 문제 중복 판별 (MinHash 추정 유사도가 이 값 이상이면 유사 중복, 유사 중복도 거부할지 여부)
+    DEDUP_NEAR_THRESHOLD: float = 0.8
+    DEDUP_REJECT_NEAR: bool = False
+
+    # 제출 시 제공된 선택지마다 UserQuizAttemptAnswer 행도 저장할지 여부 (기본은 스냅샷의 압축 답안지만 저장)
+    STORE_ANSWER_ROWS: bool = False
+
+    # 사용자별 요청 제한 (정책 이름: "요청 수/초", Redis 토큰 버킷)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: Dict[str, str] = {
+        "quiz_start": "10/60",
+        "quiz_answer": "300/60",
+        "quiz_submit": "10/60",
+    }
+    # 워커별 동시 처리 요청 수 상한과, 낮은 우선순위(관리자 목록 조회)/보통 우선순위 요청을 받을 비율
+    ADMISSION_MAX_IN_FLIGHT: int = 40
+    ADMISSION_LOW_PRIORITY_RATIO: float = 0.5
+    ADMISSION_NORMAL_PRIORITY_RATIO: float = 0.8
+
+    # 제출/답안 저장의 Idempotency-Key 응답 보관 시간(초)과, 같은 키 요청이 처리 중일 때 기다리는 최대 시간(잠금 만료)
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_TIMEOUT_MS: int = 10000
+
+    # 시험 시작 전 준비 (prepare_quiz): 미리 적재한 값 유지 시간(초), 예약 시 시작 몇 초 전에 준비할지, 예약 확인 주기(초)
+    QUIZ_PREPARE_PIN_SECONDS: int = 14400
+    QUIZ_PREPARE_LEAD_SECONDS: int = 300
+    QUIZ_PREPARE_ENABLED: bool = True
+    QUIZ_PREPARE_INTERVAL: float = 10
+
+    # 퀴즈 등록 사용자 Redis 비트맵 유지 시간(초)과, 등록한 사용자만 /start 를 허용할지 여부
+    REGISTRATION_CACHE_TTL: int = 86400
+    REQUIRE_REGISTRATION: bool = False
+
+    # 퀴즈 진행 현황: 스트림 전송 주기(초), 분당 집계 기간(분), 카운터 유지 시간(초), 스트림 최대 연결 시간(초, 이후 클라이언트가 다시 연결)
+    MONITOR_INTERVAL: float = 2
+    MONITOR_WINDOW_MINUTES: int = 10
+    MONITOR_TTL_SECONDS: int = 86400
+    MONITOR_STREAM_MAX_SECONDS: int = 3600
+
+    # 정답 수정 후 다시 채점 (app.tasks.regrade, 한 번에 채점할 응시 수)
+    REGRADE_BATCH_SIZE: int = 1000
+
+    # 오래된 응시 보관 (app.tasks.archive, 응시 시작 후 며칠이 지나면 보관할지, Postgres 파티션을 몇 개월 앞까지 만들지)
+    ARCHIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 500
+    ATTEMPT_PARTITION_MONTHS_AHEAD: int = 3
+
+    # 종료 시 진행 중인 제출 요청을 기다리는 최대 시간 (초)
+    SHUTDOWN_DRAIN_TIMEOUT: float = 25
 
     class Config:
         env_file = ".env"
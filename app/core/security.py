@@ -1,42 +1,178 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 import pytz
 
-from passlib.context import CryptContext
-
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 from app.core.config import settings
 from app.crud import user as user_crud
 from app.db.session import get_db
+from app.schemas.auth import TokenPrincipal
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 token_auth_scheme = HTTPBearer()
 KST = pytz.timezone('Asia/Seoul')
 
+ACCESS_TOKEN_TYPE = "access"
+REFRESH_TOKEN_TYPE = "refresh"
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    bcrypt CryptContext 를 처음 사용할 때 생성하는 함수
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 def get_password_hash(password: str) -> str:    
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:    
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+def _read_key_file(path: Optional[str], name: str) -> str:
+    if not path:
+        raise RuntimeError(f"{name} 설정이 필요합니다. (ALGORITHM={settings.ALGORITHM})")
+    with open(path) as key_file:
+        return key_file.read()
+
+@lru_cache(maxsize=None)
+def get_signing_key():
+    """
+    토큰 서명 키 객체를 한 번만 생성하여 재사용하는 함수
+
+    HS* 는 SECRET_KEY, ES*/RS* 는 JWT_PRIVATE_KEY_PATH 의 PEM 개인키를 사용합니다.
+    """
+    if settings.ALGORITHM.startswith("HS"):
+        return jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+    return jwk.construct(_read_key_file(settings.JWT_PRIVATE_KEY_PATH, "JWT_PRIVATE_KEY_PATH"), settings.ALGORITHM)
+
+@lru_cache(maxsize=None)
+def get_verification_key():
+    """
+    토큰 검증 키 객체를 한 번만 생성하여 재사용하는 함수
+
+    ES*/RS* 는 JWT_PUBLIC_KEY_PATH 의 PEM 공개키를 사용합니다.
+    """
+    if settings.ALGORITHM.startswith("HS"):
+        return get_signing_key()
+    return jwk.construct(_read_key_file(settings.JWT_PUBLIC_KEY_PATH, "JWT_PUBLIC_KEY_PATH"), settings.ALGORITHM)
+
+class VerifiedTokenCache:
+    """
+    서명 검증이 끝난 토큰의 클레임을 sha256(token) 키로 보관하는 LRU
+
+    같은 bearer 토큰이 반복해서 들어오면 서명 검증을 건너뜁니다.
+    만료(exp)가 지난 항목은 조회 시 제거합니다.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        if self.maxsize <= 0:
+            return None
+        key = self._key(token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            if payload.get("exp", 0) <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, token: str, payload: dict):
+        if self.maxsize <= 0:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+verified_tokens = VerifiedTokenCache(settings.TOKEN_CACHE_MAXSIZE)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(KST) + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    to_encode.setdefault("typ", ACCESS_TOKEN_TYPE)
+    return jwt.encode(to_encode, get_signing_key(), algorithm=settings.ALGORITHM)
 
-def decode_access_token(token: str):
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+def create_refresh_token(user, expires_delta: Optional[timedelta] = None) -> str:
+    """
+    액세스 토큰 재발급용 리프레시 토큰 생성 함수 (sub, ver 만 포함)
+    """
+    expire = datetime.now(KST) + (expires_delta or timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS))
+    to_encode = {
+        "sub": str(user.id),
+        "ver": user.token_version or 0,
+        "typ": REFRESH_TOKEN_TYPE,
+        "jti": uuid.uuid4().hex,
+        "exp": expire,
+    }
+    return jwt.encode(to_encode, get_signing_key(), algorithm=settings.ALGORITHM)
+
+def user_token_claims(user) -> dict:
+    """
+    토큰에 담을 사용자 클레임 (sub, role, active, ver)
+    """
+    return {
+        "sub": str(user.id),
+        "role": "admin" if user.is_superuser else "user",
+        "active": bool(user.is_active),
+        "ver": user.token_version or 0,
+    }
+
+def decode_token(token: str, token_type: str = ACCESS_TOKEN_TYPE) -> Optional[dict]:
+    """
+    토큰을 검증하고 클레임을 반환하는 함수 (유효하지 않거나 종류가 다르면 None)
+
+    typ 클레임이 없는 토큰은 액세스 토큰으로 취급합니다.
+    """
+    payload = verified_tokens.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, get_verification_key(), algorithms=[settings.ALGORITHM])
+        except JWTError:
+            return None
+        verified_tokens.set(token, payload)
+    if payload.get("typ", ACCESS_TOKEN_TYPE) != token_type:
         return None
+    return payload
 
-def get_current_user(db: Session = Depends(get_db), credentials: HTTPAuthorizationCredentials = Depends(token_auth_scheme)):
+def decode_access_token(token: str):
+    return decode_token(token)
+
+def get_current_user(db: Session = Depends(get_db), credentials: HTTPAuthorizationCredentials = Depends(token_auth_scheme)) -> TokenPrincipal:
+    """
+    토큰 클레임으로 현재 사용자를 확인하는 함수
+
+    사용자 행을 조회하지 않고, 토큰 버전(ver)만 Redis 에서 한 번 비교합니다.
+    권한 변경/비활성화/삭제로 버전이 바뀐 토큰은 즉시 거부됩니다.
+    """
     token = credentials.credentials  
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,25 +180,40 @@ def get_current_user(db: Session = Depends(get_db), credentials: HTTPAuthorizati
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    payload = decode_token(token)
+    if payload is None:
+        raise credentials_exception
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
+        user_id = payload.get("sub")
+        token_version = payload.get("ver")
+        if user_id is None or token_version is None:
             raise credentials_exception
-    except JWTError:
+        principal = TokenPrincipal(
+            id=int(user_id),
+            is_superuser=payload.get("role") == "admin",
+            is_active=bool(payload.get("active")),
+            token_version=token_version,
+        )
+    except ValueError:
         raise credentials_exception
 
-    user = user_crud.get_user(db, user_id=user_id)
-    if user is None:
+    if user_crud.get_token_version(db, principal.id) != principal.token_version:
         raise credentials_exception
 
-    return user
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="비활성화된 사용자입니다."
+        )
 
-def get_admin_user(db: Session = Depends(get_db), credentials: HTTPAuthorizationCredentials = Depends(token_auth_scheme)):
+    return principal
+
+def get_admin_user(db: Session = Depends(get_db), credentials: HTTPAuthorizationCredentials = Depends(token_auth_scheme)) -> TokenPrincipal:
     user = get_current_user(db, credentials)
     if not user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다."
         )
-    return user
\ No newline at end of file
+    return user
@@ -1,17 +1,69 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.choice import Choice
+from app.models.question import Question
 from app.schemas import choice as schemas
+from app.utils.cache import TwoTierCache
+from app.utils.content_version import get_quiz_version
+
+choice_cache = TwoTierCache("choice")
+# 선택지의 문제(퀴즈)는 바뀌지 않으므로 버전 없이 캐시합니다. (choice_cache 버전 확인용)
+choice_quiz_cache = TwoTierCache("choice_quiz")
+
+def choice_to_dict(choice: Choice) -> dict:
+    return {
+        "id": choice.id,
+        "question_id": choice.question_id,
+        "text": choice.text,
+        "is_correct": choice.is_correct,
+        "order": choice.order,
+    }
+
+def _invalidate_choice(db: Session, choice_id: int, question_id: int):
+    from app.crud.question import invalidate_question
+
+    choice_cache.invalidate(choice_id)
+    quiz_id = db.query(Question.quiz_id).filter(Question.id == question_id).scalar()
+    if quiz_id is not None:
+        invalidate_question(question_id, quiz_id)
+
+def _mark_quiz_for_regrade(db: Session, question_id: int):
+    from app.crud.quiz import mark_quiz_for_regrade
+
+    quiz_id = db.query(Question.quiz_id).filter(Question.id == question_id).scalar()
+    if quiz_id is not None:
+        mark_quiz_for_regrade(quiz_id)
+
+def _sync_search_document(db: Session, question_id: int):
+    from app.crud.question import sync_search_documents
+
+    sync_search_documents(db, [question_id])
 
 def create_choice(db: Session, choice: schemas.ChoiceCreate):
     db_choice = Choice(**choice.dict())
     db.add(db_choice)
+    _sync_search_document(db, db_choice.question_id)
     db.commit()
     db.refresh(db_choice)
+    _invalidate_choice(db, db_choice.id, db_choice.question_id)
     return db_choice
 
 def get_choice(db: Session, choice_id: int):
-    return db.query(Choice).filter(Choice.id == choice_id).first()
+    """
+    선택지를 캐시에서 조회하는 함수 (퀴즈 컨텐츠 버전이 바뀌면 다시 적재)
+    """
+    quiz_id = choice_quiz_cache.get_or_load(
+        choice_id,
+        lambda: db.query(Question.quiz_id).join(Choice, Choice.question_id == Question.id).filter(Choice.id == choice_id).scalar(),
+    )
+    if quiz_id is None:
+        return None
+
+    def load():
+        choice = db.query(Choice).filter(Choice.id == choice_id).first()
+        return choice_to_dict(choice) if choice else None
+
+    return choice_cache.get_or_load(choice_id, load, version=get_quiz_version(quiz_id))
 
 def get_choices_by_question(db: Session, question_id: int):
     return db.query(Choice).filter(Choice.question_id == question_id).all()
@@ -19,15 +71,29 @@ def get_choices_by_question(db: Session, question_id: int):
 def update_choice(db: Session, choice_id: int, choice: schemas.ChoiceUpdate):
     db_choice = db.query(Choice).filter(Choice.id == choice_id).first()
     if db_choice:
-        for key, value in choice.dict(exclude_unset=True).items():
+        data = choice.dict(exclude_unset=True)
+        # 정답 여부가 바뀌면 이미 제출된 응시의 점수를 다시 계산해야 합니다.
+        answer_key_changed = "is_correct" in data and data["is_correct"] != db_choice.is_correct
+        for key, value in data.items():
             setattr(db_choice, key, value)
+        _sync_search_document(db, db_choice.question_id)
         db.commit()
         db.refresh(db_choice)
+        _invalidate_choice(db, choice_id, db_choice.question_id)
+        if answer_key_changed:
+            _mark_quiz_for_regrade(db, db_choice.question_id)
     return db_choice
 
 def delete_choice(db: Session, choice_id: int):
     db_choice = db.query(Choice).filter(Choice.id == choice_id).first()
     if db_choice:
+        question_id = db_choice.question_id
+        was_correct = db_choice.is_correct
         db.delete(db_choice)
+        _sync_search_document(db, question_id)
         db.commit()
+        choice_quiz_cache.invalidate(choice_id)
+        _invalidate_choice(db, choice_id, question_id)
+        if was_correct:
+            _mark_quiz_for_regrade(db, question_id)
     return db_choice
@@ -1,35 +1,350 @@
-from sqlalchemy.orm import Session
+import re
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import and_, func, literal, or_, select, text
+from sqlalchemy.orm import Session, joinedload, selectinload
+from app.core.config import settings
 from app.models.choice import Choice
-from app.models.question import Question
+from app.models.question import (
+    Question, QuestionLshBucket, QuestionSearchDocument, QuestionSignature, QuestionTag, SQLITE_FTS_TABLE, search_vector,
+)
 from app.schemas.question import QuestionCreate, QuestionUpdate
 from app.schemas.choice import ChoiceCreate, ChoiceUpdate
+from app.crud.choice import choice_to_dict
+from app.utils.cache import TwoTierCache
+from app.utils.content_version import bump_quiz_version, get_quiz_version
+from app.utils.dedup import lsh_buckets, minhash, pack_signature, similarity, text_hash, unpack_signature
+from app.utils.tag_index import QuizTagIndex, normalize_tags, tag_indexes
+
+question_cache = TwoTierCache("question")
+# 문제의 퀴즈 ID 는 바뀌지 않으므로 버전 없이 캐시합니다. (question_cache 버전 확인용)
+question_quiz_cache = TwoTierCache("question_quiz")
+questions_by_quiz_cache = TwoTierCache("questions_by_quiz")
+
+def question_to_dict(question: Question) -> dict:
+    return {
+        "id": question.id,
+        "quiz_id": question.quiz_id,
+        "text": question.text,
+        "order": question.order,
+        "category": question.category,
+        "difficulty": question.difficulty,
+        "tags": question.tags,
+        "choices": [choice_to_dict(choice) for choice in sorted(question.choices, key=lambda c: (c.order, c.id))],
+    }
+
+def invalidate_question(question_id: int, quiz_id: int) -> Optional[int]:
+    question_cache.invalidate(question_id)
+    questions_by_quiz_cache.invalidate(quiz_id)
+    return bump_quiz_version(quiz_id)
+
+def set_question_tags(db_question: Question, tags: List[str]):
+    """
+    문제의 태그를 tags 로 맞추는 함수 (유지되는 태그의 행은 그대로 둡니다)
+    """
+    tags = normalize_tags(tags)
+    db_question.tag_links = [link for link in db_question.tag_links if link.tag in tags]
+    existing = {link.tag for link in db_question.tag_links}
+    db_question.tag_links.extend(QuestionTag(tag=tag) for tag in tags if tag not in existing)
+
+def read_question_tag_pairs(db: Session, quiz_id: int) -> List[Tuple[int, Optional[str]]]:
+    """
+    퀴즈의 (문제 ID, 태그) 목록을 한 번의 쿼리로 조회하는 함수 (태그가 없는 문제는 태그가 None)
+    """
+    return (
+        db.query(Question.id, QuestionTag.tag)
+        .outerjoin(QuestionTag, QuestionTag.question_id == Question.id)
+        .filter(Question.quiz_id == quiz_id)
+        .all()
+    )
+
+def read_tag_index(db: Session, quiz_id: int) -> QuizTagIndex:
+    """
+    퀴즈의 태그 역색인을 조회하는 함수 (퀴즈 컨텐츠 버전이 바뀌었으면 다시 적재)
+    """
+    return tag_indexes.get(quiz_id, get_quiz_version(quiz_id), lambda: read_question_tag_pairs(db, quiz_id))
+
+def sync_search_documents(db: Session, question_ids: Iterable[int]):
+    """
+    문제 검색 문서(문제 내용 + 선택지 내용)를 현재 상태로 다시 만드는 함수
+
+    커밋하지 않으므로 문제/선택지 변경과 같은 트랜잭션에서 호출합니다.
+    """
+    question_ids = list(question_ids)
+    if not question_ids:
+        return
+    db.flush()
+    choices = {}
+    for question_id, choice_text in (
+        db.query(Choice.question_id, Choice.text)
+        .filter(Choice.question_id.in_(question_ids))
+        .order_by(Choice.question_id, Choice.order, Choice.id)
+    ):
+        choices.setdefault(question_id, []).append(choice_text)
+
+    db.query(QuestionSearchDocument).filter(QuestionSearchDocument.question_id.in_(question_ids)).delete(
+        synchronize_session=False
+    )
+    db.add_all(
+        QuestionSearchDocument(
+            question_id=question_id,
+            quiz_id=quiz_id,
+            document="\n".join([question_text, *choices.get(question_id, [])]),
+        )
+        for question_id, quiz_id, question_text in db.query(Question.id, Question.quiz_id, Question.text)
+        .filter(Question.id.in_(question_ids))
+    )
+    db.flush()
+
+def sync_question_signatures(db: Session, question_ids: Iterable[int]):
+    """
+    문제의 중복 판별용 서명(sha256, MinHash, LSH 버킷)을 현재 문장으로 다시 만드는 함수 (커밋하지 않음)
+    """
+    question_ids = list(question_ids)
+    if not question_ids:
+        return
+    db.flush()
+    db.query(QuestionLshBucket).filter(QuestionLshBucket.question_id.in_(question_ids)).delete(synchronize_session=False)
+    db.query(QuestionSignature).filter(QuestionSignature.question_id.in_(question_ids)).delete(synchronize_session=False)
+    for question_id, quiz_id, question_text in (
+        db.query(Question.id, Question.quiz_id, Question.text).filter(Question.id.in_(question_ids))
+    ):
+        signature = minhash(question_text)
+        db.add(QuestionSignature(
+            question_id=question_id,
+            quiz_id=quiz_id,
+            text_hash=text_hash(question_text),
+            minhash=pack_signature(signature),
+        ))
+        db.add_all(
+            QuestionLshBucket(question_id=question_id, quiz_id=quiz_id, band=band, bucket=bucket)
+            for band, bucket in lsh_buckets(signature)
+        )
+    db.flush()
+
+def find_duplicate_questions(db: Session, quiz_id: int, question_text: str, exclude_question_id: Optional[int] = None) -> dict:
+    """
+    같은 퀴즈에서 question_text 와 중복되는 문제를 찾는 함수
+
+    - exact: 정규화한 문장이 같은 문제 ID 목록 (text_hash 인덱스 조회)
+    - near: LSH 버킷이 하나라도 같은 후보 중 MinHash 유사도가 DEDUP_NEAR_THRESHOLD 이상인 문제
+    전체 문제와 비교하지 않고 인덱스로 찾은 후보만 비교합니다.
+    """
+    exact = [
+        question_id for (question_id,) in db.query(QuestionSignature.question_id)
+        .filter(QuestionSignature.quiz_id == quiz_id, QuestionSignature.text_hash == text_hash(question_text))
+        .order_by(QuestionSignature.question_id)
+        if question_id != exclude_question_id
+    ]
+
+    signature = minhash(question_text)
+    candidates = [
+        question_id for (question_id,) in db.query(QuestionLshBucket.question_id)
+        .filter(
+            QuestionLshBucket.quiz_id == quiz_id,
+            or_(*(and_(QuestionLshBucket.band == band, QuestionLshBucket.bucket == bucket) for band, bucket in lsh_buckets(signature))),
+        )
+        .distinct()
+        if question_id != exclude_question_id and question_id not in exact
+    ]
+    near = []
+    if candidates:
+        for question_id, stored in db.query(QuestionSignature.question_id, QuestionSignature.minhash).filter(
+            QuestionSignature.question_id.in_(candidates)
+        ):
+            score = similarity(signature, unpack_signature(stored))
+            if score >= settings.DEDUP_NEAR_THRESHOLD:
+                near.append({"question_id": question_id, "similarity": round(score, 4)})
+        near.sort(key=lambda item: (-item["similarity"], item["question_id"]))
+    return {"exact": exact, "near": near}
+
+def scan_duplicate_questions(db: Session, quiz_id: int) -> List[dict]:
+    """
+    퀴즈 한 개의 중복 문제 묶음을 찾는 함수 (서명이 없는 문제는 먼저 만들어 커밋합니다)
+
+    - {"kind": "exact", "question_ids": [...]}: 정규화한 문장이 같은 문제들
+    - {"kind": "near", "question_ids": [a, b], "similarity": 0.9}: LSH 버킷이 같고 유사도가 기준 이상인 쌍
+    """
+    missing = [
+        question_id for (question_id,) in db.query(Question.id)
+        .outerjoin(QuestionSignature, QuestionSignature.question_id == Question.id)
+        .filter(Question.quiz_id == quiz_id, QuestionSignature.question_id.is_(None))
+    ]
+    if missing:
+        sync_question_signatures(db, missing)
+        db.commit()
+
+    signatures = {}
+    by_hash = {}
+    for question_id, hash_value, stored in db.query(
+        QuestionSignature.question_id, QuestionSignature.text_hash, QuestionSignature.minhash
+    ).filter(QuestionSignature.quiz_id == quiz_id):
+        signatures[question_id] = unpack_signature(stored)
+        by_hash.setdefault(hash_value, []).append(question_id)
+    groups = [
+        {"kind": "exact", "question_ids": sorted(question_ids)}
+        for question_ids in by_hash.values() if len(question_ids) > 1
+    ]
+
+    hashes = {question_id: hash_value for hash_value, question_ids in by_hash.items() for question_id in question_ids}
+    buckets = {}
+    for question_id, band, bucket in db.query(
+        QuestionLshBucket.question_id, QuestionLshBucket.band, QuestionLshBucket.bucket
+    ).filter(QuestionLshBucket.quiz_id == quiz_id):
+        buckets.setdefault((band, bucket), []).append(question_id)
+    pairs = set()
+    for question_ids in buckets.values():
+        question_ids.sort()
+        for i, left in enumerate(question_ids):
+            for right in question_ids[i + 1:]:
+                if hashes.get(left) != hashes.get(right):
+                    pairs.add((left, right))
+    for left, right in sorted(pairs):
+        score = similarity(signatures[left], signatures[right])
+        if score >= settings.DEDUP_NEAR_THRESHOLD:
+            groups.append({"kind": "near", "question_ids": [left, right], "similarity": round(score, 4)})
+    return groups
+
+def _fts5_query(query: str) -> str:
+    # 사용자 입력을 FTS5 문법으로 해석하지 않도록 단어마다 따옴표로 감쌉니다. (모든 단어 AND)
+    return " ".join(f'"{term}"' for term in re.findall(r"\w+", query))
+
+def search_questions(db: Session, query: str, quiz_id: Optional[int] = None, offset: int = 0, limit: int = 20) -> Tuple[List[dict], bool]:
+    """
+    문제 내용과 선택지 내용에서 검색어를 모두 포함하는 문제를 관련도 순으로 조회하는 함수
+
+    - Postgres: to_tsvector GIN 인덱스 + ts_rank
+    - SQLite: FTS5 + bm25
+    (결과 목록, 다음 페이지 존재 여부) 를 반환합니다.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        match = _fts5_query(query)
+        if not match:
+            return [], False
+        # FTS5 의 rank 컬럼(bm25, 작을수록 관련도 높음)으로 FTS 테이블 안에서 먼저 정렬/페이지를 자르고 조인합니다.
+        if quiz_id is None:
+            statement = text(
+                "SELECT d.question_id, d.quiz_id, q.text, -m.rank "
+                f"FROM (SELECT rowid, rank FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH :match "
+                "ORDER BY rank, rowid LIMIT :limit OFFSET :offset) m "
+                "JOIN question_search_documents d ON d.question_id = m.rowid "
+                "JOIN questions q ON q.id = d.question_id "
+                "ORDER BY m.rank, m.rowid"
+            )
+        else:
+            statement = text(
+                f"SELECT d.question_id, d.quiz_id, q.text, -{SQLITE_FTS_TABLE}.rank "
+                f"FROM {SQLITE_FTS_TABLE} "
+                f"JOIN question_search_documents d ON d.question_id = {SQLITE_FTS_TABLE}.rowid "
+                "JOIN questions q ON q.id = d.question_id "
+                f"WHERE {SQLITE_FTS_TABLE} MATCH :match AND d.quiz_id = :quiz_id "
+                f"ORDER BY {SQLITE_FTS_TABLE}.rank, d.question_id LIMIT :limit OFFSET :offset"
+            )
+        rows = db.execute(statement, {"match": match, "quiz_id": quiz_id, "limit": limit + 1, "offset": offset}).all()
+    else:
+        document = QuestionSearchDocument.document
+        statement = select(QuestionSearchDocument.question_id, QuestionSearchDocument.quiz_id, Question.text)
+        if dialect == "postgresql":
+            tsquery = func.websearch_to_tsquery(settings.SEARCH_TEXT_CONFIG, query)
+            rank = func.ts_rank(search_vector(document), tsquery).label("rank")
+            statement = statement.add_columns(rank).where(search_vector(document).op("@@")(tsquery))
+        else:
+            rank = None
+            statement = statement.add_columns(literal(0.0).label("rank"))
+            for term in query.split():
+                statement = statement.where(document.ilike(f"%{term}%"))
+        statement = statement.join(Question, Question.id == QuestionSearchDocument.question_id)
+        if quiz_id is not None:
+            statement = statement.where(QuestionSearchDocument.quiz_id == quiz_id)
+        order = [QuestionSearchDocument.question_id] if rank is None else [rank.desc(), QuestionSearchDocument.question_id]
+        rows = db.execute(statement.order_by(*order).offset(offset).limit(limit + 1)).all()
+
+    results = [
+        {"question_id": question_id, "quiz_id": row_quiz_id, "text": question_text, "rank": round(float(rank_value), 6)}
+        for question_id, row_quiz_id, question_text, rank_value in rows[:limit]
+    ]
+    return results, len(rows) > limit
 
 def create_question(db: Session, question_data: QuestionCreate):
-    db_question = Question(**question_data.dict())
+    db_question = Question(**question_data.dict(exclude={"tags"}))
+    set_question_tags(db_question, question_data.tags)
     db.add(db_question)
+    db.flush()
+    sync_search_documents(db, [db_question.id])
+    sync_question_signatures(db, [db_question.id])
     db.commit()
     db.refresh(db_question)
+    version = invalidate_question(db_question.id, db_question.quiz_id)
+    tag_indexes.apply_question(db_question.quiz_id, version, db_question.id, db_question.tags)
     return db_question
 
+def read_question_quiz_id(db: Session, question_id: int) -> Optional[int]:
+    """
+    문제가 속한 퀴즈 ID 를 캐시에서 조회하는 함수 (문제가 없으면 None)
+    """
+    return question_quiz_cache.get_or_load(
+        question_id, lambda: db.query(Question.quiz_id).filter(Question.id == question_id).scalar()
+    )
+
 def read_question(db: Session, question_id: int):
-    return db.query(Question).filter(Question.id == question_id).first()
+    """
+    문제(선택지 포함)를 캐시에서 조회하는 함수 (퀴즈 컨텐츠 버전이 바뀌면 다시 적재)
+    """
+    quiz_id = read_question_quiz_id(db, question_id)
+    if quiz_id is None:
+        return None
+
+    def load():
+        question = (
+            db.query(Question)
+            .options(joinedload(Question.choices), selectinload(Question.tag_links))
+            .filter(Question.id == question_id)
+            .first()
+        )
+        return question_to_dict(question) if question else None
+
+    return question_cache.get_or_load(question_id, load, version=get_quiz_version(quiz_id))
 
 def read_questions_by_quiz(db: Session, quiz_id: int):
-    return db.query(Question).filter(Question.quiz_id == quiz_id).all()
+    """
+    퀴즈에 속한 문제 목록(선택지 포함)을 캐시에서 조회하는 함수 (퀴즈 컨텐츠 버전이 바뀌면 다시 적재)
+    """
+    def load():
+        questions = (
+            db.query(Question)
+            .options(joinedload(Question.choices), selectinload(Question.tag_links))
+            .filter(Question.quiz_id == quiz_id)
+            .all()
+        )
+        return [question_to_dict(question) for question in questions]
+
+    return questions_by_quiz_cache.get_or_load(quiz_id, load, version=get_quiz_version(quiz_id))
 
 def update_question(db: Session, question_id: int, question_data: QuestionUpdate):
     db_question = db.query(Question).filter(Question.id == question_id).first()
     if db_question:
-        for key, value in question_data.dict(exclude_unset=True).items():
+        update_data = question_data.dict(exclude_unset=True)
+        if "tags" in update_data:
+            set_question_tags(db_question, update_data.pop("tags"))
+        for key, value in update_data.items():
             setattr(db_question, key, value)
+        sync_search_documents(db, [question_id])
+        if "text" in update_data:
+            sync_question_signatures(db, [question_id])
         db.commit()
         db.refresh(db_question)
+        version = invalidate_question(question_id, db_question.quiz_id)
+        tag_indexes.apply_question(db_question.quiz_id, version, question_id, db_question.tags)
     return db_question
 
 def delete_question(db: Session, question_id: int):
     db_question = db.query(Question).filter(Question.id == question_id).first()
     if db_question:
+        quiz_id = db_question.quiz_id
         db.query(Choice).filter(Choice.question_id == question_id).delete()
         db.delete(db_question)
         db.commit()
+        question_quiz_cache.invalidate(question_id)
+        version = invalidate_question(question_id, quiz_id)
+        tag_indexes.apply_question(quiz_id, version, question_id, None)
     return db_question
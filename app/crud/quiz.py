@@ -1,21 +1,251 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import httpx
 import json
+import logging
 import random
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
+import redis
 from fastapi import HTTPException, Query
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import joinedload, Session
 
 from app.utils.utils import transform_to_quiz_submit
 from app.utils.utils import redis_client, settings
+from app.utils.content_version import bump_quiz_version, get_quiz_version
+from app.utils.answer_sheet import encode_answer_sheet, expand_answer_sheet, layout_from_arrays, layout_from_questions
+from app.utils.cache import TwoTierCache
+from app.utils.monitor import MonitorHub
 from app.models.user import User
 from app.models.quiz import Quiz
 from app.models.choice import Choice
-from app.models.user import UserQuizAttempt, UserQuizAttemptQuestion, UserQuizAttemptAnswer, UserQuizRegistration, UserQuizScore
+from app.models.user import UserQuizAttempt, UserQuizAttemptArchive, UserQuizAttemptQuestion, UserQuizAttemptAnswer, UserQuizAttemptProgress, UserQuizAttemptSnapshot, UserQuizRegistration, UserQuizScore
 from app.models.question import Question
+from app.crud.question import read_tag_index, sync_question_signatures, sync_search_documents
 from app.schemas.quiz import *
 
+logger = logging.getLogger(__name__)
+
+quiz_cache = TwoTierCache("quiz")
+question_ids_cache = TwoTierCache("question_ids")
+# 채점용 정답 선택지 ID
+answer_key_cache = TwoTierCache("answer_key")
+# 응시별 스냅샷 순서 ([[문제 ID, [선택지 ID, ...]], ...], 응시 중에 바뀌지 않음)
+attempt_layout_cache = TwoTierCache("attempt_layout")
+
+# 답안이 변경되어 Postgres 로 옮겨야 하는 응시 목록 ("{quiz_id}:{user_quiz_attempt_id}")
+ANSWERS_DIRTY_KEY = "quiz:user_quiz_attempts:dirty"
+
+def attempt_cache_key(quiz_id: int, user_quiz_attempt_id: int) -> str:
+    return f"quiz:{quiz_id}:user_quiz_attempts:{user_quiz_attempt_id}"
+
+def attempt_answers_key(quiz_id: int, user_quiz_attempt_id: int) -> str:
+    return f"{attempt_cache_key(quiz_id, user_quiz_attempt_id)}:answers"
+
+# 제한 시간이 있는 응시의 마감 시각 (sorted set, score=마감 unix time, member="{quiz_id}:{user_quiz_attempt_id}")
+ATTEMPT_DEADLINES_KEY = "quiz:user_quiz_attempts:deadlines"
+
+# 정답이 바뀌어 다시 채점해야 하는 퀴즈 ID (python -m app.tasks.regrade --pending 이 처리)
+REGRADE_PENDING_KEY = "quiz:regrade:pending"
+
+def mark_quiz_for_regrade(quiz_id: int):
+    try:
+        redis_client.sadd(REGRADE_PENDING_KEY, quiz_id)
+    except redis.RedisError:
+        logger.error("Failed to mark quiz %s for regrading", quiz_id)
+
+# 시험 시작 전 준비(prepare_quiz)를 예약한 퀴즈 (score: 준비할 시각)
+QUIZ_PREPARE_SCHEDULE_KEY = "quiz:prepare:schedule"
+
+def quiz_registrations_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:registrations"
+
+def quiz_registrations_version_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:registrations:version"
+
+REGISTRATIONS_LOADED_BIT = 0
+
+def schedule_attempt_deadline(quiz_id: int, user_quiz_attempt_id: int, deadline_at: datetime):
+    redis_client.zadd(ATTEMPT_DEADLINES_KEY, {f"{quiz_id}:{user_quiz_attempt_id}": deadline_at.timestamp()})
+
+def cancel_attempt_deadline(quiz_id: int, user_quiz_attempt_id: int):
+    redis_client.zrem(ATTEMPT_DEADLINES_KEY, f"{quiz_id}:{user_quiz_attempt_id}")
+
+# 진행 중인 응시 등록부 (sorted set, score=마감 unix time, 제한 시간이 없으면 +inf)
+# - quiz:{quiz_id}:active_attempts  member="{user_quiz_attempt_id}"
+# - user:{user_id}:active_attempts  member="{quiz_id}:{user_quiz_attempt_id}"
+def quiz_active_attempts_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:active_attempts"
+
+def user_active_attempts_key(user_id: int) -> str:
+    return f"user:{user_id}:active_attempts"
+
+def _deadline_score(deadline_at: Optional[datetime]) -> float:
+    return deadline_at.timestamp() if deadline_at else float("inf")
+
+def _score_to_deadline(score: float) -> Optional[str]:
+    return None if score == float("inf") else datetime.fromtimestamp(score).isoformat()
+
+def quiz_monitor_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:monitor"
+
+def quiz_monitor_minutes_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:monitor:minutes"
+
+# 분당 집계하는 진행 현황 항목
+MONITOR_RATE_KINDS = ("started", "answers", "submitted")
+
+def count_quiz_event(quiz_id: int, *counters: str, per_minute: Optional[str] = None):
+    """
+    퀴즈 진행 현황 카운터(Redis 해시)를 올리는 함수 (파이프라인 한 번, O(1))
+
+    per_minute 를 넘기면 현재 분의 "{항목}:{분}" 카운터도 올립니다. Redis 장애 시에는 집계하지 않습니다.
+    """
+    now_minute = int(time.time() // 60)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        key = quiz_monitor_key(quiz_id)
+        for counter in counters:
+            pipe.hincrby(key, counter, 1)
+        pipe.expire(key, settings.MONITOR_TTL_SECONDS)
+        if per_minute:
+            minutes_key = quiz_monitor_minutes_key(quiz_id)
+            pipe.hincrby(minutes_key, f"{per_minute}:{now_minute}", 1)
+            pipe.expire(minutes_key, settings.MONITOR_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError:
+        logger.warning("Redis unavailable, monitor counters of quiz %s are not updated", quiz_id)
+
+def read_quiz_monitor(quiz_id: int, window_minutes: Optional[int] = None) -> dict:
+    """
+    퀴즈 진행 현황을 한 번의 파이프라인으로 읽는 함수 (키 스캔/DB 조회 없음)
+
+    - in_progress: 진행 중인 응시 수 (응시 등록부 ZCARD)
+    - started / answered / answer_writes / submitted: 누적 응시 시작 / 답한 문제 / 답안 저장 / 제출(자동 제출 포함) 수
+    - per_minute: 최근 window_minutes 분의 분당 응시 시작/답안 저장/제출 수 (오래된 분부터)
+    """
+    window = window_minutes or settings.MONITOR_WINDOW_MINUTES
+    now_minute = int(time.time() // 60)
+    minutes = list(range(now_minute - window + 1, now_minute + 1))
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hgetall(quiz_monitor_key(quiz_id))
+    pipe.zcard(quiz_active_attempts_key(quiz_id))
+    pipe.hmget(quiz_monitor_minutes_key(quiz_id), [f"{kind}:{minute}" for kind in MONITOR_RATE_KINDS for minute in minutes])
+    counters, in_progress, rates = pipe.execute()
+    per_minute = {"minutes": [datetime.fromtimestamp(minute * 60).isoformat(timespec="minutes") for minute in minutes]}
+    for index, kind in enumerate(MONITOR_RATE_KINDS):
+        per_minute[kind] = [int(value or 0) for value in rates[index * window:(index + 1) * window]]
+    return {
+        "quiz_id": quiz_id,
+        "at": datetime.now().isoformat(timespec="seconds"),
+        "in_progress": in_progress,
+        **{name: int(counters.get(name, 0)) for name in ("started", "answered", "answer_writes", "submitted")},
+        "per_minute": per_minute,
+    }
+
+quiz_monitor_hub = MonitorHub(read_quiz_monitor)
+
+def register_active_attempt(quiz_id: int, user_id: int, user_quiz_attempt_id: int, deadline_at: Optional[datetime] = None):
+    """
+    진행 중인 응시를 등록부에 넣고, 제한 시간이 있으면 자동 제출 마감도 예약하는 함수
+
+    Redis 가 비워진 뒤 Postgres 로 다시 등록할 때도 마감이 함께 복구됩니다.
+    (이미 예약된 마감은 자동 제출 재시도 시각일 수 있으므로 덮어쓰지 않습니다.)
+    """
+    score = _deadline_score(deadline_at)
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.zadd(quiz_active_attempts_key(quiz_id), {str(user_quiz_attempt_id): score})
+    pipe.zadd(user_active_attempts_key(user_id), {f"{quiz_id}:{user_quiz_attempt_id}": score})
+    if deadline_at:
+        pipe.zadd(ATTEMPT_DEADLINES_KEY, {f"{quiz_id}:{user_quiz_attempt_id}": score}, nx=True)
+    pipe.execute()
+
+def unregister_active_attempt(quiz_id: int, user_id: int, user_quiz_attempt_id: int):
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.zrem(quiz_active_attempts_key(quiz_id), str(user_quiz_attempt_id))
+    pipe.zrem(user_active_attempts_key(user_id), f"{quiz_id}:{user_quiz_attempt_id}")
+    pipe.execute()
+
+def read_user_active_attempts(user_id: int) -> List[dict]:
+    """
+    사용자의 진행 중인 응시 목록을 마감 시각 순으로 반환하는 함수 (KEYS/SCAN 없이 ZRANGE 한 번)
+    """
+    attempts = []
+    for member, score in redis_client.zrange(user_active_attempts_key(user_id), 0, -1, withscores=True):
+        quiz_id, user_quiz_attempt_id = member.split(":")
+        attempts.append({
+            "quiz_id": int(quiz_id),
+            "user_quiz_attempt_id": int(user_quiz_attempt_id),
+            "deadline_at": _score_to_deadline(score),
+        })
+    return attempts
+
+def read_quiz_live_attempts(db: Session, quiz_id: int, offset: int = 0, limit: int = 100) -> dict:
+    """
+    퀴즈의 진행 중인 응시 목록을 마감 시각 순으로 페이지 단위로 반환하는 함수
+
+    전체 수는 ZCARD(O(1)), 페이지는 ZRANGE(O(log n + limit)) 로 조회하고 사용자 ID 는 페이지 안에서만 조회합니다.
+    """
+    key = quiz_active_attempts_key(quiz_id)
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.zcard(key)
+    pipe.zrange(key, offset, offset + limit - 1, withscores=True)
+    total, members = pipe.execute()
+    attempt_ids = [int(member) for member, _ in members]
+    user_ids = dict(
+        db.query(UserQuizAttempt.id, UserQuizAttempt.user_id).filter(UserQuizAttempt.id.in_(attempt_ids)).all()
+    ) if attempt_ids else {}
+    return {
+        "quiz_id": quiz_id,
+        "total": total,
+        "attempts": [
+            {
+                "user_quiz_attempt_id": attempt_id,
+                "user_id": user_ids.get(attempt_id),
+                "deadline_at": _score_to_deadline(score),
+            }
+            for attempt_id, (_, score) in zip(attempt_ids, members)
+        ],
+    }
+
+def read_active_attempt_deadline(db: Session, quiz_id: int, user_id: int, user_quiz_attempt_id: int) -> float:
+    """
+    user_id 의 진행 중인 응시의 마감 시각(score)을 반환하는 함수 (사용자 등록부 조회 O(1))
+
+    사용자 등록부에 있으면 본인 응시이므로 DB 조회 없이 끝납니다.
+    없으면(Redis 재시작 등) Postgres 로 확인하여 진행 중이면 다시 등록하고,
+    없는 응시는 404, 다른 사용자의 응시는 403, 제출된 응시는 400 을 반환합니다.
+    """
+    score = redis_client.zscore(user_active_attempts_key(user_id), f"{quiz_id}:{user_quiz_attempt_id}")
+    if score is not None:
+        return score
+    attempt = db.query(UserQuizAttempt.user_id, UserQuizAttempt.is_submit, UserQuizAttempt.deadline_at).filter(
+        UserQuizAttempt.id == user_quiz_attempt_id, UserQuizAttempt.quiz_id == quiz_id
+    ).first()
+    if attempt is None:
+        raise HTTPException(status_code=404, detail="응시 정보를 찾을 수 없습니다.")
+    if attempt.user_id != user_id:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    if attempt.is_submit:
+        raise HTTPException(status_code=400, detail="이미 제출된 응시입니다.")
+    register_active_attempt(quiz_id, attempt.user_id, user_quiz_attempt_id, attempt.deadline_at)
+    return _deadline_score(attempt.deadline_at)
+
+def _quiz_to_dict(quiz: Quiz) -> dict:
+    return {
+        "id": quiz.id,
+        "user_id": quiz.user_id,
+        "title": quiz.title,
+        "description": quiz.description,
+        "question_count": quiz.question_count,
+        "duration_minutes": quiz.duration_minutes,
+        "stratify_by": quiz.stratify_by,
+        "blueprint": quiz.blueprint,
+    }
+
 def create_quiz(db: Session, quiz: QuizCreate, user_id: int):
     db_quiz = Quiz(**quiz.dict(), user_id=user_id) 
     db.add(db_quiz)
@@ -40,15 +270,21 @@ def register_user_for_quiz(db: Session, user_id: int, quiz_id: int):
     db.add(registration)
     db.commit()
     db.refresh(registration)
+    _update_registration_bit(quiz_id, user_id, True)
     return registration
 
-def create_user_quiz_attempt(db: Session, user_id: int, quiz_id: int):    
-    registered = db.query(UserQuizRegistration).filter(
+def unregister_user_from_quiz(db: Session, user_id: int, quiz_id: int):
+    deleted = db.query(UserQuizRegistration).filter(
         UserQuizRegistration.user_id == user_id,
         UserQuizRegistration.quiz_id == quiz_id
-    ).first()
-    
-    if not registered:
+    ).delete()
+    if not deleted:
+        raise HTTPException(status_code=404, detail="User is not registered for this quiz.")
+    db.commit()
+    _update_registration_bit(quiz_id, user_id, False)
+
+def create_user_quiz_attempt(db: Session, user_id: int, quiz_id: int):    
+    if not is_user_registered(db, quiz_id, user_id):
         raise HTTPException(status_code=400, detail="User is not registered for this quiz.")
         
     existing_attempt = db.query(UserQuizAttempt).filter(
@@ -109,7 +345,11 @@ def read_quizzes(
                 QuizResponse(
                     id=quiz.id,
                     title=quiz.title,
-                    description=quiz.description
+                    description=quiz.description,
+                    duration_minutes=quiz.duration_minutes,
+                    question_count=quiz.question_count,
+                    stratify_by=quiz.stratify_by,
+                    blueprint=quiz.blueprint,
                 )
                 for quiz in quizzes
             ]
@@ -139,6 +379,10 @@ def read_quizzes(
                 id=quiz.id,
                 title=quiz.title,
                 description=quiz.description,
+                duration_minutes=quiz.duration_minutes,
+                question_count=quiz.question_count,
+                stratify_by=quiz.stratify_by,
+                blueprint=quiz.blueprint,
                 is_attempted=True
             )
             for quiz in quizzes
@@ -146,16 +390,441 @@ def read_quizzes(
     }
 
 def read_quiz(db: Session, quiz_id: int):
-    return db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    """
+    퀴즈 정보를 캐시에서 조회하는 함수 (퀴즈 컨텐츠 버전이 바뀌면 다시 적재)
+    """
+    version = get_quiz_version(quiz_id, create=False)
+    if version is None:
+        # 버전 키는 퀴즈가 있을 때만 만듭니다. (없는 퀴즈 ID 조회로 Redis 키가 쌓이지 않도록)
+        quiz = _load_quiz(db, quiz_id)
+        version = get_quiz_version(quiz_id) if quiz else None
+        if version is None:
+            return quiz
+        return quiz_cache.get_or_load(quiz_id, lambda: quiz, version=version)
+    return quiz_cache.get_or_load(quiz_id, lambda: _load_quiz(db, quiz_id), version=version)
+
+def _load_quiz(db: Session, quiz_id: int) -> Optional[dict]:
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    return _quiz_to_dict(quiz) if quiz else None
+
+class QuestionRow(NamedTuple):
+    id: int
+    quiz_id: int
+    text: str
+    order: int
+
+class ChoiceRow(NamedTuple):
+    id: int
+    question_id: int
+    text: str
+    is_correct: bool
+    order: int
+
+def count_questions(db: Session, quiz_id: int) -> int:
+    return db.query(Question.id).filter(Question.quiz_id == quiz_id).count()
 
-def read_questions_with_choices_by_quiz(db: Session, quiz_id: int):
-    return db.query(Question).filter(Question.quiz_id == quiz_id).options(joinedload(Question.choices)).all()
+def read_question_rows(
+    db: Session,
+    quiz_id: int,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    question_ids: Optional[List[int]] = None,
+) -> List[QuestionRow]:
+    """
+    퀴즈의 문제를 ORM 객체 대신 필요한 컬럼만 담은 QuestionRow 로 조회하는 함수 (ID 순)
+    """
+    query = (
+        db.query(Question.id, Question.quiz_id, Question.text, Question.order)
+        .filter(Question.quiz_id == quiz_id)
+        .order_by(Question.id.asc())
+    )
+    if question_ids is not None:
+        query = query.filter(Question.id.in_(question_ids))
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return [QuestionRow._make(row) for row in query.all()]
+
+def read_choice_rows(db: Session, quiz_id: int, question_ids: Optional[List[int]] = None) -> Dict[int, List[ChoiceRow]]:
+    """
+    퀴즈의 선택지를 ChoiceRow 로 조회하여 문제 ID 별로 묶어 반환하는 함수 (선택지 ID 순)
+
+    question_ids 를 넘기면 해당 문제의 선택지만 조회합니다.
+    """
+    query = (
+        db.query(Choice.id, Choice.question_id, Choice.text, Choice.is_correct, Choice.order)
+        .join(Question, Question.id == Choice.question_id)
+        .filter(Question.quiz_id == quiz_id)
+    )
+    if question_ids is not None:
+        query = query.filter(Choice.question_id.in_(question_ids))
+    choices: Dict[int, List[ChoiceRow]] = {}
+    for row in query.order_by(Choice.question_id.asc(), Choice.id.asc()).all():
+        choices.setdefault(row.question_id, []).append(ChoiceRow._make(row))
+    return choices
+
+def read_questions_with_choices_by_quiz(
+    db: Session, quiz_id: int, offset: Optional[int] = None, limit: Optional[int] = None
+) -> List[Tuple[QuestionRow, List[ChoiceRow]]]:
+    """
+    문제와 선택지를 (QuestionRow, [ChoiceRow, ...]) 목록으로 조회하는 함수
+
+    ORM 객체/identity map 을 만들지 않고 쿼리 두 번으로 끝납니다.
+    """
+    questions = read_question_rows(db, quiz_id, offset=offset, limit=limit)
+    if not questions:
+        return []
+    paged = offset is not None or limit is not None
+    choices = read_choice_rows(db, quiz_id, [question.id for question in questions] if paged else None)
+    return [(question, choices.get(question.id, [])) for question in questions]
+
+def read_questions_with_choices_by_ids(
+    db: Session, quiz_id: int, question_ids: List[int]
+) -> List[Tuple[QuestionRow, List[ChoiceRow]]]:
+    """
+    지정한 문제만 (QuestionRow, [ChoiceRow, ...]) 목록으로 조회하는 함수 (question_ids 순서 유지)
+    """
+    if not question_ids:
+        return []
+    questions = {question.id: question for question in read_question_rows(db, quiz_id, question_ids=question_ids)}
+    choices = read_choice_rows(db, quiz_id, question_ids)
+    return [
+        (questions[question_id], choices.get(question_id, []))
+        for question_id in question_ids if question_id in questions
+    ]
+
+# 층화 추출 기준 -> 문제 ID 배열 항목([id, category, difficulty])의 위치
+SAMPLING_STRATA = {"category": 1, "difficulty": 2}
+
+def read_question_id_array(db: Session, quiz_id: int) -> List[list]:
+    """
+    무작위 추출용 문제 ID 배열([[id, category, difficulty], ...])을 캐시에서 조회하는 함수
+
+    퀴즈 컨텐츠 버전이 바뀌면(문제 추가/수정/삭제) 다시 적재합니다.
+    """
+    return question_ids_cache.get_or_load(quiz_id, lambda: _load_question_id_array(db, quiz_id), version=get_quiz_version(quiz_id))
+
+def _load_question_id_array(db: Session, quiz_id: int) -> List[list]:
+    return [
+        [question_id, category, difficulty]
+        for question_id, category, difficulty in db.query(Question.id, Question.category, Question.difficulty)
+        .filter(Question.quiz_id == quiz_id)
+        .order_by(Question.id.asc())
+        .all()
+    ]
+
+def read_answer_key(db: Session, quiz_id: int) -> List[int]:
+    """
+    퀴즈의 정답 선택지 ID 목록을 캐시에서 조회하는 함수 (선택지의 정답 여부가 바뀌면 컨텐츠 버전이 바뀌어 다시 적재)
+    """
+    return answer_key_cache.get_or_load(quiz_id, lambda: _load_answer_key(db, quiz_id), version=get_quiz_version(quiz_id))
+
+def _load_answer_key(db: Session, quiz_id: int) -> List[int]:
+    return [
+        choice_id for (choice_id,) in
+        db.query(Choice.id)
+        .join(Question, Question.id == Choice.question_id)
+        .filter(Question.quiz_id == quiz_id, Choice.is_correct.is_(True))
+        .order_by(Choice.id.asc())
+    ]
+
+# KEYS[1]: 새로 만든 비트맵, KEYS[2]: 등록 비트맵, KEYS[3]: 등록 버전 / ARGV: 만들기 시작할 때의 버전, TTL
+# 만드는 동안 등록/취소가 있었으면(버전이 다르면) 새 비트맵을 버리고 0 을 반환합니다.
+REGISTRATIONS_SWAP_SCRIPT = """
+if (redis.call('GET', KEYS[3]) or '0') ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 0
+end
+redis.call('RENAME', KEYS[1], KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+_registrations_swap = None
+
+def load_registrations(db: Session, quiz_id: int, ttl: Optional[int] = None) -> Optional[int]:
+    """
+    퀴즈 등록 사용자 ID 를 Redis 비트맵(사용자 ID 번째 비트)으로 다시 만드는 함수, 등록 수를 반환
+
+    사용자 ID 가 1부터이므로 0번 비트는 비트맵을 다 만들었다는 표시로 사용합니다. (사용자 1,000만 명이면 약 1.2MB)
+    임시 키에 만든 뒤 교체하므로 만드는 동안에도 이전 비트맵을 읽을 수 있고,
+    그 사이 등록/취소가 있었으면 교체하지 않고 None 을 반환합니다. (다음 확인 때 다시 만듦)
+    """
+    global _registrations_swap
+    if _registrations_swap is None:
+        _registrations_swap = redis_client.register_script(REGISTRATIONS_SWAP_SCRIPT)
+    key = quiz_registrations_key(quiz_id)
+    version_key = quiz_registrations_version_key(quiz_id)
+    building = f"{key}:building:{uuid.uuid4().hex}"
+    version = redis_client.get(version_key) or "0"
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.setbit(building, REGISTRATIONS_LOADED_BIT, 1)
+    pipe.expire(building, 600)
+    count = 0
+    for (user_id,) in db.query(UserQuizRegistration.user_id).filter(UserQuizRegistration.quiz_id == quiz_id).yield_per(10000):
+        pipe.setbit(building, user_id, 1)
+        count += 1
+        if count % 10000 == 0:
+            pipe.execute()
+    pipe.execute()
+    swapped = _registrations_swap(
+        keys=[building, key, version_key],
+        args=[version, ttl or settings.REGISTRATION_CACHE_TTL],
+        client=redis_client.get_client(),
+    )
+    return count if swapped else None
+
+def _update_registration_bit(quiz_id: int, user_id: int, registered: bool):
+    """
+    등록/취소를 비트맵에 반영하는 함수 (DB 커밋 후 호출)
+
+    비트맵이 없으면 표시 비트 없이 만들어지므로 다음 확인 때 DB 에서 다시 만듭니다.
+    """
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.incr(quiz_registrations_version_key(quiz_id))
+        pipe.setbit(quiz_registrations_key(quiz_id), user_id, 1 if registered else 0)
+        pipe.execute()
+    except redis.RedisError:
+        logger.error("Failed to update registration bitmap of quiz %s, dropping it", quiz_id)
+        try:
+            redis_client.delete(quiz_registrations_key(quiz_id))
+        except redis.RedisError:
+            pass
+
+def is_user_registered(db: Session, quiz_id: int, user_id: int) -> bool:
+    """
+    사용자가 퀴즈에 등록했는지 Redis 비트맵으로 확인하는 함수 (GETBIT 두 번을 한 번에 요청, DB 조회 없음)
+
+    비트맵이 없으면 한 요청만 DB 에서 다시 만들고, 다른 요청과 Redis 장애 시에는 DB 를 조회합니다.
+    """
+    key = quiz_registrations_key(quiz_id)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.getbit(key, REGISTRATIONS_LOADED_BIT)
+        pipe.getbit(key, user_id)
+        loaded, registered = pipe.execute()
+        if loaded:
+            return bool(registered)
+        if redis_client.set(f"{key}:lock", 1, nx=True, px=settings.CACHE_LOCK_TIMEOUT_MS):
+            try:
+                if load_registrations(db, quiz_id) is not None:
+                    return bool(redis_client.getbit(key, user_id))
+            finally:
+                redis_client.delete(f"{key}:lock")
+    except redis.RedisError:
+        logger.warning("Redis unavailable, checking registration of quiz %s in database", quiz_id)
+    return db.query(UserQuizRegistration.id).filter(
+        UserQuizRegistration.user_id == user_id,
+        UserQuizRegistration.quiz_id == quiz_id
+    ).first() is not None
+
+PREPARED_CACHES = {
+    "quiz": (quiz_cache, _load_quiz),
+    "question_ids": (question_ids_cache, _load_question_id_array),
+    "answer_key": (answer_key_cache, _load_answer_key),
+}
+
+def prepare_quiz(db: Session, quiz_id: int, pin_seconds: Optional[int] = None) -> Optional[dict]:
+    """
+    시험 시작 전에 퀴즈 정보, 문제 ID 배열, 정답, 등록 사용자를 미리 적재하는 함수
+
+    캐시 값은 pin_seconds 동안 Redis 와 모든 워커의 프로세스 내부 LRU 에 유지되므로,
+    시험 시작 직후의 /start 요청은 출제할 문제/선택지만 DB 에서 읽습니다. 준비 상태(read_quiz_preparation)를 반환합니다.
+    """
+    quiz = _load_quiz(db, quiz_id)
+    if quiz is None:
+        return None
+    ttl = pin_seconds or settings.QUIZ_PREPARE_PIN_SECONDS
+    version = get_quiz_version(quiz_id)
+    started = time.monotonic()
+    for name, (cache, load) in PREPARED_CACHES.items():
+        cache.pin(quiz_id, quiz if name == "quiz" else load(db, quiz_id), version, ttl)
+    load_registrations(db, quiz_id, ttl)
+    if quiz["blueprint"]:
+        # 태그 역색인은 프로세스 내부에만 있으므로 이 워커에만 적재됩니다.
+        read_tag_index(db, quiz_id)
+    elapsed_ms = (time.monotonic() - started) * 1000
+    logger.info("Prepared quiz %s (version %s) in %.0f ms", quiz_id, version, elapsed_ms)
+    return {**read_quiz_preparation(quiz_id), "elapsed_ms": round(elapsed_ms, 1)}
+
+def read_quiz_preparation(quiz_id: int) -> dict:
+    """
+    퀴즈의 미리 적재된 값별 버전/크기(바이트)/남은 시간(초)과 준비 완료 여부를 반환하는 함수
+
+    모든 값이 현재 컨텐츠 버전으로 Redis 에 있으면 ready 입니다.
+    """
+    version = get_quiz_version(quiz_id)
+    items = {name: cache.entry_info(quiz_id) for name, (cache, _) in PREPARED_CACHES.items()}
+    key = quiz_registrations_key(quiz_id)
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.bitcount(key)
+    pipe.strlen(key)
+    pipe.ttl(key)
+    count, size, ttl = pipe.execute()
+    items["registrations"] = {"count": max(0, count - 1), "bytes": size, "ttl": ttl}
+    return {
+        "quiz_id": quiz_id,
+        "content_version": version,
+        "ready": all(item is not None and item["version"] == version for name, item in items.items() if name in PREPARED_CACHES),
+        "total_bytes": sum(item["bytes"] for item in items.values() if item),
+        "items": items,
+    }
+
+def schedule_quiz_preparation(quiz_id: int, starts_at: datetime) -> datetime:
+    """
+    시험 시작 QUIZ_PREPARE_LEAD_SECONDS 초 전에 prepare_quiz 가 실행되도록 예약하는 함수, 준비할 시각을 반환
+    """
+    prepare_at = starts_at - timedelta(seconds=settings.QUIZ_PREPARE_LEAD_SECONDS)
+    redis_client.zadd(QUIZ_PREPARE_SCHEDULE_KEY, {str(quiz_id): prepare_at.timestamp()})
+    return prepare_at
+
+def attempt_sample_seed(quiz_id: int, user_quiz_attempt_id: int) -> str:
+    """
+    응시별 추출 시드 (같은 응시는 항상 같은 문제를 뽑습니다)
+    """
+    return f"quiz:{quiz_id}:attempt:{user_quiz_attempt_id}"
+
+def _allocate_quotas(sizes: Dict[Any, int], num: int) -> Dict[Any, int]:
+    """
+    층별 문제 수에 비례하여 num 개를 나누는 함수 (최대 나머지 방식)
+    """
+    total = sum(sizes.values())
+    exact = {key: num * size / total for key, size in sizes.items()}
+    quotas = {key: int(value) for key, value in exact.items()}
+    remaining = num - sum(quotas.values())
+    for key in sorted(exact, key=lambda key: quotas[key] - exact[key])[:remaining]:
+        quotas[key] += 1
+    return quotas
+
+def sample_question_ids(entries: List[list], num: int, seed: str, stratify_by: Optional[str] = None) -> List[int]:
+    """
+    문제 ID 배열에서 num 개를 무작위로 뽑는 함수
+
+    stratify_by("category" / "difficulty")를 지정하면 각 층의 비율대로 뽑습니다.
+    같은 seed 이면 항상 같은 결과를 반환합니다.
+    """
+    rng = random.Random(seed)
+    if num >= len(entries):
+        return [entry[0] for entry in entries]
+    if stratify_by not in SAMPLING_STRATA:
+        return rng.sample([entry[0] for entry in entries], num)
+
+    index = SAMPLING_STRATA[stratify_by]
+    strata: Dict[Any, List[int]] = {}
+    for entry in entries:
+        strata.setdefault(entry[index], []).append(entry[0])
+    # 결과가 dict 순서에 의존하지 않도록 층을 정렬합니다.
+    keys = sorted(strata, key=lambda key: (key is None, str(key)))
+    quotas = _allocate_quotas({key: len(strata[key]) for key in keys}, num)
+
+    selected = []
+    for key in keys:
+        selected.extend(rng.sample(strata[key], quotas[key]))
+    rng.shuffle(selected)
+    return selected
+
+def find_active_attempt(db: Session, user_id: int, quiz_id: int) -> Optional[int]:
+    """
+    (사용자, 퀴즈)의 마감 전 미제출 응시 ID 를 반환하는 함수
+
+    응시 등록부에서 먼저 찾고(DB 조회 없음), 없으면 Postgres 에서 찾아 등록부에 다시 등록합니다.
+    """
+    now = datetime.now()
+    try:
+        for member, score in redis_client.zrange(user_active_attempts_key(user_id), 0, -1, withscores=True):
+            member_quiz_id, user_quiz_attempt_id = member.split(":")
+            if int(member_quiz_id) == quiz_id and score > now.timestamp():
+                return int(user_quiz_attempt_id)
+    except redis.RedisError:
+        logger.warning("Redis unavailable, looking up active attempt of user %s in database", user_id)
+
+    attempt = (
+        db.query(UserQuizAttempt.id, UserQuizAttempt.deadline_at)
+        .filter(
+            UserQuizAttempt.user_id == user_id,
+            UserQuizAttempt.quiz_id == quiz_id,
+            UserQuizAttempt.is_submit.is_(False),
+            or_(UserQuizAttempt.deadline_at.is_(None), UserQuizAttempt.deadline_at > now),
+        )
+        .order_by(UserQuizAttempt.id.desc())
+        .first()
+    )
+    if attempt is None:
+        return None
+    try:
+        register_active_attempt(quiz_id, user_id, attempt.id, attempt.deadline_at)
+    except redis.RedisError:
+        pass
+    return attempt.id
+
+def resume_attempt(db: Session, quiz_id: int, user_quiz_attempt_id: int) -> Optional[dict]:
+    """
+    진행 중인 응시의 시작 화면 데이터를 Redis 캐시(없으면 Postgres 스냅샷)에서 반환하는 함수
+    """
+    redis_key = attempt_cache_key(quiz_id, user_quiz_attempt_id)
+    try:
+        cached_data = redis_client.get(redis_key)
+    except redis.RedisError:
+        cached_data = None
+    if cached_data:
+        return json.loads(cached_data)
+
+    result = read_attempt_snapshot(db, quiz_id, user_quiz_attempt_id)
+    if result is None:
+        return None
+    result["user_quiz_attempt_id"] = user_quiz_attempt_id
+    try:
+        redis_client.setex(redis_key, 3600, json.dumps(result))
+    except redis.RedisError:
+        pass
+    return result
+
+def _start_lock_key(quiz_id: int, user_id: int) -> str:
+    return f"quiz:{quiz_id}:user:{user_id}:start_lock"
 
 def read_random_questions(db: Session, user_id: int, quiz_id: int, num_questions: int = None):
     """
     사용자가 시험 시작할 때 문제 순서와 답안 순서를 Redis에 반영하는 함수 (퀴즈 정보 포함)
+
+    (사용자, 퀴즈)마다 멱등입니다. 진행 중인 응시가 있으면 새 응시를 만들지 않고 그 응시의 화면 데이터를 반환하며,
+    동시에 들어온 첫 시작 요청은 Redis 잠금으로 한 요청만 응시를 생성합니다.
     """
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    user_quiz_attempt_id = find_active_attempt(db, user_id, quiz_id)
+    if user_quiz_attempt_id is not None:
+        result = resume_attempt(db, quiz_id, user_quiz_attempt_id)
+        if result is not None:
+            return result
+
+    lock_key = _start_lock_key(quiz_id, user_id)
+    try:
+        acquired = redis_client.set(lock_key, 1, nx=True, px=settings.CACHE_LOCK_TIMEOUT_MS)
+    except redis.RedisError:
+        acquired = True
+    if not acquired:
+        # 다른 요청이 응시를 만드는 중이면 등록될 때까지 잠시 기다렸다가 그 응시를 반환합니다.
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT_MS / 1000
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            user_quiz_attempt_id = find_active_attempt(db, user_id, quiz_id)
+            if user_quiz_attempt_id is not None:
+                result = resume_attempt(db, quiz_id, user_quiz_attempt_id)
+                if result is not None:
+                    return result
+        # 잠금 없이 만들면 응시가 두 개 생길 수 있으므로 다시 시도하도록 합니다.
+        raise HTTPException(status_code=409, detail="응시를 시작하는 중입니다. 잠시 후 다시 시도해 주세요.", headers={"Retry-After": "1"})
+    try:
+        return _start_new_attempt(db, user_id, quiz_id, num_questions)
+    finally:
+        if acquired:
+            try:
+                redis_client.delete(lock_key)
+            except redis.RedisError:
+                pass
+
+def _start_new_attempt(db: Session, user_id: int, quiz_id: int, num_questions: int = None):
+    # 퀴즈 정보는 캐시에서 읽습니다. (prepare_quiz 로 시험 시작 전에 미리 적재 가능)
+    quiz = read_quiz(db, quiz_id)
     if not quiz:
         return None
 
@@ -164,37 +833,36 @@ def read_random_questions(db: Session, user_id: int, quiz_id: int, num_questions
         quiz_id=quiz_id,
         is_submit=False
     )
+    if quiz["duration_minutes"]:
+        user_quiz_attempt.deadline_at = datetime.now() + timedelta(minutes=quiz["duration_minutes"])
     db.add(user_quiz_attempt)
-    db.commit()
-    db.refresh(user_quiz_attempt)
-
-    redis_key = f"quiz:{quiz_id}:user_quiz_attempts:{user_quiz_attempt.id}"
-    cached_data = redis_client.get(redis_key)
-    
-    if cached_data:
-        return json.loads(cached_data)    
+    db.flush()
+    redis_key = attempt_cache_key(quiz_id, user_quiz_attempt.id)
 
-    total_questions = db.query(Question).filter(Question.quiz_id == quiz_id).count()
-    
-    if num_questions is None:
-        num_questions = quiz.question_count or total_questions
-    
-    if num_questions > total_questions:
-        num_questions = total_questions
-    
-    questions = db.query(Question).filter(Question.quiz_id == quiz_id).all()
-    # selected_questions = random.sample(questions, num_questions)
-    selected_questions = questions
+    # 출제 구성표가 있으면 태그 역색인에서, 출제 문제 수가 전체보다 적으면 캐시된 ID 배열에서 뽑은 문제만 조회합니다.
+    selected_questions = None
+    num_questions = num_questions or quiz["question_count"]
+    seed = attempt_sample_seed(quiz_id, user_quiz_attempt.id)
+    if quiz["blueprint"]:
+        question_ids = read_tag_index(db, quiz_id).sample(quiz["blueprint"], seed)
+        selected_questions = read_questions_with_choices_by_ids(db, quiz_id, question_ids)
+    elif num_questions:
+        entries = read_question_id_array(db, quiz_id)
+        if num_questions < len(entries):
+            question_ids = sample_question_ids(entries, num_questions, seed, quiz["stratify_by"])
+            selected_questions = read_questions_with_choices_by_ids(db, quiz_id, question_ids)
+    if selected_questions is None:
+        selected_questions = read_questions_with_choices_by_quiz(db, quiz_id)
     
     result = {
-        "quiz_id": quiz.id,
-        "title": quiz.title,
-        "description": quiz.description,
+        "quiz_id": quiz["id"],
+        "user_quiz_attempt_id": user_quiz_attempt.id,
+        "title": quiz["title"],
+        "description": quiz["description"],
         "questions": []
     }
 
-    for question in selected_questions:
-        choices = db.query(Choice).filter(Choice.question_id == question.id).all()
+    for question, choices in selected_questions:
         # random.shuffle(choices)
         result["questions"].append({
             "id": question.id,
@@ -202,8 +870,22 @@ def read_random_questions(db: Session, user_id: int, quiz_id: int, num_questions
             "choices": [{"id": choice.id, "text": choice.text} for choice in choices]
         })
     
+    # Redis 캐시가 사라져도 같은 문제/선택지 순서로 복원할 수 있도록 ID 만 함께 저장
+    db.add(UserQuizAttemptSnapshot(
+        attempt_id=user_quiz_attempt.id,
+        quiz_id=quiz_id,
+        payload=json.dumps({"questions": layout_from_questions(result["questions"])}),
+        content_version=get_quiz_version(quiz_id),
+    ))
+    db.commit()
     
-    redis_client.setex(redis_key, 3600, json.dumps(result))  # 퀴즈 정보까지 Redis에 저장
+    try:
+        register_active_attempt(quiz_id, user_id, user_quiz_attempt.id, user_quiz_attempt.deadline_at)
+        cache_ttl = max(3600, (quiz["duration_minutes"] or 0) * 60 + 600)
+        redis_client.setex(redis_key, cache_ttl, json.dumps(result))  # 퀴즈 정보까지 Redis에 저장
+    except redis.RedisError:
+        logger.warning("Redis unavailable, quiz attempt %s is not cached", user_quiz_attempt.id)
+    count_quiz_event(quiz_id, "started", per_minute="started")
 
     return result
 
@@ -214,25 +896,104 @@ def update_quiz(db: Session, quiz_id: int, quiz_update: QuizUpdate):
             setattr(db_quiz, key, value)
         db.commit()
         db.refresh(db_quiz)
+        bump_quiz_version(quiz_id)
+        quiz_cache.invalidate(quiz_id)
     return db_quiz
 
-def update_quiz_answer(quiz_id: int, user_quiz_attempt_id: int,  request: QuizAnswerRequest):
+def read_attempt_layout(db: Session, quiz_id: int, user_quiz_attempt_id: int) -> Optional[List[List]]:
     """
-    사용자가 선택지를 클릭할 때 Redis에 반영하는 함수
+    응시의 스냅샷 순서를 캐시에서 조회하는 함수 (스냅샷이 없으면 None)
     """
-    attempt_key = f"quiz:{quiz_id}:user_quiz_attempts:{user_quiz_attempt_id}:answers"
-        
-    if redis_client.exists(attempt_key):
-        answers = {k: v for k, v in redis_client.hgetall(attempt_key).items()}
-    else:
-        answers = {}
-    
-    answers[str(request.question_id)] = str(request.selected_choice_id)
-    
-    redis_client.hset(attempt_key, request.question_id, request.selected_choice_id)
+    def load():
+        payload = db.query(UserQuizAttemptSnapshot.payload).filter(
+            UserQuizAttemptSnapshot.attempt_id == user_quiz_attempt_id,
+            UserQuizAttemptSnapshot.quiz_id == quiz_id,
+        ).scalar()
+        return json.loads(payload)["questions"] if payload else None
+
+    return attempt_layout_cache.get_or_load(user_quiz_attempt_id, load)
+
+def check_answer_in_layout(db: Session, quiz_id: int, user_quiz_attempt_id: int, question_id: int, choice_id: int):
+    """
+    응시에 제공된 문제와 그 문제의 선택지인지 확인하는 함수 (아니면 400)
+    """
+    layout = read_attempt_layout(db, quiz_id, user_quiz_attempt_id) or []
+    if not any(layout_question_id == question_id and choice_id in choice_ids for layout_question_id, choice_ids in layout):
+        raise HTTPException(status_code=400, detail="응시에 제공되지 않은 문제 또는 선택지입니다.")
+
+def drop_missing_answers(db: Session, answers_by_attempt: Dict[int, Dict]) -> Dict[int, Dict[int, int]]:
+    """
+    응시별 {문제 ID: 선택지 ID} 답안에서 지금 DB 에 없는(응시 중 삭제된) 문제/선택지를 빼는 함수 (쿼리 한 번)
+    """
+    choice_ids = {int(choice_id) for answers in answers_by_attempt.values() for choice_id in answers.values()}
+    question_of_choice = dict(db.query(Choice.id, Choice.question_id).filter(Choice.id.in_(choice_ids)).all()) if choice_ids else {}
+    return {
+        user_quiz_attempt_id: {
+            int(question_id): int(choice_id)
+            for question_id, choice_id in answers.items()
+            if question_of_choice.get(int(choice_id)) == int(question_id)
+        }
+        for user_quiz_attempt_id, answers in answers_by_attempt.items()
+    }
+
+def save_attempt_progress(db: Session, user_quiz_attempt_id: int, answers: Dict[int, int]):
+    """
+    응시 중인 답안을 Postgres 에 upsert 하는 함수 (commit 은 호출자가 수행)
+
+    문제/선택지가 DB 에 있는지는 호출자가 확인합니다. (drop_missing_answers)
+    """
+    if not answers:
+        return
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    stmt = insert(UserQuizAttemptProgress).values([
+        {"attempt_id": user_quiz_attempt_id, "question_id": int(question_id), "choice_id": int(choice_id)}
+        for question_id, choice_id in answers.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["attempt_id", "question_id"],
+        set_={"choice_id": stmt.excluded.choice_id, "updated_at": datetime.now()},
+    )
+    db.execute(stmt)
+
+def update_quiz_answer(db: Session, quiz_id: int, user_id: int, user_quiz_attempt_id: int,  request: QuizAnswerRequest):
+    """
+    사용자가 선택지를 클릭할 때 Redis에 반영하는 함수 (user_id 의 응시가 아니면 403, 응시에 없는 문제/선택지면 400)
+
+    Redis 장애 시에는 기다리지 않고 답안을 Postgres 에 바로 저장합니다.
+    """
+    attempt_key = attempt_answers_key(quiz_id, user_quiz_attempt_id)
 
-    if not redis_client.ttl(attempt_key):
-        redis_client.expire(attempt_key, 1200)
+    try:
+        deadline = read_active_attempt_deadline(db, quiz_id, user_id, user_quiz_attempt_id)
+        if deadline + settings.AUTO_SUBMIT_GRACE_SECONDS < datetime.now().timestamp():
+            raise HTTPException(status_code=400, detail="응시 시간이 종료되었습니다.")
+        check_answer_in_layout(db, quiz_id, user_quiz_attempt_id, request.question_id, request.selected_choice_id)
+        # 답안을 쓸 때마다 만료 시간을 다시 설정합니다. (마지막 답안 이후 1200초 동안 유지)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.hset(attempt_key, request.question_id, request.selected_choice_id)
+        pipe.expire(attempt_key, 1200)
+        pipe.sadd(ANSWERS_DIRTY_KEY, f"{quiz_id}:{user_quiz_attempt_id}")
+        first_answer = pipe.execute()[0]
+        # 처음 답한 문제만 answered 로 셉니다. (답을 바꾸면 answer_writes 만 증가)
+        count_quiz_event(quiz_id, *(("answered", "answer_writes") if first_answer else ("answer_writes",)), per_minute="answers")
+    except redis.RedisError:
+        logger.warning("Redis unavailable, saving answer of attempt %s to database", user_quiz_attempt_id)
+        # Redis 경로(read_active_attempt_deadline)와 같이 본인/제출 여부/마감 시각을 확인합니다.
+        attempt = db.query(UserQuizAttempt.user_id, UserQuizAttempt.is_submit, UserQuizAttempt.deadline_at).filter(
+            UserQuizAttempt.id == user_quiz_attempt_id, UserQuizAttempt.quiz_id == quiz_id
+        ).first()
+        if attempt is None:
+            raise HTTPException(status_code=404, detail="응시 정보를 찾을 수 없습니다.")
+        if attempt.user_id != user_id:
+            raise HTTPException(status_code=403, detail="권한이 없습니다.")
+        if attempt.is_submit:
+            raise HTTPException(status_code=400, detail="이미 제출된 응시입니다.")
+        if attempt.deadline_at and attempt.deadline_at + timedelta(seconds=settings.AUTO_SUBMIT_GRACE_SECONDS) < datetime.now():
+            raise HTTPException(status_code=400, detail="응시 시간이 종료되었습니다.")
+        check_answer_in_layout(db, quiz_id, user_quiz_attempt_id, request.question_id, request.selected_choice_id)
+        answers = drop_missing_answers(db, {user_quiz_attempt_id: {request.question_id: request.selected_choice_id}})
+        save_attempt_progress(db, user_quiz_attempt_id, answers[user_quiz_attempt_id])
+        db.commit()
 
     return QuizAnswerResponse(
         quiz_attempt_id=user_quiz_attempt_id, 
@@ -241,21 +1002,92 @@ def update_quiz_answer(quiz_id: int, user_quiz_attempt_id: int,  request: QuizAn
         message="Answer updated successfully"
     )
 
-def read_quiz_attempt_cache(quiz_id: int, user_quiz_attempt_id: int):
+def read_attempt_snapshot(db: Session, quiz_id: int, user_quiz_attempt_id: int) -> Optional[dict]:
+    """
+    Postgres 에 저장된 문제/선택지 순서로 응시 화면 데이터를 다시 구성하는 함수
+    """
+    snapshot = db.query(UserQuizAttemptSnapshot).filter(
+        UserQuizAttemptSnapshot.attempt_id == user_quiz_attempt_id,
+        UserQuizAttemptSnapshot.quiz_id == quiz_id
+    ).first()
+    if not snapshot:
+        return None
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    if not quiz:
+        return None
+
+    return {
+        "quiz_id": quiz.id,
+        "title": quiz.title,
+        "description": quiz.description,
+        "questions": _questions_from_layout(db, json.loads(snapshot.payload)["questions"]),
+    }
+
+def _questions_from_layout(db: Session, layout: List[List]) -> List[dict]:
+    """
+    스냅샷 순서([[문제 ID, [선택지 ID, ...]], ...])에 문제/선택지 내용을 채우는 함수 (삭제된 문제/선택지는 제외)
+    """
+    question_ids = [question_id for question_id, _ in layout]
+    choice_ids = [choice_id for _, question_choice_ids in layout for choice_id in question_choice_ids]
+    question_texts = dict(db.query(Question.id, Question.text).filter(Question.id.in_(question_ids)).all())
+    choice_texts = dict(db.query(Choice.id, Choice.text).filter(Choice.id.in_(choice_ids)).all())
+
+    return [
+        {
+            "id": question_id,
+            "text": question_texts[question_id],
+            "choices": [
+                {"id": choice_id, "text": choice_texts[choice_id]}
+                for choice_id in question_choice_ids if choice_id in choice_texts
+            ]
+        }
+        for question_id, question_choice_ids in layout if question_id in question_texts
+    ]
+
+def load_attempt_answers(db: Session, quiz_id: int, user_quiz_attempt_id: int) -> Dict[str, str]:
+    """
+    응시 중인 답안을 반환하는 함수 ({question_id: choice_id})
+
+    Postgres 에 옮겨진 답안 위에 Redis 의 최신 답안을 덮어씁니다.
+    Redis 키가 만료되었거나 장애인 경우 Postgres 답안만 반환합니다.
+    """
+    answers = {
+        str(question_id): str(choice_id)
+        for question_id, choice_id in db.query(UserQuizAttemptProgress.question_id, UserQuizAttemptProgress.choice_id)
+        .filter(UserQuizAttemptProgress.attempt_id == user_quiz_attempt_id)
+        .all()
+    }
+    try:
+        answers.update(redis_client.hgetall(attempt_answers_key(quiz_id, user_quiz_attempt_id)))
+    except redis.RedisError:
+        logger.warning("Redis unavailable, reading answers of attempt %s from database", user_quiz_attempt_id)
+    return answers
+
+def read_quiz_attempt_cache(db: Session, quiz_id: int, user_quiz_attempt_id: int):
     """
     사용자가 시험 중 새로고침 했을 때 문제 순서, 답안 순서, 사용자의 선택한 답안을 반환하는 API
+
+    Redis 캐시가 없으면 Postgres 에 저장된 순서와 답안으로 복원하고 캐시를 다시 채웁니다.
     """
-    redis_key = f"quiz:{quiz_id}:user_quiz_attempts:{user_quiz_attempt_id}"
-    attempt_key = f"{redis_key}:answers"
+    redis_key = attempt_cache_key(quiz_id, user_quiz_attempt_id)
     
-    cached_data = redis_client.get(redis_key)
-    if not cached_data:
-        return {"error": "No quiz data found."}
+    try:
+        cached_data = redis_client.get(redis_key)
+    except redis.RedisError:
+        cached_data = None
 
-    quiz_data = json.loads(cached_data)
-    
-    user_answers = {k: v for k, v in redis_client.hgetall(attempt_key).items()} if redis_client.exists(attempt_key) else {}
-    print(quiz_data)
+    if cached_data:
+        quiz_data = json.loads(cached_data)
+    else:
+        quiz_data = read_attempt_snapshot(db, quiz_id, user_quiz_attempt_id)
+        if quiz_data is None:
+            return {"error": "No quiz data found."}
+        try:
+            redis_client.setex(redis_key, 3600, json.dumps(quiz_data))
+        except redis.RedisError:
+            pass
+
+    user_answers = load_attempt_answers(db, quiz_id, user_quiz_attempt_id)
 
     if isinstance(quiz_data, list):
         
@@ -271,40 +1103,61 @@ def read_quiz_attempt_cache(quiz_id: int, user_quiz_attempt_id: int):
     
     return quiz_data
 
-def submit_quiz(db: Session, quiz_id: int, user_quiz_attempt_id: int, data: QuizSubmitRequest):   
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
-    if not quiz:
-        raise ValueError("퀴즈를 찾을 수 없습니다.")
-    
-    # 데이터 변환
-    quiz_data = transform_to_quiz_submit(data)
+def grade_attempt(db: Session, quiz_id: int, user_quiz_attempt_id: int, questions: List[dict]) -> dict:
+    """
+    응시 답안을 채점하고 제공된 문제/선택지와 점수를 저장하는 함수 (수동 제출과 자동 제출이 공유)
+
+    questions: [{"id": 문제 ID, "choices": [{"id": 선택지 ID, "is_selected": bool}, ...]}, ...]
+    선택 정보가 없는 문제는 응시 중 저장된 답안(Redis, 없으면 Postgres)을 사용합니다.
+    """
+    attempt = db.query(UserQuizAttempt).filter(UserQuizAttempt.id == user_quiz_attempt_id).first()
+    if not attempt:
+        raise ValueError("퀴즈 응시 정보를 찾을 수 없습니다.")
+
+    recorded_answers = load_attempt_answers(db, quiz_id, user_quiz_attempt_id)
+    # 정답 선택지는 퀴즈별 캐시에서 조회
+    correct_choice_ids = set(read_answer_key(db, quiz_id))
 
-    correct_count = 0
-    total_count = len(quiz_data.questions)
+    total_count = len(questions)
+    selected_by_question = {}
     
     # 각 질문의 선택된 답안 저장
-    for question in quiz_data.questions:
+    for question in questions:
         user_quiz = UserQuizAttemptQuestion(
             attempt_id=user_quiz_attempt_id,
             question_id=question['id'],
         )
         db.add(user_quiz)
-        for choice in question['choices']:
-            print(choice)
-            user_answer = UserQuizAttemptAnswer(
-                user_quiz_attempt_id=user_quiz_attempt_id,
-                question_id=question['id'],
-                choice_id=choice['id']
-            )
-            db.add(user_answer)
+        # 문제마다 선택지 하나(제출된 순서의 첫 선택)만 답안지에 저장하고 채점합니다.
+        selected_id = next((choice['id'] for choice in question['choices'] if choice.get('is_selected')), None)
+        if selected_id is None and str(question['id']) in recorded_answers:
+            selected_id = int(recorded_answers[str(question['id'])])
+        if selected_id is not None:
+            selected_by_question[question['id']] = selected_id
+        if settings.STORE_ANSWER_ROWS:
+            for choice in question['choices']:
+                db.add(UserQuizAttemptAnswer(
+                    user_quiz_attempt_id=user_quiz_attempt_id,
+                    question_id=question['id'],
+                    choice_id=choice['id']
+                ))
 
-            choice_obj = db.query(Choice).filter(Choice.id == choice['id']).first()            
-            if choice_obj and choice_obj.is_correct and choice['is_selected']:
-                correct_count += 1
+    # 답안지는 스냅샷의 문제 순서로 압축하여 저장 (스냅샷이 없던 응시는 제출된 순서로 스냅샷을 만듭니다)
+    snapshot = db.query(UserQuizAttemptSnapshot).filter(UserQuizAttemptSnapshot.attempt_id == user_quiz_attempt_id).first()
+    if snapshot is None:
+        snapshot = UserQuizAttemptSnapshot(
+            attempt_id=user_quiz_attempt_id,
+            quiz_id=quiz_id,
+            payload=json.dumps({"questions": layout_from_questions(questions)}),
+        )
+        db.add(snapshot)
+    layout = json.loads(snapshot.payload)["questions"]
+    snapshot.answer_sheet = encode_answer_sheet(layout, selected_by_question)
+    # 점수는 저장한 답안지로 계산하므로 다시 채점(app.tasks.regrade)해도 정답이 같으면 점수가 같습니다.
+    correct_count = sum(
+        1 for choice_id in expand_answer_sheet(layout, snapshot.answer_sheet).values() if choice_id in correct_choice_ids
+    )
 
-    attempt = db.query(UserQuizAttempt).filter(UserQuizAttempt.id == user_quiz_attempt_id).first()
-    if not attempt:
-        raise ValueError("퀴즈 응시 정보를 찾을 수 없습니다.")
     attempt.is_submit = True
 
     user_score = UserQuizScore(
@@ -313,14 +1166,134 @@ def submit_quiz(db: Session, quiz_id: int, user_quiz_attempt_id: int, data: Quiz
         total=total_count
     )
     db.add(user_score)
+    db.query(UserQuizAttemptProgress).filter(UserQuizAttemptProgress.attempt_id == user_quiz_attempt_id).delete()
     db.commit()    
 
+    try:
+        redis_client.srem(ANSWERS_DIRTY_KEY, f"{quiz_id}:{user_quiz_attempt_id}")
+        # 채점에 쓴 답안은 답안지로 저장되었으므로 Redis 답안은 지웁니다.
+        redis_client.delete(attempt_answers_key(quiz_id, user_quiz_attempt_id))
+        cancel_attempt_deadline(quiz_id, user_quiz_attempt_id)
+        unregister_active_attempt(quiz_id, attempt.user_id, user_quiz_attempt_id)
+    except redis.RedisError:
+        pass
+    count_quiz_event(quiz_id, "submitted", per_minute="submitted")
+
     return {
         "message": "퀴즈 제출 완료", 
         "score": correct_count,
         "total": total_count     
         }
 
+def read_submitted_attempt(db: Session, user_quiz_attempt_id: int) -> Optional[dict]:
+    """
+    제출된 응시의 문제/선택지/선택 답안과 점수를 반환하는 함수 (응시 화면 데이터와 같은 형식)
+
+    스냅샷의 답안지, 보관된 응시(UserQuizAttemptArchive), 답안 행(STORE_ANSWER_ROWS) 순서로 찾습니다.
+    답안지가 없는 예전 응시는 is_selected 가 모두 False 입니다.
+    """
+    attempt = db.query(UserQuizAttempt).filter(UserQuizAttempt.id == user_quiz_attempt_id).first()
+    if not attempt or not attempt.is_submit:
+        return None
+    quiz = db.query(Quiz).filter(Quiz.id == attempt.quiz_id).first()
+    if not quiz:
+        return None
+
+    score = db.query(UserQuizScore).filter(UserQuizScore.user_quiz_attempt_id == user_quiz_attempt_id).first()
+    score, total = (score.score, score.total) if score else (None, None)
+    snapshot = db.query(UserQuizAttemptSnapshot).filter(UserQuizAttemptSnapshot.attempt_id == user_quiz_attempt_id).first()
+    archive = None if snapshot else db.query(UserQuizAttemptArchive).filter(UserQuizAttemptArchive.attempt_id == user_quiz_attempt_id).first()
+    if snapshot:
+        layout = json.loads(snapshot.payload)["questions"]
+        sheet, content_version = snapshot.answer_sheet, snapshot.content_version
+    elif archive:
+        layout = layout_from_arrays(archive.question_ids, archive.choice_counts, archive.choice_ids)
+        sheet, content_version = archive.answer_sheet, archive.content_version
+        if score is None:
+            score, total = archive.score, archive.total
+    else:
+        layout = []
+        for question_id, choice_id in (
+            db.query(UserQuizAttemptAnswer.question_id, UserQuizAttemptAnswer.choice_id)
+            .filter(UserQuizAttemptAnswer.user_quiz_attempt_id == user_quiz_attempt_id)
+            .order_by(UserQuizAttemptAnswer.id)
+        ):
+            if not layout or layout[-1][0] != question_id:
+                layout.append([question_id, []])
+            layout[-1][1].append(choice_id)
+        sheet, content_version = None, None
+
+    selected = expand_answer_sheet(layout, sheet) if sheet else {}
+    questions = _questions_from_layout(db, layout)
+    for question in questions:
+        for choice in question["choices"]:
+            choice["is_selected"] = choice["id"] == selected.get(question["id"])
+
+    return {
+        "quiz_id": quiz.id,
+        "user_quiz_attempt_id": attempt.id,
+        "user_id": attempt.user_id,
+        "title": quiz.title,
+        "description": quiz.description,
+        "content_version": content_version,
+        "score": score,
+        "total": total,
+        "questions": questions,
+    }
+
+def submit_quiz(db: Session, quiz_id: int, user_id: int, user_quiz_attempt_id: int, data: QuizSubmitRequest):   
+    """
+    user_id 의 응시를 제출하는 함수 (없는 응시는 404, 다른 사용자의 응시는 403)
+    """
+    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    if not quiz:
+        raise ValueError("퀴즈를 찾을 수 없습니다.")
+    attempt = db.query(UserQuizAttempt.user_id, UserQuizAttempt.is_submit, UserQuizAttempt.deadline_at).filter(
+        UserQuizAttempt.id == user_quiz_attempt_id, UserQuizAttempt.quiz_id == quiz_id
+    ).first()
+    if attempt is None:
+        raise HTTPException(status_code=404, detail="응시 정보를 찾을 수 없습니다.")
+    if attempt.user_id != user_id:
+        raise HTTPException(status_code=403, detail="권한이 없습니다.")
+    # Idempotency-Key 없이 재시도한 제출은 채점 전에 거절합니다.
+    if attempt.is_submit:
+        raise HTTPException(status_code=400, detail="이미 제출된 응시입니다.")
+    # 마감(+유예 시간)이 지난 응시는 자동 제출이 저장된 답안으로 채점합니다.
+    if attempt.deadline_at and attempt.deadline_at + timedelta(seconds=settings.AUTO_SUBMIT_GRACE_SECONDS) < datetime.now():
+        raise HTTPException(status_code=400, detail="응시 시간이 종료되었습니다.")
+    
+    # 데이터 변환
+    quiz_data = transform_to_quiz_submit(data)
+    return grade_attempt(db, quiz_id, user_quiz_attempt_id, quiz_data.questions)
+
+def read_overdue_attempts(db: Session, before: datetime, limit: int) -> List[Tuple[int, int]]:
+    """
+    마감 시각이 before 이전인데 제출되지 않은 응시의 (퀴즈 ID, 응시 ID) 목록을 반환하는 함수 (스냅샷이 있는 응시만)
+    """
+    return [
+        (quiz_id, user_quiz_attempt_id)
+        for quiz_id, user_quiz_attempt_id in db.query(UserQuizAttempt.quiz_id, UserQuizAttempt.id)
+        .join(UserQuizAttemptSnapshot, UserQuizAttemptSnapshot.attempt_id == UserQuizAttempt.id)
+        .filter(UserQuizAttempt.is_submit.is_(False), UserQuizAttempt.deadline_at < before)
+        .order_by(UserQuizAttempt.deadline_at)
+        .limit(limit)
+    ]
+
+def submit_expired_attempt(db: Session, quiz_id: int, user_quiz_attempt_id: int) -> Optional[dict]:
+    """
+    마감 시각이 지난 응시를 저장된 문제 순서와 답안으로 자동 제출하는 함수
+
+    이미 제출되었거나 응시 정보가 없으면 None 을 반환합니다.
+    """
+    attempt = db.query(UserQuizAttempt).filter(UserQuizAttempt.id == user_quiz_attempt_id).first()
+    if not attempt or attempt.is_submit:
+        return None
+
+    quiz_data = read_attempt_snapshot(db, quiz_id, user_quiz_attempt_id)
+    if quiz_data is None:
+        return None
+    return grade_attempt(db, quiz_id, user_quiz_attempt_id, quiz_data["questions"])
+
 def test_create_quiz_with_questions_and_choices(db: Session, title: str, description: str, user_id: int):
     quiz = Quiz(title=title, description=description, user_id=user_id)
     db.add(quiz)
@@ -342,26 +1315,132 @@ def test_create_quiz_with_questions_and_choices(db: Session, title: str, descrip
             )
             db.add(choice)
 
+    question_ids = [question_id for (question_id,) in db.query(Question.id).filter(Question.quiz_id == quiz.id)]
+    sync_search_documents(db, question_ids)
+    sync_question_signatures(db, question_ids)
     db.commit()
     db.refresh(quiz)
     return quiz
 
-def validate_quiz(db: Session, quiz_id: int) -> dict:
-    quiz = db.query(Quiz).filter(Quiz.id == quiz_id).first()
-    if not quiz:
-        return {"valid": False, "reason": "퀴즈가 존재하지 않습니다."}
+VALID_QUIZ_REASON = "퀴즈가 올바르게 구성되었습니다."
 
-    if not quiz.questions or len(quiz.questions) == 0:
-        return {"valid": False, "reason": "퀴즈에 문제가 없습니다."}
+def _violation(kind: str, reason: str, question_id: Optional[int] = None) -> dict:
+    return {"type": kind, "question_id": question_id, "reason": reason}
 
-    for question in quiz.questions:
-        choices = question.choices
-        
-        if len(choices) < 2:
-            return {"valid": False, "reason": f"문제 ID {question.id}에 선택지가 2개 미만입니다."}
+def find_quiz_violations(db: Session, quiz_ids: List[int]) -> Dict[int, List[dict]]:
+    """
+    여러 퀴즈의 구성 오류를 한 번의 집계 쿼리로 찾는 함수 ({quiz_id: [위반 항목, ...]})
 
-        correct_choices = [c for c in choices if c.is_correct]
-        if len(correct_choices) == 0:
-            return {"valid": False, "reason": f"문제 ID {question.id}에 정답이 없습니다."}
-        
-    return {"valid": True, "reason": "퀴즈가 올바르게 구성되었습니다."}
+    문제별 선택지 수/정답 수를 GROUP BY 로 집계하고, 순번(order)을 바로 앞 문제의 순번(lag)과 비교하여
+    순번 누락/중복을 판단합니다. 중간 문제 하나가 삭제되면 그 자리 한 건만 보고합니다. (뒤 문제 전체가 아님)
+    위반이 있는 문제 행만 반환되므로 문제가 수만 개여도 결과는 위반 수만큼만 가져옵니다.
+    """
+    if not quiz_ids:
+        return {}
+
+    per_question = (
+        select(
+            Question.quiz_id.label("quiz_id"),
+            Question.id.label("question_id"),
+            Question.order.label("order"),
+            func.count(Choice.id).label("choice_count"),
+            func.coalesce(func.sum(case((Choice.is_correct.is_(True), 1), else_=0)), 0).label("correct_count"),
+            func.lag(Question.order).over(
+                partition_by=Question.quiz_id,
+                order_by=(Question.order, Question.id),
+            ).label("previous_order"),
+        )
+        .outerjoin(Choice, Choice.question_id == Question.id)
+        .where(Question.quiz_id.in_(quiz_ids))
+        .group_by(Question.quiz_id, Question.id, Question.order)
+        .subquery()
+    )
+    # 첫 문제는 1, 나머지는 앞 문제 순번 + 1 이어야 합니다.
+    expected_order = func.coalesce(per_question.c.previous_order + 1, 1)
+    rows = db.execute(
+        select(per_question, expected_order.label("expected_order"))
+        .where(or_(
+            per_question.c.choice_count < 2,
+            per_question.c.correct_count == 0,
+            per_question.c.order != expected_order,
+        ))
+        .order_by(per_question.c.quiz_id, per_question.c.order, per_question.c.question_id)
+    ).all()
+
+    violations: Dict[int, List[dict]] = {}
+    for row in rows:
+        found = violations.setdefault(row.quiz_id, [])
+        if row.choice_count < 2:
+            found.append(_violation("too_few_choices", f"문제 ID {row.question_id}에 선택지가 2개 미만입니다.", row.question_id))
+        if row.correct_count == 0:
+            found.append(_violation("no_correct_choice", f"문제 ID {row.question_id}에 정답이 없습니다.", row.question_id))
+        if row.previous_order is not None and row.order == row.previous_order:
+            found.append(_violation(
+                "order_duplicate", f"문제 ID {row.question_id}의 순번 {row.order}이 중복됩니다.", row.question_id,
+            ))
+        elif row.order != row.expected_order:
+            found.append(_violation(
+                "order_gap",
+                f"문제 ID {row.question_id}의 순번이 {row.order}입니다. (예상 순번: {row.expected_order})",
+                row.question_id,
+            ))
+    return violations
+
+def validate_quizzes(db: Session, quiz_ids: List[int]) -> Dict[int, dict]:
+    """
+    여러 퀴즈를 한 번에 검증하는 함수 ({quiz_id: {"valid", "reason", "violations"}})
+    """
+    question_counts = dict(
+        db.query(Quiz.id, func.count(Question.id))
+        .outerjoin(Question, Question.quiz_id == Quiz.id)
+        .filter(Quiz.id.in_(quiz_ids))
+        .group_by(Quiz.id)
+        .all()
+    )
+    violations = find_quiz_violations(db, [quiz_id for quiz_id, count in question_counts.items() if count])
+
+    results = {}
+    for quiz_id in quiz_ids:
+        if quiz_id not in question_counts:
+            found = [_violation("not_found", "퀴즈가 존재하지 않습니다.")]
+        elif not question_counts[quiz_id]:
+            found = [_violation("no_questions", "퀴즈에 문제가 없습니다.")]
+        else:
+            found = violations.get(quiz_id, [])
+        results[quiz_id] = {
+            "valid": not found,
+            "reason": found[0]["reason"] if found else VALID_QUIZ_REASON,
+            "violations": found,
+        }
+    return results
+
+def iter_quiz_id_chunks(db: Session, chunk_size: int = 500):
+    """
+    전체 퀴즈 ID 를 chunk_size 개씩 나누어 반환하는 제너레이터 (ID 기준 keyset 페이지네이션)
+    """
+    last_id = 0
+    while True:
+        chunk = [quiz_id for (quiz_id,) in db.query(Quiz.id).filter(Quiz.id > last_id).order_by(Quiz.id).limit(chunk_size).all()]
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1]
+
+def sweep_invalid_quizzes(db: Session, chunk_size: int = 500) -> Tuple[int, Dict[int, dict]]:
+    """
+    전체 퀴즈를 chunk_size 개씩 검증하여 (검사한 퀴즈 수, {잘못 구성된 quiz_id: 결과}) 를 반환하는 함수
+    """
+    checked = 0
+    invalid = {}
+    for quiz_ids in iter_quiz_id_chunks(db, chunk_size):
+        checked += len(quiz_ids)
+        invalid.update({
+            quiz_id: result for quiz_id, result in validate_quizzes(db, quiz_ids).items() if not result["valid"]
+        })
+    return checked, invalid
+
+def validate_quiz(db: Session, quiz_id: int) -> dict:
+    """
+    퀴즈 하나를 검증하는 함수 (모든 위반 항목을 violations 로 함께 반환)
+    """
+    return validate_quizzes(db, [quiz_id])[quiz_id]
@@ -1,8 +1,25 @@
+import logging
+import time
+
+import redis
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.utils.utils import redis_client
 from typing import Optional, List
 
+logger = logging.getLogger(__name__)
+
+# 토큰 버전이 바뀌는 필드 (권한, 활성 상태, 비밀번호)
+TOKEN_VERSION_FIELDS = ("is_superuser", "is_active", "password")
+
+def token_version_key(user_id: int) -> str:
+    return f"user:{user_id}:token_version"
+
+def used_refresh_token_key(jti: str) -> str:
+    return f"refresh_token:{jti}:used"
+
 def get_user(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
@@ -12,6 +29,66 @@ def get_user_by_username(db: Session, name: str) -> Optional[User]:
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
+def get_token_version(db: Session, user_id: int) -> Optional[int]:
+    """
+    사용자의 현재 토큰 버전을 반환하는 함수 (사용자가 없으면 None)
+
+    Redis 에 값이 있으면 GET 한 번으로 끝나고, 없거나 Redis 장애 시에만 DB 값을 사용합니다.
+    """
+    key = token_version_key(user_id)
+    redis_available = True
+    try:
+        version = redis_client.get(key)
+        if version is not None:
+            return int(version)
+    except redis.RedisError:
+        redis_available = False
+
+    user = get_user(db, user_id=user_id)
+    if user is None:
+        return None
+    version = user.token_version or 0
+    if redis_available:
+        try:
+            # 동시에 버전이 올라간 경우 덮어쓰지 않도록 NX 로 채웁니다.
+            redis_client.set(key, version, nx=True, ex=settings.TOKEN_VERSION_CACHE_TTL)
+        except redis.RedisError:
+            pass
+    return version
+
+def publish_token_version(user_id: int, version: Optional[int]):
+    """
+    토큰 버전을 Redis 에 반영하는 함수 (version 이 None 이면 키를 삭제)
+
+    반영에 실패해도 키에 TTL 이 있으므로 TOKEN_VERSION_CACHE_TTL 초 안에 DB 값으로 다시 채워집니다.
+    """
+    try:
+        if version is None:
+            redis_client.delete(token_version_key(user_id))
+        else:
+            redis_client.set(token_version_key(user_id), version, ex=settings.TOKEN_VERSION_CACHE_TTL)
+    except redis.RedisError:
+        logger.error("Failed to publish token version of user %s", user_id)
+
+def revoke_user_tokens(db: Session, db_user: User) -> User:
+    """
+    토큰 버전을 올려 사용자의 모든 액세스/리프레시 토큰을 무효화하는 함수
+    """
+    db_user.token_version = (db_user.token_version or 0) + 1
+    db.commit()
+    db.refresh(db_user)
+    publish_token_version(db_user.id, db_user.token_version)
+    return db_user
+
+def mark_refresh_token_used(jti: str, expires_at: int) -> bool:
+    """
+    리프레시 토큰(jti)을 사용 처리하는 함수 (이미 사용된 토큰이면 False)
+
+    키는 토큰 만료 시각까지만 유지합니다. Redis 장애는 호출자에게 전달합니다.
+    """
+    ttl = max(1, int(expires_at - time.time()))
+    return bool(redis_client.set(used_refresh_token_key(jti), 1, nx=True, ex=ttl))
+
 def get_users(db: Session, page: int = 0, page_size: int = 10) -> List[User]:
     offset = page * page_size
     return db.query(User).offset(offset).limit(page_size).all()
@@ -33,6 +110,10 @@ def create_user(db: Session, user_in: UserCreate) -> User:
 def update_user(db: Session, db_user: User, user_in: UserUpdate) -> User:
     from app.core.security import get_password_hash
     update_data = user_in.dict(exclude_unset=True)
+    revoke = any(
+        field in update_data and (field == "password" or getattr(db_user, field) != update_data[field])
+        for field in TOKEN_VERSION_FIELDS
+    )
     
     if "password" in update_data:
         hashed_password = get_password_hash(update_data["password"])
@@ -41,13 +122,20 @@ def update_user(db: Session, db_user: User, user_in: UserUpdate) -> User:
     
     for field, value in update_data.items():
         setattr(db_user, field, value)
+
+    # 권한/상태가 바뀌면 토큰 버전을 올려 기존 토큰을 즉시 무효화합니다.
+    if revoke:
+        db_user.token_version = (db_user.token_version or 0) + 1
     
     db.commit()
     db.refresh(db_user)
+    if revoke:
+        publish_token_version(db_user.id, db_user.token_version)
     return db_user
 
 def delete_user(db: Session, user_id: int) -> User:
     user = db.query(User).filter(User.id == user_id).first()
     db.delete(user)
     db.commit()
+    publish_token_version(user_id, None)
     return user
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Postgres 월 단위 범위 파티션 관리
+
+user_quiz_attempt_answers 는 created_at 기준으로 파티션되어 있습니다. (alembic 0002)
+- 파티션 이름은 {테이블}_{YYYYMM}, 범위에 맞는 파티션이 없는 행은 {테이블}_default 에 들어갑니다.
+- 앞으로 쓸 파티션은 미리 만들어 두고(ensure_monthly_partitions), 보관 후 비어 있는 지난 파티션은 지웁니다.
+"""
+import re
+from datetime import date
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+ATTEMPT_ANSWERS_TABLE = "user_quiz_attempt_answers"
+
+def month_start(day: date, offset: int = 0) -> date:
+    """
+    day 가 속한 달에서 offset 개월 뒤 달의 1일
+    """
+    index = day.year * 12 + day.month - 1 + offset
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(table: str, start: date) -> str:
+    return f"{table}_{start:%Y%m}"
+
+def list_partitions(conn: Connection, table: str) -> List[str]:
+    rows = conn.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = :table"
+    ), {"table": table})
+    return sorted(name for (name,) in rows)
+
+def ensure_monthly_partitions(conn: Connection, table: str, today: date, months_ahead: int) -> List[str]:
+    """
+    이번 달부터 months_ahead 개월 뒤까지의 파티션을 만들고, 새로 만든 파티션 이름을 반환하는 함수
+    """
+    existing = set(list_partitions(conn, table))
+    created = []
+    for offset in range(months_ahead + 1):
+        start = month_start(today, offset)
+        name = partition_name(table, start)
+        if name in existing:
+            continue
+        conn.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{month_start(start, 1).isoformat()}')"
+        ))
+        created.append(name)
+    return created
+
+def drop_empty_partitions(conn: Connection, table: str, before: date) -> List[str]:
+    """
+    범위가 before 이전에 끝나는 비어 있는 월 파티션을 지우고, 지운 파티션 이름을 반환하는 함수
+    """
+    pattern = re.compile(rf"^{re.escape(table)}_(\d{{4}})(\d{{2}})$")
+    dropped = []
+    for name in list_partitions(conn, table):
+        match = pattern.match(name)
+        if not match:
+            continue
+        start = date(int(match.group(1)), int(match.group(2)), 1)
+        if month_start(start, 1) > before:
+            continue
+        if conn.execute(text(f"SELECT 1 FROM {name} LIMIT 1")).first() is not None:
+            continue
+        conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
@@ -0,0 +1,211 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+import redis
+from redis.backoff import ExponentialBackoff
+from redis.client import Pipeline
+from redis.exceptions import ConnectionError, TimeoutError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+class RedisCircuitOpenError(ConnectionError):
+    """
+    서킷 브레이커가 열려 있어 Redis 호출을 바로 실패시킬 때 발생하는 예외
+    """
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 회 이상이면 reset_timeout 초 동안 호출을 차단하고,
+    이후 한 번의 시험 호출(half-open)이 성공하면 다시 닫히는 서킷 브레이커
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("Redis circuit breaker opened after %s failures", self.failures)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+# 다시 보내도 결과가 같은 명령만 재시도합니다.
+# (INCR, HINCRBY, HSET, EVALSHA, SET NX 등은 타임아웃이 나도 서버에서 이미 실행되었을 수 있어 재시도하지 않습니다.)
+RETRYABLE_COMMANDS = frozenset({
+    "BITCOUNT", "DBSIZE", "EXISTS", "GET", "GETBIT", "HEXISTS", "HGET", "HGETALL", "HLEN", "HMGET", "INFO",
+    "LLEN", "LRANGE", "MGET", "PING", "PTTL", "SCAN", "SCARD", "SISMEMBER", "SMEMBERS", "STRLEN", "TTL", "TYPE",
+    "ZCARD", "ZCOUNT", "ZRANGE", "ZRANGEBYSCORE", "ZRANK", "ZSCORE",
+    "DEL", "EXPIRE", "PEXPIRE", "PSETEX", "SETEX", "UNLINK",
+})
+# SET 은 옵션 없이 쓸 때만 재시도합니다.
+NON_RETRYABLE_SET_OPTIONS = frozenset({"NX", "XX", "GET", "KEEPTTL"})
+
+def is_retryable_command(args) -> bool:
+    name = str(args[0]).upper()
+    if name == "SET":
+        return not any(str(arg).upper() in NON_RETRYABLE_SET_OPTIONS for arg in args[3:])
+    return name in RETRYABLE_COMMANDS
+
+class ResilientPipeline(Pipeline):
+    """
+    execute() 를 서킷 브레이커로 감싼 파이프라인 (여러 명령을 묶어 보내므로 재시도하지 않음)
+    """
+
+    breaker: CircuitBreaker
+
+    def execute(self, raise_on_error=True):
+        if not self.breaker.allow():
+            self.reset()
+            raise RedisCircuitOpenError("Redis circuit breaker is open")
+        try:
+            result = super().execute(raise_on_error)
+        except (ConnectionError, TimeoutError):
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+class ResilientRedis(redis.Redis):
+    """
+    명령을 서킷 브레이커로 감싸고, 읽기/멱등 명령만 재시도(exponential backoff)하는 Redis 클라이언트
+
+    재시도는 커넥션 단위 Retry 대신 명령 단위로 수행합니다.
+    (redis-py 의 커넥션 Retry 와 health check 를 함께 쓰면 연결 직후 끊기는 서버에서 재귀 호출이 끝나지 않습니다.)
+    pipeline() 은 서킷 브레이커만 거치고 재시도하지 않습니다.
+    pubsub() 은 서킷 브레이커 밖에 있습니다. (구독 스레드가 끊기면 직접 다시 연결합니다.)
+    """
+
+    breaker: CircuitBreaker
+    backoff: ExponentialBackoff
+    retry_attempts: int = 0
+
+    def execute_command(self, *args, **options):
+        attempt = 0
+        retry_attempts = self.retry_attempts if is_retryable_command(args) else 0
+        while True:
+            if not self.breaker.allow():
+                raise RedisCircuitOpenError("Redis circuit breaker is open")
+            try:
+                result = super().execute_command(*args, **options)
+            except (ConnectionError, TimeoutError):
+                self.breaker.record_failure()
+                attempt += 1
+                if attempt > retry_attempts:
+                    raise
+                time.sleep(self.backoff.compute(attempt))
+                continue
+            self.breaker.record_success()
+            return result
+
+    def pipeline(self, transaction=True, shard_hint=None) -> ResilientPipeline:
+        pipe = ResilientPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+        pipe.breaker = self.breaker
+        return pipe
+
+def create_redis_client(url: Optional[str] = None) -> ResilientRedis:
+    """
+    설정값으로 커넥션 풀, 타임아웃, 재시도, 서킷 브레이커를 구성한 Redis 클라이언트를 생성하는 함수
+
+    풀이 가득 차면 REDIS_POOL_TIMEOUT 초만 기다린 뒤 ConnectionError 를 발생시킵니다.
+    """
+    pool = redis.BlockingConnectionPool.from_url(
+        url or settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        decode_responses=True,
+    )
+    client = ResilientRedis(connection_pool=pool)
+    client.retry_attempts = settings.REDIS_RETRY_ATTEMPTS
+    client.backoff = ExponentialBackoff(cap=settings.REDIS_RETRY_BACKOFF_CAP, base=settings.REDIS_RETRY_BACKOFF_BASE)
+    client.breaker = CircuitBreaker(
+        failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout=settings.REDIS_BREAKER_RESET_TIMEOUT,
+    )
+    return client
+
+class LazyRedisClient:
+    """
+    처음 사용할 때 factory 로 Redis 클라이언트를 생성하는 프록시
+
+    `from app.utils.utils import redis_client` 로 가져가도 import 시점에는 클라이언트가 만들어지지 않습니다.
+    """
+
+    def __init__(self, factory: Callable[[], ResilientRedis]):
+        self._factory = factory
+        self._client: Optional[ResilientRedis] = None
+        self._lock = threading.Lock()
+
+    @property
+    def initialized(self) -> bool:
+        return self._client is not None
+
+    def get_client(self) -> ResilientRedis:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._factory()
+        return self._client
+
+    def close(self):
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.connection_pool.disconnect()
+
+    def __getattr__(self, name):
+        return getattr(self.get_client(), name)
+
+def get_redis_pool_stats(client: ResilientRedis) -> dict:
+    """
+    커넥션 풀 사용량과 서킷 브레이커 상태를 반환하는 함수
+    """
+    pool = client.connection_pool
+    created = len(getattr(pool, "_connections", []))
+    queue = getattr(getattr(pool, "pool", None), "queue", [])
+    idle = sum(1 for connection in queue if connection is not None)
+    max_connections = pool.max_connections
+    breaker = client.breaker
+    return {
+        "max_connections": max_connections,
+        "created_connections": created,
+        "idle_connections": idle,
+        "in_use_connections": created - idle,
+        "utilization": round((created - idle) / max_connections, 4) if max_connections else 0.0,
+        "breaker_state": breaker.state,
+        "breaker_failures": breaker.failures,
+        "breaker_rejected": breaker.rejected,
+    }
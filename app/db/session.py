@@ -1,4 +1,7 @@
+import threading
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
@@ -6,11 +9,65 @@ from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
+def engine_options(url: str) -> dict:
+    """
+    워커(프로세스)별 커넥션 풀 설정
+
+    전체 DB 연결 수는 워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) 이므로
+    Postgres max_connections 에 맞춰 설정합니다.
+    """
+    options = {"echo": settings.DB_ECHO}
+    if not url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+    return options
+
+_engine = None
+_engine_lock = threading.Lock()
+
+class LazySessionMaker(sessionmaker):
+    """
+    처음 세션을 만들 때 엔진을 생성하여 바인딩하는 sessionmaker
+    """
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None and local_kw.get("bind") is None:
+            get_engine()
+        return super().__call__(**local_kw)
+
 # 동기
-engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = LazySessionMaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
+def get_engine() -> Engine:
+    """
+    엔진(커넥션 풀)을 처음 사용할 때 생성하는 함수
+
+    import 시점에는 DB 드라이버를 불러오지 않으므로, 테스트/CLI 는 DB 없이도 모듈을 불러올 수 있습니다.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+def dispose_engine():
+    if _engine is not None:
+        _engine.dispose()
+
+def __getattr__(name):
+    # 기존 코드의 `from app.db.session import engine` 호환
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,13 +1,55 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 
 from app.api.v1.router import router
+from app.core.config import settings
+from app.tasks.auto_submit import AutoSubmitWorker
+from app.tasks.prepare import QuizPrepareWorker
+from app.tasks.write_behind import WriteBehindWorker
+from app.utils.cache import CacheInvalidationListener
+from app.utils.inflight import submissions
+from app.utils.rate_limit import AdmissionMiddleware
+from app.core.security import get_pwd_context
+from app.db.session import dispose_engine, get_engine
 from app.utils.utils import redis_client
 
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # import 시점이 아닌 서버 시작 시점에 DB 엔진, Redis 클라이언트, 해시 컨텍스트를 만듭니다.
+    get_engine()
+    redis_client.get_client()
+    get_pwd_context()
+
+    workers = []
+    if settings.CACHE_PUBSUB_ENABLED:
+        workers.append(CacheInvalidationListener())
+    if settings.WRITE_BEHIND_ENABLED:
+        workers.append(WriteBehindWorker())
+    if settings.AUTO_SUBMIT_ENABLED:
+        workers.append(AutoSubmitWorker())
+    if settings.QUIZ_PREPARE_ENABLED:
+        workers.append(QuizPrepareWorker())
+    for worker in workers:
+        worker.start()
+    yield
+    # 진행 중인 제출이 끝난 뒤 백그라운드 작업을 멈춥니다. (마지막 write-behind 포함)
+    if not submissions.wait_idle(settings.SHUTDOWN_DRAIN_TIMEOUT):
+        logger.warning("Shutdown with %s submissions still in flight", submissions.count)
+    for worker in workers:
+        worker.stop()
+    dispose_engine()
+    redis_client.close()
+
 app = FastAPI(
     title="SJH_Quiz",
     description="Project",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 def custom_openapi():
@@ -29,4 +71,6 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+app.add_middleware(AdmissionMiddleware)
+
 app.include_router(router, prefix="/api/v1")
\ No newline at end of file
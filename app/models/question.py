@@ -1,6 +1,9 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
-from sqlalchemy import event
+from sqlalchemy import BigInteger, Column, DDL, Index, Integer, LargeBinary, String, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import event, func, literal_column
+# func.to_tsvector 등 Postgres 텍스트 검색 함수를 등록합니다.
+from sqlalchemy.dialects import postgresql  # noqa: F401
 from sqlalchemy.orm import relationship, Session
+from app.core.config import settings
 from app.db.session import Base
 
 class Question(Base):
@@ -10,14 +13,107 @@ class Question(Base):
     quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False)
     text = Column(String, nullable=False)
     order = Column(Integer, nullable=False)
+    category = Column(String(100), nullable=True, index=True)
+    difficulty = Column(Integer, nullable=True, index=True)
 
     quiz = relationship("Quiz", back_populates="questions")
     choices = relationship("Choice", back_populates="question")
     answers = relationship("UserQuizAttemptAnswer", back_populates="question")
+    tag_links = relationship("QuestionTag", back_populates="question", cascade="all, delete-orphan")
+    search_document = relationship("QuestionSearchDocument", uselist=False, cascade="all, delete-orphan")
+    signature = relationship("QuestionSignature", uselist=False, cascade="all, delete-orphan")
+    lsh_buckets = relationship("QuestionLshBucket", cascade="all, delete-orphan")
+
+    @property
+    def tags(self):
+        return sorted(link.tag for link in self.tag_links)
+
+class QuestionTag(Base):
+    """
+    문제 풀(주제, 난이도 등)을 구성하는 태그
+    """
+    __tablename__ = "question_tags"
+    __table_args__ = (UniqueConstraint("question_id", "tag", name="uq_question_tags_question_id_tag"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False, index=True)
+    tag = Column(String(50), nullable=False, index=True)
+
+    question = relationship("Question", back_populates="tag_links")
 
 @event.listens_for(Question, "before_insert")
 def set_question_order(mapper, connection, target):
     session = Session.object_session(target)
     if session is not None:
         max_order = session.query(Question.order).filter_by(quiz_id=target.quiz_id).order_by(Question.order.desc()).first()
-        target.order = (max_order[0] + 1) if max_order else 1
\ No newline at end of file
+        target.order = (max_order[0] + 1) if max_order else 1
+
+class QuestionSignature(Base):
+    """
+    중복 판별용 문제 서명 (정규화한 문장의 sha256 + MinHash 서명)
+    """
+    __tablename__ = "question_signatures"
+    __table_args__ = (Index("ix_question_signatures_quiz_id_text_hash", "quiz_id", "text_hash"),)
+
+    question_id = Column(Integer, ForeignKey("questions.id"), primary_key=True)
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False)
+    text_hash = Column(String(64), nullable=False)
+    minhash = Column(LargeBinary, nullable=False)
+
+class QuestionLshBucket(Base):
+    """
+    MinHash 서명의 LSH 밴드 버킷, 같은 퀴즈에서 (band, bucket) 이 같은 문제가 유사 중복 후보입니다.
+    """
+    __tablename__ = "question_lsh_buckets"
+    __table_args__ = (Index("ix_question_lsh_buckets_quiz_id_band_bucket", "quiz_id", "band", "bucket"),)
+
+    id = Column(Integer, primary_key=True)
+    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False, index=True)
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False)
+    band = Column(Integer, nullable=False)
+    bucket = Column(BigInteger, nullable=False)
+
+def search_vector(document):
+    # GIN 인덱스와 검색 쿼리가 같은 식을 쓰도록 설정 이름을 리터럴로 넣습니다.
+    return func.to_tsvector(literal_column(f"'{settings.SEARCH_TEXT_CONFIG}'"), document)
+
+class QuestionSearchDocument(Base):
+    """
+    문제 검색용 문서 (문제 내용 + 선택지 내용), 문제/선택지 CRUD 에서 같은 트랜잭션으로 갱신합니다.
+
+    - Postgres: to_tsvector(SEARCH_TEXT_CONFIG, document) GIN 인덱스
+    - SQLite: FTS5 가상 테이블(question_search_fts)을 트리거로 동기화
+    """
+    __tablename__ = "question_search_documents"
+
+    question_id = Column(Integer, ForeignKey("questions.id"), primary_key=True)
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False, index=True)
+    document = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_question_search_documents_tsv",
+            search_vector(document),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+SQLITE_FTS_TABLE = "question_search_fts"
+
+for statement in (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "document, content='question_search_documents', content_rowid='question_id')",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON question_search_documents BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, document) VALUES (new.question_id, new.document); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON question_search_documents BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, document) VALUES ('delete', old.question_id, old.document); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE ON question_search_documents BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, document) VALUES ('delete', old.question_id, old.document); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, document) VALUES (new.question_id, new.document); END",
+):
+    event.listen(QuestionSearchDocument.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    QuestionSearchDocument.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, JSON, String, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.db.session import Base
 
@@ -10,6 +10,12 @@ class Quiz(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     question_count = Column(Integer, nullable=True, default=None)
+    # 응시 제한 시간(분), None 이면 제한 없음
+    duration_minutes = Column(Integer, nullable=True, default=None)
+    # 문제 추출 시 층화 기준 ("category" / "difficulty"), None 이면 단순 무작위 추출
+    stratify_by = Column(String(20), nullable=True, default=None)
+    # 출제 구성표 ([{"tags": ["algebra", "easy"], "count": 5}, ...]), 지정하면 question_count 대신 사용
+    blueprint = Column(JSON, nullable=True, default=None)
 
     user = relationship("User", back_populates="quizzes")
     questions = relationship("Question", back_populates="quiz")
@@ -1,7 +1,11 @@
+from datetime import datetime
+
 import pytz
 KST = pytz.timezone('Asia/Seoul')
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import JSON, BigInteger, Boolean, Column, DDL, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -15,6 +19,7 @@ class User(Base):
     password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())    
 
@@ -35,11 +40,17 @@ class UserQuizRegistration(Base):
 
 class UserQuizAttempt(Base):
     __tablename__ = "user_quiz_attempts"
+    # 진행 중인 응시 조회 (/start 재개), 마감이 지난 미제출 응시 조회 (자동 제출 복구)
+    __table_args__ = (
+        Index("ix_user_quiz_attempts_user_id_quiz_id_is_submit", "user_id", "quiz_id", "is_submit"),
+        Index("ix_user_quiz_attempts_is_submit_deadline_at", "is_submit", "deadline_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     quiz_id = Column(Integer, ForeignKey("quizzes.id"))
     attempted_at = Column(DateTime, server_default=func.now())
+    deadline_at = Column(DateTime, nullable=True)
     is_submit = Column(Boolean, nullable=False, default=False)
 
     quiz = relationship("Quiz", back_populates="attempts")
@@ -60,17 +71,64 @@ class UserQuizAttemptQuestion(Base):
     __table_args__ = (UniqueConstraint('attempt_id', 'question_id', name='uq_attempt_question'),)
 
 class UserQuizAttemptAnswer(Base):
+    """
+    제출된 답안 (제공된 선택지당 한 행, STORE_ANSWER_ROWS 가 켜져 있을 때만 저장)
+
+    기본 저장 형식은 UserQuizAttemptSnapshot.answer_sheet 입니다. (app.utils.answer_sheet)
+
+    Postgres 에서는 created_at 기준 월 단위 범위 파티션 테이블이고 기본 키는 (id, created_at) 입니다. (alembic 0002)
+    SQLite 는 복합 기본 키에 자동 증가를 쓸 수 없어 테이블 기본 키는 id 이고, ORM 식별자는 두 DB 모두 (id, created_at) 입니다.
+    오래된 응시는 app.tasks.archive 가 UserQuizAttemptArchive 로 압축하고 이 테이블에서 지웁니다.
+    """
     __tablename__ = "user_quiz_attempt_answers"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_quiz_attempt_id = Column(Integer, ForeignKey("user_quiz_attempts.id"), nullable=False)
+    user_quiz_attempt_id = Column(Integer, ForeignKey("user_quiz_attempts.id"), nullable=False, index=True)
     question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
     choice_id = Column(Integer, ForeignKey("choices.id"), nullable=False)
+    # 식별자에 포함되므로 INSERT 전에 값을 정합니다. (SQLite 는 server_default 로 저장된 값을 같은 값으로 다시 조회할 수 없음)
+    created_at = Column(DateTime, nullable=False, default=datetime.now, server_default=func.now())
+
+    __mapper_args__ = {"primary_key": [id, created_at]}
         
     user_quiz_attempt = relationship("UserQuizAttempt", back_populates="answers")
     question = relationship("Question", back_populates="answers")
     choice = relationship("Choice", back_populates="answers")
 
+# create_all 로 만든 Postgres 테이블도 alembic 0002 와 같은 기본 키를 씁니다.
+event.listen(
+    UserQuizAttemptAnswer.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE user_quiz_attempt_answers DROP CONSTRAINT user_quiz_attempt_answers_pkey, "
+        "ADD CONSTRAINT user_quiz_attempt_answers_pkey PRIMARY KEY (id, created_at)"
+    ).execute_if(dialect="postgresql"),
+)
+
+class UserQuizAttemptSnapshot(Base):
+    __tablename__ = "user_quiz_attempt_snapshots"
+
+    attempt_id = Column(Integer, ForeignKey("user_quiz_attempts.id"), primary_key=True)
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False)
+    # 응시자에게 제공된 문제/선택지 순서 (ID 만 저장) {"questions": [[question_id, [choice_id, ...]], ...]}
+    payload = Column(Text, nullable=False)
+    # 스냅샷을 만들 때의 퀴즈 컨텐츠 버전 (Redis 장애 시 None)
+    content_version = Column(BigInteger, nullable=True)
+    # 제출된 답안지 (app.utils.answer_sheet, payload 의 문제 순서와 같은 순서)
+    answer_sheet = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+class UserQuizAttemptProgress(Base):
+    __tablename__ = "user_quiz_attempt_progress"
+
+    id = Column(Integer, primary_key=True, index=True)
+    attempt_id = Column(Integer, ForeignKey("user_quiz_attempts.id"), nullable=False)
+    question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
+    choice_id = Column(Integer, ForeignKey("choices.id"), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (UniqueConstraint('attempt_id', 'question_id', name='uq_attempt_progress_question'),)
+
 class UserQuizScore(Base):
     __tablename__ = "user_quiz_scores"
 
@@ -79,4 +137,34 @@ class UserQuizScore(Base):
     score = Column(Integer, nullable=False)
     total = Column(Integer, nullable=False)
 
-    user_quiz_attempt = relationship("UserQuizAttempt", backref="score")
\ No newline at end of file
+    user_quiz_attempt = relationship("UserQuizAttempt", backref="score")
+
+# Postgres 는 정수 배열, 그 밖의 데이터베이스(테스트용 SQLite)는 JSON 배열
+IntArray = JSON().with_variant(postgresql.ARRAY(Integer), "postgresql")
+
+class UserQuizAttemptArchive(Base):
+    """
+    보관된 응시 (응시 한 건 = 한 행)
+
+    답안 행 대신 문제 순서대로 정수 배열을 저장합니다.
+    question_ids[i] 문제에는 choice_ids 에서 choice_counts[i] 개의 선택지가 이어서 저장되어 있습니다.
+    """
+    __tablename__ = "user_quiz_attempt_archives"
+    __table_args__ = (
+        # 특정 문제가 포함된 응시 검색 (question_ids @> ARRAY[...])
+        Index("ix_user_quiz_attempt_archives_question_ids", "question_ids", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
+    attempt_id = Column(Integer, ForeignKey("user_quiz_attempts.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    quiz_id = Column(Integer, ForeignKey("quizzes.id"), nullable=False, index=True)
+    attempted_at = Column(DateTime)
+    archived_at = Column(DateTime, nullable=False, server_default=func.now())
+    score = Column(Integer)
+    total = Column(Integer)
+    question_ids = Column(IntArray, nullable=False)
+    choice_counts = Column(IntArray, nullable=False)
+    choice_ids = Column(IntArray, nullable=False)
+    # 스냅샷에서 옮긴 컨텐츠 버전과 답안지 (question_ids 순서)
+    content_version = Column(BigInteger, nullable=True)
+    answer_sheet = Column(LargeBinary, nullable=True)
@@ -24,3 +24,16 @@ class LoginRequest(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = None
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+class TokenPrincipal(BaseModel):
+    """
+    JWT 클레임만으로 구성한 인증 사용자 정보 (DB 조회 없음)
+    """
+    id: int
+    is_superuser: bool = False
+    is_active: bool = True
+    token_version: int = 0
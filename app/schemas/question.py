@@ -8,16 +8,37 @@ class QuestionBase(BaseModel):
 class QuestionCreate(QuestionBase):
     quiz_id: int    
     text: str    
+    category: Optional[str] = None
+    difficulty: Optional[int] = None
+    tags: Optional[List[str]] = None
 
 class QuestionUpdate(BaseModel):
     text: Optional[str] = None
+    category: Optional[str] = None
+    difficulty: Optional[int] = None
+    tags: Optional[List[str]] = None
 
 class QuestionResponse(QuestionBase):
     id: int
     quiz_id: int
     order: int
     text: str
+    category: Optional[str] = None
+    difficulty: Optional[int] = None
+    tags: List[str] = []
     choices: List[ChoiceResponse]
     
     class Config:
         from_attributes = True
+
+class QuestionSearchResult(BaseModel):
+    question_id: int
+    quiz_id: int
+    text: str
+    rank: float
+
+class QuestionSearchResponse(BaseModel):
+    items: List[QuestionSearchResult]
+    offset: int
+    limit: int
+    has_more: bool
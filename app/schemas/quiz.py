@@ -1,13 +1,23 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
-from typing import List, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Any, Literal
 from typing import Optional
 
 from app.schemas.choice import ChoiceResponse
 
+class QuizBlueprintItem(BaseModel):
+    # 모든 태그를 가진 문제 중에서 count 개를 뽑습니다. (빈 목록이면 전체 문제)
+    tags: List[str] = []
+    count: int = Field(..., ge=1)
+
 class QuizBase(BaseModel):
     title: str
     description: Optional[str] = None
+    duration_minutes: Optional[int] = None
+    # 응시마다 출제할 문제 수 (None 이면 전체), 층화 추출 기준
+    question_count: Optional[int] = Field(None, ge=1)
+    stratify_by: Optional[Literal["category", "difficulty"]] = None
+    blueprint: Optional[List[QuizBlueprintItem]] = None
 
 class QuizCreate(QuizBase):
     pass
@@ -50,6 +60,9 @@ class QuizAttemptResponse(QuizAttemptCreate):
 
     model_config = ConfigDict(from_attributes=True)
 
+class QuizValidateRequest(BaseModel):
+    quiz_ids: Optional[List[int]] = None
+
 class QuizAnswerRequest(BaseModel):
     quiz_attempt_id: int
     question_id: int
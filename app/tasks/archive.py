@@ -0,0 +1,142 @@
+"""
+오래된 응시 보관 (답안 행을 응시당 한 행으로 압축)
+
+    python -m app.tasks.archive [--older-than-days 90] [--batch-size 500]
+
+응시 시작 후 --older-than-days 일이 지난 제출 완료 응시를 batch 단위로 UserQuizAttemptArchive 에 옮깁니다.
+- 제공된 문제/선택지 순서를 정수 배열(question_ids, choice_counts, choice_ids)로 저장하고 점수와 답안지를 함께 복사합니다.
+- 옮긴 응시의 답안, 제공 문제, 스냅샷 행은 지우므로 hot 테이블 크기는 보관 기간 안의 응시로 제한됩니다.
+- batch 마다 커밋하므로 중간에 멈춰도 다시 실행하면 이어서 진행합니다.
+
+Postgres 에서는 앞으로 쓸 답안 파티션을 미리 만들고, 보관으로 비어 있는 지난 파티션을 지웁니다.
+cron 등으로 하루 한 번 실행하는 것을 권장합니다.
+"""
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.partitions import ATTEMPT_ANSWERS_TABLE, drop_empty_partitions, ensure_monthly_partitions
+from app.db.session import SessionLocal
+from app.utils.answer_sheet import layout_to_arrays
+from app.models.user import (
+    UserQuizAttempt, UserQuizAttemptAnswer, UserQuizAttemptArchive, UserQuizAttemptProgress,
+    UserQuizAttemptQuestion, UserQuizAttemptSnapshot, UserQuizScore,
+)
+
+logger = logging.getLogger(__name__)
+
+def pack_attempt_answers(rows) -> dict:
+    """
+    (응시 ID, 문제 ID, 선택지 ID) 행을 응시별 정수 배열로 묶는 함수 (행은 응시 ID, 답안 ID 순)
+    """
+    packed = {}
+    for attempt_id, question_id, choice_id in rows:
+        arrays = packed.setdefault(attempt_id, {"question_ids": [], "choice_counts": [], "choice_ids": []})
+        if not arrays["question_ids"] or arrays["question_ids"][-1] != question_id:
+            arrays["question_ids"].append(question_id)
+            arrays["choice_counts"].append(0)
+        arrays["choice_counts"][-1] += 1
+        arrays["choice_ids"].append(choice_id)
+    return packed
+
+def archive_attempts(db: Session, before: datetime, batch_size: int = 500) -> int:
+    archived = 0
+    last_id = 0
+    while True:
+        attempts = (
+            db.query(UserQuizAttempt, UserQuizScore)
+            .outerjoin(UserQuizScore, UserQuizScore.user_quiz_attempt_id == UserQuizAttempt.id)
+            .outerjoin(UserQuizAttemptArchive, UserQuizAttemptArchive.attempt_id == UserQuizAttempt.id)
+            .filter(
+                UserQuizAttempt.id > last_id,
+                UserQuizAttempt.is_submit.is_(True),
+                UserQuizAttempt.attempted_at < before,
+                UserQuizAttemptArchive.attempt_id.is_(None),
+            )
+            .order_by(UserQuizAttempt.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not attempts:
+            return archived
+
+        attempt_ids = [attempt.id for attempt, _ in attempts]
+        packed = pack_attempt_answers(
+            db.query(UserQuizAttemptAnswer.user_quiz_attempt_id, UserQuizAttemptAnswer.question_id, UserQuizAttemptAnswer.choice_id)
+            .filter(UserQuizAttemptAnswer.user_quiz_attempt_id.in_(attempt_ids))
+            .order_by(UserQuizAttemptAnswer.user_quiz_attempt_id, UserQuizAttemptAnswer.id)
+        )
+        # 스냅샷이 있으면 스냅샷 순서와 답안지를, 없으면(예전 응시) 답안 행 순서를 보관합니다.
+        for snapshot in db.query(UserQuizAttemptSnapshot).filter(UserQuizAttemptSnapshot.attempt_id.in_(attempt_ids)):
+            question_ids, choice_counts, choice_ids = layout_to_arrays(json.loads(snapshot.payload)["questions"])
+            packed[snapshot.attempt_id] = {
+                "question_ids": question_ids,
+                "choice_counts": choice_counts,
+                "choice_ids": choice_ids,
+                "content_version": snapshot.content_version,
+                "answer_sheet": snapshot.answer_sheet,
+            }
+        empty = {"question_ids": [], "choice_counts": [], "choice_ids": []}
+        db.bulk_insert_mappings(UserQuizAttemptArchive, [
+            {
+                "attempt_id": attempt.id,
+                "user_id": attempt.user_id,
+                "quiz_id": attempt.quiz_id,
+                "attempted_at": attempt.attempted_at,
+                "score": score.score if score else None,
+                "total": score.total if score else None,
+                **packed.get(attempt.id, empty),
+            }
+            for attempt, score in attempts
+        ])
+        for model, column in (
+            (UserQuizAttemptAnswer, UserQuizAttemptAnswer.user_quiz_attempt_id),
+            (UserQuizAttemptQuestion, UserQuizAttemptQuestion.attempt_id),
+            (UserQuizAttemptProgress, UserQuizAttemptProgress.attempt_id),
+            (UserQuizAttemptSnapshot, UserQuizAttemptSnapshot.attempt_id),
+        ):
+            db.query(model).filter(column.in_(attempt_ids)).delete(synchronize_session=False)
+        db.commit()
+
+        archived += len(attempt_ids)
+        last_id = attempt_ids[-1]
+        logger.info("Archived %s attempts (last attempt id %s)", archived, last_id)
+
+def maintain_partitions(db: Session, before: datetime, months_ahead: int) -> dict:
+    """
+    Postgres 답안 파티션 관리 (다른 데이터베이스에서는 아무것도 하지 않음)
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return {"created": [], "dropped": []}
+    connection = db.connection()
+    result = {
+        "created": ensure_monthly_partitions(connection, ATTEMPT_ANSWERS_TABLE, datetime.now().date(), months_ahead),
+        "dropped": drop_empty_partitions(connection, ATTEMPT_ANSWERS_TABLE, before.date()),
+    }
+    db.commit()
+    return result
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="오래된 응시 보관")
+    parser.add_argument("--older-than-days", type=int, default=settings.ARCHIVE_AFTER_DAYS, help="응시 시작 후 보관까지의 일 수")
+    parser.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE, help="한 번에 보관할 응시 수")
+    args = parser.parse_args(argv)
+
+    before = datetime.now() - timedelta(days=args.older_than_days)
+    with SessionLocal() as db:
+        archived = archive_attempts(db, before, args.batch_size)
+        partitions = maintain_partitions(db, before, settings.ATTEMPT_PARTITION_MONTHS_AHEAD)
+    logger.info(
+        "Archived %s attempts before %s, created partitions %s, dropped partitions %s",
+        archived, before.isoformat(timespec="seconds"), partitions["created"], partitions["dropped"],
+    )
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(main())
@@ -0,0 +1,98 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.quiz import ATTEMPT_DEADLINES_KEY, read_overdue_attempts, schedule_attempt_deadline, submit_expired_attempt
+from app.db.session import SessionLocal
+from app.tasks.worker import PeriodicWorker
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+def claim_expired_attempts(batch_size: int, now: float = None) -> List[Tuple[int, int]]:
+    """
+    마감 시각(+유예 시간)이 지난 응시를 batch_size 개까지 가져오는 함수
+
+    ZRANGEBYSCORE 로 후보를 찾고 ZREM 에 성공한 항목만 가져가므로,
+    여러 워커가 동시에 실행되어도 한 응시는 한 워커만 처리합니다.
+    """
+    now = now if now is not None else time.time()
+    members = redis_client.zrangebyscore(
+        ATTEMPT_DEADLINES_KEY, "-inf", now - settings.AUTO_SUBMIT_GRACE_SECONDS, start=0, num=batch_size
+    )
+    if not members:
+        return []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for member in members:
+        pipe.zrem(ATTEMPT_DEADLINES_KEY, member)
+    claimed = []
+    for member, removed in zip(members, pipe.execute()):
+        if removed:
+            quiz_id, user_quiz_attempt_id = (int(value) for value in member.split(":"))
+            claimed.append((quiz_id, user_quiz_attempt_id))
+    return claimed
+
+def submit_expired_attempts(db: Session, batch_size: int = None) -> int:
+    """
+    마감된 응시를 채점 경로(grade_attempt)로 자동 제출하는 함수
+
+    처리한 후보 수를 반환합니다. 실패한 응시는 AUTO_SUBMIT_RETRY_SECONDS 초 뒤에 다시 시도하도록 예약합니다.
+    """
+    batch_size = batch_size or settings.AUTO_SUBMIT_BATCH_SIZE
+    claimed = claim_expired_attempts(batch_size)
+    for quiz_id, user_quiz_attempt_id in claimed:
+        try:
+            submit_expired_attempt(db, quiz_id, user_quiz_attempt_id)
+        except Exception:
+            db.rollback()
+            logger.exception("Auto submit failed for attempt %s", user_quiz_attempt_id)
+            # 유예 시간이 지나야 가져가므로 그만큼 당겨서 예약합니다.
+            retry_at = datetime.now() + timedelta(seconds=settings.AUTO_SUBMIT_RETRY_SECONDS - settings.AUTO_SUBMIT_GRACE_SECONDS)
+            schedule_attempt_deadline(quiz_id, user_quiz_attempt_id, retry_at)
+    return len(claimed)
+
+def reschedule_overdue_attempts(db: Session, batch_size: int = None) -> int:
+    """
+    마감이 지났는데 제출되지 않은 응시를 Postgres 에서 찾아 마감 sorted set 에 다시 넣는 함수
+
+    Redis 가 비워지면 마감 예약도 사라지므로 주기적으로 Postgres 기준으로 복구합니다.
+    이미 예약된 응시(재시도 대기 포함)는 ZADD NX 로 건드리지 않으며, 제출은 submit_expired_attempts 가 합니다.
+    다시 넣은 응시 수를 반환합니다.
+    """
+    batch_size = batch_size or settings.AUTO_SUBMIT_BATCH_SIZE
+    before = datetime.now() - timedelta(seconds=settings.AUTO_SUBMIT_GRACE_SECONDS)
+    overdue = read_overdue_attempts(db, before, batch_size)
+    if not overdue:
+        return 0
+    now = time.time()
+    added = redis_client.zadd(
+        ATTEMPT_DEADLINES_KEY,
+        {f"{quiz_id}:{user_quiz_attempt_id}": now - settings.AUTO_SUBMIT_GRACE_SECONDS for quiz_id, user_quiz_attempt_id in overdue},
+        nx=True,
+    )
+    if added:
+        logger.warning("Rescheduled %s overdue attempts missing from %s", added, ATTEMPT_DEADLINES_KEY)
+    return added
+
+class AutoSubmitWorker(PeriodicWorker):
+    """
+    AUTO_SUBMIT_INTERVAL 초마다 마감된 응시를 자동 제출하는 백그라운드 스레드
+    """
+
+    def __init__(self, interval: float = None, batch_size: int = None):
+        super().__init__("auto-submit", interval or settings.AUTO_SUBMIT_INTERVAL)
+        self.batch_size = batch_size or settings.AUTO_SUBMIT_BATCH_SIZE
+        self._next_sweep = 0.0
+
+    def run_once(self):
+        with SessionLocal() as db:
+            if time.monotonic() >= self._next_sweep:
+                self._next_sweep = time.monotonic() + settings.AUTO_SUBMIT_SWEEP_INTERVAL
+                reschedule_overdue_attempts(db, self.batch_size)
+            while submit_expired_attempts(db, self.batch_size) == self.batch_size:
+                pass
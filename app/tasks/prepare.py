@@ -0,0 +1,88 @@
+"""
+시험 시작 전 퀴즈 준비 (캐시 미리 적재)
+
+    python -m app.tasks.prepare --quiz-id 1 2 [--pin-seconds 14400]
+
+관리자 API(POST /quiz/{quiz_id}/prepare)에 시작 시각을 넘기면 QUIZ_PREPARE_SCHEDULE_KEY 에 예약되고,
+QuizPrepareWorker 가 시작 QUIZ_PREPARE_LEAD_SECONDS 초 전에 prepare_quiz 를 실행합니다.
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.quiz import QUIZ_PREPARE_SCHEDULE_KEY, prepare_quiz
+from app.db.session import SessionLocal
+from app.tasks.worker import PeriodicWorker
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+def claim_due_preparations(now: float = None) -> List[int]:
+    """
+    준비할 시각이 지난 퀴즈를 가져오는 함수
+
+    ZREM 에 성공한 항목만 가져가므로 여러 워커가 동시에 실행되어도 한 퀴즈는 한 워커만 준비합니다.
+    """
+    now = now if now is not None else time.time()
+    members = redis_client.zrangebyscore(QUIZ_PREPARE_SCHEDULE_KEY, "-inf", now)
+    if not members:
+        return []
+
+    pipe = redis_client.pipeline(transaction=False)
+    for member in members:
+        pipe.zrem(QUIZ_PREPARE_SCHEDULE_KEY, member)
+    return [int(member) for member, removed in zip(members, pipe.execute()) if removed]
+
+def prepare_due_quizzes(db: Session) -> int:
+    claimed = claim_due_preparations()
+    for quiz_id in claimed:
+        try:
+            report = prepare_quiz(db, quiz_id)
+        except Exception:
+            db.rollback()
+            logger.exception("Scheduled preparation failed for quiz %s", quiz_id)
+            continue
+        if report is None:
+            logger.warning("Scheduled preparation skipped, quiz %s not found", quiz_id)
+    return len(claimed)
+
+class QuizPrepareWorker(PeriodicWorker):
+    """
+    QUIZ_PREPARE_INTERVAL 초마다 예약된 퀴즈 준비를 실행하는 백그라운드 스레드
+    """
+
+    def __init__(self, interval: float = None):
+        super().__init__("quiz-prepare", interval or settings.QUIZ_PREPARE_INTERVAL)
+
+    def run_once(self):
+        with SessionLocal() as db:
+            prepare_due_quizzes(db)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="시험 시작 전 퀴즈 준비")
+    parser.add_argument("--quiz-id", type=int, nargs="+", required=True, help="준비할 퀴즈 ID")
+    parser.add_argument("--pin-seconds", type=int, default=settings.QUIZ_PREPARE_PIN_SECONDS, help="미리 적재한 값 유지 시간(초)")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    with SessionLocal() as db:
+        for quiz_id in args.quiz_id:
+            report = prepare_quiz(db, quiz_id, args.pin_seconds)
+            if report is None:
+                logger.error("Quiz %s not found", quiz_id)
+                failed += 1
+                continue
+            logger.info(
+                "quiz %s: ready=%s, %s bytes, %s registrations, %.0f ms",
+                quiz_id, report["ready"], report["total_bytes"], report["items"]["registrations"]["count"], report["elapsed_ms"],
+            )
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+정답 수정 후 제출된 응시 다시 채점
+
+    python -m app.tasks.regrade --quiz-id 1 [--batch-size 1000] [--restart]
+    python -m app.tasks.regrade --choice-ids 10 11
+    python -m app.tasks.regrade --pending
+
+선택지의 정답 여부를 바꾸거나 정답 선택지를 지우면 퀴즈가 다시 채점할 목록(REGRADE_PENDING_KEY)에 들어갑니다.
+- 퀴즈의 정답은 한 번만 읽고, 응시는 ID 순으로 batch 단위로 답안지(스냅샷 또는 보관된 응시)를 읽어 정답지와 비교합니다.
+- 점수가 바뀐 응시만 UserQuizScore(보관된 응시는 보관 행의 점수도)를 한 번의 bulk UPDATE 로 고칩니다.
+- batch 마다 커밋하고 마지막 응시 ID 를 Redis 에 기록하므로, 중단 후 다시 실행하면 이어서 진행합니다.
+  기록은 정답 지문(fingerprint)과 함께 저장하므로 그 사이 정답이 또 바뀌면 처음부터 다시 채점합니다.
+
+답안지가 없는 예전 응시(선택한 답안이 저장되지 않음)는 다시 채점할 수 없어 건너뜁니다.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import redis
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.quiz import REGRADE_PENDING_KEY
+from app.db.session import SessionLocal
+from app.models.choice import Choice
+from app.models.question import Question
+from app.models.user import UserQuizAttempt, UserQuizAttemptArchive, UserQuizAttemptSnapshot, UserQuizScore
+from app.utils.answer_sheet import answer_key, expand_answer_sheet, layout_from_arrays, score_answer_sheet
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+def regrade_checkpoint_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:regrade:checkpoint"
+
+def load_answer_key(db: Session, quiz_id: int) -> Tuple[Set[int], bool]:
+    """
+    퀴즈의 정답 선택지 ID 집합과, 정답이 여러 개인 문제가 있는지 여부를 반환하는 함수
+    """
+    rows = (
+        db.query(Choice.question_id, Choice.id)
+        .join(Question, Question.id == Choice.question_id)
+        .filter(Question.quiz_id == quiz_id, Choice.is_correct.is_(True))
+        .all()
+    )
+    per_question = Counter(question_id for question_id, _ in rows)
+    return {choice_id for _, choice_id in rows}, any(count > 1 for count in per_question.values())
+
+def answer_key_fingerprint(correct_choice_ids: Iterable[int]) -> str:
+    return hashlib.sha1(",".join(map(str, sorted(correct_choice_ids))).encode()).hexdigest()[:16]
+
+class SheetScorer:
+    """
+    한 퀴즈의 정답으로 답안지를 채점하는 클래스
+
+    같은 스냅샷 순서(출제 문제/순서가 같은 응시)의 정답지는 한 번만 만들고 답안지와 바이트 단위로 비교합니다.
+    정답이 여러 개인 문제가 있으면 제출 시 채점(grade_attempt)과 같도록 선택한 선택지가 정답 집합에 있는지 확인합니다.
+    """
+
+    MAX_CACHED_KEYS = 10000
+
+    def __init__(self, correct_choice_ids: Set[int], multiple_correct: bool):
+        self.correct_choice_ids = correct_choice_ids
+        self.multiple_correct = multiple_correct
+        self._keys: Dict[object, bytes] = {}
+
+    def score(self, layout_id, load_layout: Callable[[], List[List]], sheet: bytes) -> int:
+        if self.multiple_correct:
+            return sum(1 for choice_id in expand_answer_sheet(load_layout(), sheet).values() if choice_id in self.correct_choice_ids)
+        key = self._keys.get(layout_id)
+        if key is None:
+            if len(self._keys) >= self.MAX_CACHED_KEYS:
+                self._keys.clear()
+            key = self._keys[layout_id] = answer_key(load_layout(), self.correct_choice_ids)
+        return score_answer_sheet(sheet, key)
+
+def read_checkpoint(quiz_id: int, fingerprint: str) -> int:
+    try:
+        value = redis_client.get(regrade_checkpoint_key(quiz_id))
+    except redis.RedisError:
+        logger.warning("Redis unavailable, regrading quiz %s from the beginning", quiz_id)
+        return 0
+    if not value:
+        return 0
+    saved_fingerprint, _, last_attempt_id = value.partition(":")
+    return int(last_attempt_id) if saved_fingerprint == fingerprint else 0
+
+def save_checkpoint(quiz_id: int, fingerprint: str, last_attempt_id: Optional[int]):
+    try:
+        if last_attempt_id is None:
+            redis_client.delete(regrade_checkpoint_key(quiz_id))
+        else:
+            redis_client.set(regrade_checkpoint_key(quiz_id), f"{fingerprint}:{last_attempt_id}")
+    except redis.RedisError:
+        logger.warning("Redis unavailable, regrade checkpoint of quiz %s is not saved", quiz_id)
+
+def _load_sheets(db: Session, attempt_ids: List[int]) -> Dict[int, tuple]:
+    """
+    응시별 (스냅샷 순서 식별자, 스냅샷 순서를 만드는 함수, 답안지)
+    """
+    sheets = {}
+    for attempt_id, question_ids, choice_counts, choice_ids, sheet in (
+        db.query(
+            UserQuizAttemptArchive.attempt_id, UserQuizAttemptArchive.question_ids,
+            UserQuizAttemptArchive.choice_counts, UserQuizAttemptArchive.choice_ids, UserQuizAttemptArchive.answer_sheet,
+        )
+        .filter(UserQuizAttemptArchive.attempt_id.in_(attempt_ids), UserQuizAttemptArchive.answer_sheet.isnot(None))
+    ):
+        sheets[attempt_id] = (
+            (tuple(question_ids), tuple(choice_counts), tuple(choice_ids)),
+            lambda q=question_ids, n=choice_counts, c=choice_ids: layout_from_arrays(q, n, c),
+            sheet,
+        )
+    for attempt_id, payload, sheet in (
+        db.query(UserQuizAttemptSnapshot.attempt_id, UserQuizAttemptSnapshot.payload, UserQuizAttemptSnapshot.answer_sheet)
+        .filter(UserQuizAttemptSnapshot.attempt_id.in_(attempt_ids), UserQuizAttemptSnapshot.answer_sheet.isnot(None))
+    ):
+        sheets[attempt_id] = (payload, lambda p=payload: json.loads(p)["questions"], sheet)
+    return sheets
+
+def regrade_quiz(db: Session, quiz_id: int, batch_size: int = 1000, resume: bool = True) -> dict:
+    correct_choice_ids, multiple_correct = load_answer_key(db, quiz_id)
+    scorer = SheetScorer(correct_choice_ids, multiple_correct)
+    fingerprint = answer_key_fingerprint(correct_choice_ids)
+    last_id = read_checkpoint(quiz_id, fingerprint) if resume else 0
+    if last_id:
+        logger.info("quiz %s: resuming regrade after attempt %s", quiz_id, last_id)
+
+    submitted = db.query(UserQuizAttempt.id).filter(UserQuizAttempt.quiz_id == quiz_id, UserQuizAttempt.is_submit.is_(True))
+    remaining = submitted.filter(UserQuizAttempt.id > last_id).with_entities(func.count(UserQuizAttempt.id)).scalar()
+    stats = {"quiz_id": quiz_id, "attempts": 0, "updated": 0, "skipped": 0}
+    started = time.monotonic()
+    while True:
+        attempt_ids = [
+            attempt_id for (attempt_id,) in
+            submitted.filter(UserQuizAttempt.id > last_id).order_by(UserQuizAttempt.id).limit(batch_size)
+        ]
+        if not attempt_ids:
+            break
+
+        sheets = _load_sheets(db, attempt_ids)
+        scores = {attempt_id: scorer.score(*entry) for attempt_id, entry in sheets.items()}
+        changed = set()
+        score_updates = []
+        for score_id, attempt_id, score in (
+            db.query(UserQuizScore.id, UserQuizScore.user_quiz_attempt_id, UserQuizScore.score)
+            .filter(UserQuizScore.user_quiz_attempt_id.in_(scores))
+        ):
+            if score != scores[attempt_id]:
+                score_updates.append({"id": score_id, "score": scores[attempt_id]})
+                changed.add(attempt_id)
+        archive_updates = []
+        for attempt_id, score in (
+            db.query(UserQuizAttemptArchive.attempt_id, UserQuizAttemptArchive.score)
+            .filter(UserQuizAttemptArchive.attempt_id.in_(scores))
+        ):
+            if score != scores[attempt_id]:
+                archive_updates.append({"attempt_id": attempt_id, "score": scores[attempt_id]})
+                changed.add(attempt_id)
+        if score_updates:
+            db.execute(update(UserQuizScore), score_updates)
+        if archive_updates:
+            db.execute(update(UserQuizAttemptArchive), archive_updates)
+        db.commit()
+
+        last_id = attempt_ids[-1]
+        save_checkpoint(quiz_id, fingerprint, last_id)
+        stats["attempts"] += len(attempt_ids)
+        stats["updated"] += len(changed)
+        stats["skipped"] += len(attempt_ids) - len(sheets)
+        elapsed = time.monotonic() - started
+        logger.info(
+            "quiz %s: regraded %s/%s attempts, %s scores changed, %s without answer sheet (%.0f attempts/s)",
+            quiz_id, stats["attempts"], remaining, stats["updated"], stats["skipped"], stats["attempts"] / max(elapsed, 1e-9),
+        )
+
+    save_checkpoint(quiz_id, fingerprint, None)
+    return stats
+
+def quiz_ids_for_choices(db: Session, choice_ids: List[int]) -> List[int]:
+    return sorted({
+        quiz_id for (quiz_id,) in
+        db.query(Question.quiz_id).join(Choice, Choice.question_id == Question.id).filter(Choice.id.in_(choice_ids)).distinct()
+    })
+
+def regrade_pending(db: Session, batch_size: int = 1000) -> List[dict]:
+    """
+    다시 채점할 목록의 퀴즈를 하나씩 꺼내 채점하는 함수 (실패하면 목록에 되돌림)
+    """
+    results = []
+    while True:
+        quiz_id = redis_client.spop(REGRADE_PENDING_KEY)
+        if quiz_id is None:
+            return results
+        try:
+            results.append(regrade_quiz(db, int(quiz_id), batch_size))
+        except Exception:
+            db.rollback()
+            redis_client.sadd(REGRADE_PENDING_KEY, quiz_id)
+            raise
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="제출된 응시 다시 채점")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--quiz-id", type=int, nargs="+", help="다시 채점할 퀴즈 ID")
+    target.add_argument("--choice-ids", type=int, nargs="+", help="정답 여부가 바뀐 선택지 ID (해당 퀴즈를 다시 채점)")
+    target.add_argument("--pending", action="store_true", help="정답 수정으로 표시된 퀴즈를 모두 다시 채점")
+    parser.add_argument("--batch-size", type=int, default=settings.REGRADE_BATCH_SIZE, help="한 번에 채점할 응시 수")
+    parser.add_argument("--restart", action="store_true", help="이전 진행 기록을 무시하고 처음부터 채점")
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as db:
+        if args.pending:
+            results = regrade_pending(db, args.batch_size)
+        else:
+            quiz_ids = args.quiz_id or quiz_ids_for_choices(db, args.choice_ids)
+            results = [regrade_quiz(db, quiz_id, args.batch_size, resume=not args.restart) for quiz_id in quiz_ids]
+    for result in results:
+        logger.info(
+            "quiz %s: regraded %s attempts, %s scores changed, %s skipped",
+            result["quiz_id"], result["attempts"], result["updated"], result["skipped"],
+        )
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+문제 검색 문서 전체 재생성 (검색 도입 전 데이터 백필, 복구용)
+
+    python -m app.tasks.reindex_search [--chunk-size 1000] [--quiz-id 1]
+
+문제 ID 순으로 chunk 단위로 나누어 검색 문서를 다시 만들고 chunk 마다 커밋합니다.
+평소에는 문제/선택지 CRUD 가 같은 트랜잭션에서 검색 문서를 갱신하므로 실행할 필요가 없습니다.
+"""
+import argparse
+import logging
+import sys
+
+from app.crud.question import sync_search_documents
+from app.db.session import SessionLocal
+from app.models.question import Question
+
+logger = logging.getLogger(__name__)
+
+def reindex_search_documents(db, chunk_size: int = 1000, quiz_id: int = None) -> int:
+    last_id = 0
+    indexed = 0
+    while True:
+        query = db.query(Question.id).filter(Question.id > last_id)
+        if quiz_id is not None:
+            query = query.filter(Question.quiz_id == quiz_id)
+        question_ids = [question_id for (question_id,) in query.order_by(Question.id).limit(chunk_size)]
+        if not question_ids:
+            return indexed
+        sync_search_documents(db, question_ids)
+        db.commit()
+        indexed += len(question_ids)
+        last_id = question_ids[-1]
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="문제 검색 문서 전체 재생성")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 처리할 문제 수")
+    parser.add_argument("--quiz-id", type=int, help="특정 퀴즈만 재생성")
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as db:
+        indexed = reindex_search_documents(db, args.chunk_size, args.quiz_id)
+    logger.info("Reindexed %s questions", indexed)
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+기존 문제 은행의 중복/유사 중복 문제 점검
+
+    python -m app.tasks.scan_duplicates [--quiz-id 1] [--chunk-size 500]
+
+서명이 없는 문제(중복 판별 도입 전 데이터)는 먼저 서명을 만들고, 퀴즈마다 같은 text_hash 묶음과
+LSH 버킷이 같은 후보 쌍만 비교합니다. 중복이 있으면 로그로 남기고 종료 코드 1 을 반환합니다.
+"""
+import argparse
+import logging
+import sys
+
+from app.crud.question import scan_duplicate_questions
+from app.crud.quiz import iter_quiz_id_chunks
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="중복 문제 점검")
+    parser.add_argument("--quiz-id", type=int, help="특정 퀴즈만 점검")
+    parser.add_argument("--chunk-size", type=int, default=500, help="한 번에 가져올 퀴즈 ID 수")
+    args = parser.parse_args(argv)
+
+    checked = 0
+    found = 0
+    with SessionLocal() as db:
+        chunks = [[args.quiz_id]] if args.quiz_id is not None else iter_quiz_id_chunks(db, args.chunk_size)
+        for quiz_ids in chunks:
+            for quiz_id in quiz_ids:
+                checked += 1
+                for group in scan_duplicate_questions(db, quiz_id):
+                    found += 1
+                    logger.warning(
+                        "quiz %s: %s duplicate questions %s%s",
+                        quiz_id, group["kind"], group["question_ids"],
+                        f" (similarity {group['similarity']})" if "similarity" in group else "",
+                    )
+    logger.info("Scanned %s quizzes, %s duplicate groups", checked, found)
+    return 1 if found else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""
+전체 퀴즈 구성 검증 (야간 점검용)
+
+    python -m app.tasks.validate_quizzes [--chunk-size 500]
+
+잘못 구성된 퀴즈가 있으면 위반 항목을 로그로 남기고 종료 코드 1 을 반환합니다.
+"""
+import argparse
+import logging
+import sys
+
+from app.crud.quiz import sweep_invalid_quizzes
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="전체 퀴즈 구성 검증")
+    parser.add_argument("--chunk-size", type=int, default=500, help="한 번에 검증할 퀴즈 수")
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as db:
+        checked, invalid = sweep_invalid_quizzes(db, args.chunk_size)
+
+    for quiz_id, result in invalid.items():
+        for violation in result["violations"]:
+            logger.warning("quiz %s: %s", quiz_id, violation["reason"])
+    logger.info("Validated %s quizzes, %s invalid", checked, len(invalid))
+    return 1 if invalid else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sys.exit(main())
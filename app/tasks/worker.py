@@ -0,0 +1,38 @@
+import logging
+import threading
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+class PeriodicWorker(threading.Thread):
+    """
+    interval 초마다 run_once 를 실행하는 백그라운드 스레드
+
+    stop() 호출 시 스레드를 멈추고 run_once 를 마지막으로 한 번 더 실행합니다.
+    """
+
+    def __init__(self, name: str, interval: float):
+        super().__init__(name=name, daemon=True)
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run_once(self):
+        raise NotImplementedError
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.run_once()
+            except redis.RedisError:
+                logger.warning("Redis unavailable, %s skipped", self.name)
+            except Exception:
+                logger.exception("%s failed", self.name)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(self.interval)
+        try:
+            self.run_once()
+        except Exception:
+            logger.exception("Final %s run failed", self.name)
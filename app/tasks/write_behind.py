@@ -0,0 +1,70 @@
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.quiz import ANSWERS_DIRTY_KEY, attempt_answers_key, drop_missing_answers, save_attempt_progress
+from app.db.session import SessionLocal
+from app.tasks.worker import PeriodicWorker
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+def flush_dirty_answers(db: Session, batch_size: int = None) -> int:
+    """
+    답안이 변경된 응시(dirty set)의 Redis 답안을 Postgres 로 옮기는 함수
+
+    키 전체를 스캔하지 않고 dirty set 에서 batch_size 개씩 꺼내 한 번의 트랜잭션으로 upsert 합니다.
+    응시 중 삭제된 문제/선택지의 답안은 옮기지 않고, 응시마다 SAVEPOINT 를 두어
+    저장에 실패한 응시만 다음 주기에 다시 처리합니다. (같은 batch 의 다른 응시는 저장)
+    옮긴 응시 수를 반환합니다.
+    """
+    batch_size = batch_size or settings.WRITE_BEHIND_BATCH_SIZE
+    members = redis_client.spop(ANSWERS_DIRTY_KEY, batch_size)
+    if not members:
+        return 0
+
+    failed = []
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        attempts = []
+        for member in members:
+            quiz_id, user_quiz_attempt_id = (int(value) for value in member.split(":"))
+            attempts.append((member, user_quiz_attempt_id))
+            pipe.hgetall(attempt_answers_key(quiz_id, user_quiz_attempt_id))
+
+        answers_by_attempt = drop_missing_answers(
+            db, {user_quiz_attempt_id: answers for (_, user_quiz_attempt_id), answers in zip(attempts, pipe.execute())}
+        )
+        for member, user_quiz_attempt_id in attempts:
+            try:
+                with db.begin_nested():
+                    save_attempt_progress(db, user_quiz_attempt_id, answers_by_attempt[user_quiz_attempt_id])
+            except SQLAlchemyError:
+                logger.exception("Failed to flush answers of attempt %s", member)
+                failed.append(member)
+        db.commit()
+    except Exception:
+        db.rollback()
+        # 실패한 응시는 다음 주기에 다시 처리
+        redis_client.sadd(ANSWERS_DIRTY_KEY, *members)
+        raise
+
+    if failed:
+        redis_client.sadd(ANSWERS_DIRTY_KEY, *failed)
+    return len(members) - len(failed)
+
+class WriteBehindWorker(PeriodicWorker):
+    """
+    WRITE_BEHIND_INTERVAL 초마다 dirty set 을 비우는 백그라운드 스레드
+    """
+
+    def __init__(self, interval: float = None, batch_size: int = None):
+        super().__init__("write-behind", interval or settings.WRITE_BEHIND_INTERVAL)
+        self.batch_size = batch_size or settings.WRITE_BEHIND_BATCH_SIZE
+
+    def run_once(self):
+        with SessionLocal() as db:
+            while flush_dirty_answers(db, self.batch_size) == self.batch_size:
+                pass
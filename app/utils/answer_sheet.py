@@ -0,0 +1,111 @@
+"""
+제출 답안지 압축 형식
+
+답안지는 응시 스냅샷(UserQuizAttemptSnapshot.payload)의 문제 순서대로, 문제마다 선택한 선택지의 위치를 저장합니다.
+- 첫 바이트는 형식 버전, 이후 문제당 한 칸 (0 은 미응답, k 는 스냅샷의 k 번째 선택지)
+- 한 칸은 1바이트이며, 선택지가 255개를 넘는 문제가 있으면 2바이트(리틀 엔디언)입니다.
+
+문제 20개 답안지는 21바이트로, 제공된 선택지마다 한 행을 쓰는 UserQuizAttemptAnswer(100행, 행당 60바이트 이상 + 인덱스)보다
+훨씬 작습니다. 같은 스냅샷 순서의 정답지(answer_key)와 칸 단위로 비교하면 행 조회 없이 채점할 수 있습니다.
+"""
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+SHEET_FORMAT_UINT8 = 1
+SHEET_FORMAT_UINT16 = 2
+_TYPECODES = {SHEET_FORMAT_UINT8: "B", SHEET_FORMAT_UINT16: "H"}
+
+# 스냅샷 payload["questions"] 형식: [[문제 ID, [선택지 ID, ...]], ...]
+Layout = Sequence[Tuple[int, Sequence[int]]]
+
+def _pack(positions: Sequence[int]) -> bytes:
+    sheet_format = SHEET_FORMAT_UINT8 if max(positions, default=0) <= 0xFF else SHEET_FORMAT_UINT16
+    cells = array(_TYPECODES[sheet_format], positions)
+    if sys.byteorder == "big":
+        cells.byteswap()
+    return bytes([sheet_format]) + cells.tobytes()
+
+def decode_answer_sheet(data: bytes) -> array:
+    """
+    답안지를 칸 배열로 푸는 함수 (0 은 미응답, k 는 k 번째 선택지)
+    """
+    typecode = _TYPECODES.get(data[0]) if data else None
+    if typecode is None:
+        raise ValueError("지원하지 않는 답안지 형식입니다.")
+    cells = array(typecode)
+    cells.frombytes(data[1:])
+    if sys.byteorder == "big":
+        cells.byteswap()
+    return cells
+
+def encode_answer_sheet(layout: Layout, selected: Dict[int, int]) -> bytes:
+    """
+    {문제 ID: 선택지 ID} 답안을 스냅샷 순서의 답안지로 압축하는 함수
+
+    스냅샷에 없는 선택지를 고른 답안은 미응답으로 저장합니다.
+    """
+    positions = []
+    for question_id, choice_ids in layout:
+        choice_id = selected.get(question_id)
+        positions.append(choice_ids.index(choice_id) + 1 if choice_id in choice_ids else 0)
+    return _pack(positions)
+
+def expand_answer_sheet(layout: Layout, data: bytes) -> Dict[int, Optional[int]]:
+    """
+    답안지를 {문제 ID: 선택지 ID 또는 None} 으로 되돌리는 함수
+    """
+    cells = decode_answer_sheet(data)
+    if len(cells) != len(layout):
+        raise ValueError("답안지와 스냅샷의 문제 수가 다릅니다.")
+    return {
+        question_id: choice_ids[position - 1] if position else None
+        for (question_id, choice_ids), position in zip(layout, cells)
+    }
+
+def answer_key(layout: Layout, correct_choice_ids: Iterable[int]) -> bytes:
+    """
+    스냅샷 순서의 정답지 (정답 선택지 위치, 정답이 없으면 0)
+
+    답안지와 같은 형식이므로 score_answer_sheet 로 바로 비교할 수 있습니다.
+    정답이 여러 개인 문제는 첫 번째 정답만 사용합니다.
+    """
+    correct = set(correct_choice_ids)
+    return _pack([
+        next((index + 1 for index, choice_id in enumerate(choice_ids) if choice_id in correct), 0)
+        for _, choice_ids in layout
+    ])
+
+def score_answer_sheet(sheet: bytes, key: bytes) -> int:
+    """
+    답안지와 정답지에서 위치가 같은(미응답 제외) 칸 수
+    """
+    return sum(
+        1 for answer, correct in zip(decode_answer_sheet(sheet), decode_answer_sheet(key))
+        if answer and answer == correct
+    )
+
+def layout_from_questions(questions: List[dict]) -> List[List]:
+    """
+    응시 화면 데이터(questions)에서 스냅샷 순서를 만드는 함수
+    """
+    return [[question["id"], [choice["id"] for choice in question["choices"]]] for question in questions]
+
+def layout_to_arrays(layout: Layout) -> Tuple[List[int], List[int], List[int]]:
+    """
+    스냅샷 순서를 (문제 ID 배열, 문제별 선택지 수 배열, 선택지 ID 배열)로 펼치는 함수 (보관용)
+    """
+    question_ids, choice_counts, choice_ids = [], [], []
+    for question_id, question_choice_ids in layout:
+        question_ids.append(question_id)
+        choice_counts.append(len(question_choice_ids))
+        choice_ids.extend(question_choice_ids)
+    return question_ids, choice_counts, choice_ids
+
+def layout_from_arrays(question_ids: Sequence[int], choice_counts: Sequence[int], choice_ids: Sequence[int]) -> List[List]:
+    layout = []
+    offset = 0
+    for question_id, count in zip(question_ids, choice_counts):
+        layout.append([question_id, list(choice_ids[offset:offset + count])])
+        offset += count
+    return layout
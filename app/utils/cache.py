@@ -0,0 +1,325 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import redis
+
+from app.core.config import settings
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_caches: Dict[str, "TwoTierCache"] = {}
+
+def _origin() -> str:
+    # preload 후 fork 된 워커마다 달라야 하므로 호출 시점의 pid 를 사용합니다.
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class _Flight:
+    __slots__ = ("event", "value")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+
+class TwoTierCache:
+    """
+    프로세스 내부 LRU(+TTL) 와 Redis 를 함께 사용하는 읽기 전용 캐시
+
+    - 1차: 프로세스 내부 LRU, local_ttl 초 동안 유지
+    - 2차: Redis, redis_ttl 초 동안 유지 (워커 간 공유)
+    - version 을 함께 넘기면 저장된 version 과 다를 때 미스로 처리합니다.
+    - 같은 키를 동시에 조회하면 한 요청만 loader 를 실행합니다. (single-flight)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: Optional[int] = None,
+        local_ttl: Optional[float] = None,
+        redis_ttl: Optional[int] = None,
+    ):
+        self.name = name
+        self.maxsize = maxsize or settings.CACHE_LOCAL_MAXSIZE
+        self.local_ttl = local_ttl if local_ttl is not None else settings.CACHE_LOCAL_TTL
+        self.redis_ttl = redis_ttl if redis_ttl is not None else settings.CACHE_REDIS_TTL
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.stats = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "loads": 0,
+            "coalesced": 0,
+            "invalidations": 0,
+            "redis_errors": 0,
+            "remote_invalidations": 0,
+        }
+        _caches[name] = self
+
+    def _redis_key(self, key) -> str:
+        return f"cache:{self.name}:{key}"
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _get_local(self, key: str, version):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, entry_version, value = entry
+            if expires_at < time.monotonic() or entry_version != version:
+                del self._local[key]
+                return _MISSING
+            self._local.move_to_end(key)
+            self.stats["local_hits"] += 1
+            return value
+
+    def _set_local(self, key: str, version, value, ttl: Optional[float] = None):
+        with self._lock:
+            self._local[key] = (time.monotonic() + (ttl if ttl is not None else self.local_ttl), version, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def _get_redis(self, key: str, version):
+        try:
+            cached = redis_client.get(self._redis_key(key))
+        except redis.RedisError:
+            self._count("redis_errors")
+            return _MISSING
+        if cached is None:
+            return _MISSING
+        entry = json.loads(cached)
+        if entry.get("v") != version:
+            return _MISSING
+        self._count("redis_hits")
+        return entry["value"]
+
+    def _set_redis(self, key: str, version, value):
+        try:
+            redis_client.setex(self._redis_key(key), self.redis_ttl, json.dumps({"v": version, "value": value}))
+        except redis.RedisError:
+            self._count("redis_errors")
+
+    def _load_with_redis_lock(self, key: str, version, loader: Callable[[], Any]):
+        """
+        다른 워커가 같은 키를 적재 중이면 잠시 기다렸다가 Redis 결과를 사용합니다.
+        """
+        lock_key = f"{self._redis_key(key)}:lock"
+        token = uuid.uuid4().hex
+        try:
+            acquired = redis_client.set(lock_key, token, nx=True, px=settings.CACHE_LOCK_TIMEOUT_MS)
+        except redis.RedisError:
+            self._count("redis_errors")
+            acquired = False
+
+        if not acquired:
+            deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT_MS / 1000
+            while time.monotonic() < deadline:
+                time.sleep(0.01)
+                value = self._get_redis(key, version)
+                if value is not _MISSING:
+                    self._count("coalesced")
+                    return value
+
+        try:
+            self._count("loads")
+            value = loader()
+            if value is not None:
+                self._set_redis(key, version, value)
+            return value
+        finally:
+            if acquired:
+                try:
+                    if redis_client.get(lock_key) == token:
+                        redis_client.delete(lock_key)
+                except redis.RedisError:
+                    self._count("redis_errors")
+
+    def get_or_load(self, key, loader: Callable[[], Any], version=None):
+        """
+        캐시에서 값을 찾고, 없으면 loader 결과를 두 계층에 저장한 뒤 반환하는 함수
+
+        loader 가 None 을 반환하면 캐시하지 않습니다.
+        """
+        key = str(key)
+        value = self._get_local(key, version)
+        if value is not _MISSING:
+            return value
+
+        value = self._get_redis(key, version)
+        if value is not _MISSING:
+            self._set_local(key, version, value)
+            return value
+
+        with self._lock:
+            self.stats["misses"] += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.event.wait(settings.CACHE_LOCK_TIMEOUT_MS / 1000)
+            self._count("coalesced")
+            if flight.event.is_set():
+                return flight.value
+            return loader()
+
+        try:
+            value = self._load_with_redis_lock(key, version, loader)
+            if value is not None:
+                self._set_local(key, version, value)
+            flight.value = value
+            return value
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def pin(self, key, value, version=None, ttl: Optional[int] = None) -> int:
+        """
+        값을 미리 적재하여 ttl 초 동안 두 계층에 유지하는 함수 (시험 시작 전 준비용), 저장한 크기(바이트)를 반환
+
+        다른 워커의 프로세스 내부 LRU 에는 pub/sub 메시지로 Redis 값을 적재하게 합니다.
+        버전이 바뀌면 일반 캐시와 같이 미스로 처리합니다.
+        """
+        key = str(key)
+        ttl = ttl or self.redis_ttl
+        data = json.dumps({"v": version, "value": value})
+        self._set_local(key, version, value, ttl)
+        redis_client.setex(self._redis_key(key), ttl, data)
+        if settings.CACHE_PUBSUB_ENABLED:
+            message = json.dumps({"cache": self.name, "key": key, "origin": _origin(), "action": "warm", "ttl": ttl})
+            redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+        return len(data.encode())
+
+    def warm_local(self, key, ttl: Optional[float] = None):
+        """
+        Redis 의 값을 프로세스 내부 LRU 에 적재하는 함수 (다른 워커의 pin 메시지 처리용)
+        """
+        try:
+            cached = redis_client.get(self._redis_key(key))
+        except redis.RedisError:
+            self._count("redis_errors")
+            return
+        if cached is not None:
+            entry = json.loads(cached)
+            self._set_local(str(key), entry.get("v"), entry["value"], ttl)
+
+    def entry_info(self, key) -> Optional[dict]:
+        """
+        Redis 에 저장된 값의 버전, 크기(바이트), 남은 시간(초)을 반환하는 함수 (없으면 None)
+        """
+        redis_key = self._redis_key(key)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.get(redis_key)
+        pipe.ttl(redis_key)
+        cached, ttl = pipe.execute()
+        if cached is None:
+            return None
+        return {"version": json.loads(cached).get("v"), "bytes": len(cached.encode()), "ttl": ttl}
+
+    def invalidate(self, key):
+        """
+        CRUD 에서 데이터가 변경되었을 때 두 계층의 값을 제거하는 함수
+
+        다른 워커의 프로세스 내부 LRU 는 pub/sub 메시지로 제거합니다.
+        """
+        key = str(key)
+        with self._lock:
+            self._local.pop(key, None)
+            self.stats["invalidations"] += 1
+        try:
+            redis_client.delete(self._redis_key(key))
+            if settings.CACHE_PUBSUB_ENABLED:
+                message = json.dumps({"cache": self.name, "key": key, "origin": _origin()})
+                redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+        except redis.RedisError:
+            self._count("redis_errors")
+
+    def drop_local(self, key):
+        with self._lock:
+            self._local.pop(str(key), None)
+            self.stats["remote_invalidations"] += 1
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+    def snapshot_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["local_size"] = len(self._local)
+        lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["local_hits"] + stats["redis_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+def get_cache_stats() -> dict:
+    return {name: cache.snapshot_stats() for name, cache in _caches.items()}
+
+def clear_local_caches():
+    for cache in _caches.values():
+        cache.clear_local()
+
+def handle_invalidation_message(data: str):
+    """
+    다른 워커가 발행한 무효화/미리 적재 메시지를 처리하는 함수 (자신이 발행한 메시지는 무시)
+    """
+    try:
+        message = json.loads(data)
+    except (TypeError, ValueError):
+        return
+    if message.get("origin") == _origin():
+        return
+    cache = _caches.get(message.get("cache"))
+    if cache is None:
+        return
+    if message.get("action") == "warm":
+        cache.warm_local(message.get("key"), message.get("ttl"))
+    else:
+        cache.drop_local(message.get("key"))
+
+class CacheInvalidationListener(threading.Thread):
+    """
+    CACHE_INVALIDATION_CHANNEL 을 구독하여 워커 간 프로세스 내부 LRU 를 일관되게 유지하는 스레드
+
+    구독이 끊겼다가 다시 연결되면 그 사이 메시지를 놓쳤을 수 있으므로 내부 LRU 를 모두 비웁니다.
+    """
+
+    def __init__(self, channel: Optional[str] = None, poll_timeout: float = 1.0):
+        super().__init__(name="cache-invalidation", daemon=True)
+        self.channel = channel or settings.CACHE_INVALIDATION_CHANNEL
+        self.poll_timeout = poll_timeout
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(self.channel)
+                clear_local_caches()
+                while not self._stop_event.is_set():
+                    message = pubsub.get_message(timeout=self.poll_timeout)
+                    if message and message["type"] == "message":
+                        handle_invalidation_message(message["data"])
+            except redis.RedisError:
+                logger.warning("Cache invalidation subscription lost, resubscribing")
+                self._stop_event.wait(self.poll_timeout)
+            finally:
+                pubsub.close()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join(timeout=self.poll_timeout * 2)
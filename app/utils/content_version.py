@@ -0,0 +1,42 @@
+import logging
+import time
+from typing import Optional
+
+import redis
+
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+def quiz_version_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}:version"
+
+def get_quiz_version(quiz_id: int, create: bool = True) -> Optional[int]:
+    """
+    퀴즈 컨텐츠(퀴즈, 문제, 선택지) 버전을 반환하는 함수
+
+    키가 없으면 현재 시각(ns)으로 초기화하여, Redis 재시작 후에도 이전 버전과 겹치지 않도록 합니다.
+    퀴즈가 있는지 아직 모르면 create=False 로 호출합니다. (없는 ID 조회로 키가 쌓이지 않도록 키가 없으면 None)
+    Redis 장애 시에는 None 을 반환합니다.
+    """
+    key = quiz_version_key(quiz_id)
+    try:
+        version = redis_client.get(key)
+        if version is None:
+            if not create:
+                return None
+            redis_client.set(key, time.time_ns(), nx=True)
+            version = redis_client.get(key)
+    except redis.RedisError:
+        return None
+    return int(version)
+
+def bump_quiz_version(quiz_id: int) -> Optional[int]:
+    """
+    퀴즈 컨텐츠가 변경되었을 때 버전을 올리는 함수
+    """
+    try:
+        return redis_client.incr(quiz_version_key(quiz_id))
+    except redis.RedisError:
+        logger.error("Failed to bump content version of quiz %s", quiz_id)
+        return None
@@ -0,0 +1,77 @@
+import hashlib
+import random
+import re
+import struct
+import unicodedata
+from typing import List, Sequence, Tuple
+
+# 64개 해시 = 8 밴드 x 8 행, 유사도 약 0.77 이상이면 같은 버킷에 들어갈 확률이 절반을 넘습니다.
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 8
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(20240601)
+# 서명이 데이터베이스에 저장되므로 계수는 고정 시드로 만듭니다. (바꾸면 전체 재계산 필요)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+_SIGNATURE_FORMAT = f"<{MINHASH_PERMUTATIONS}I"
+
+def normalize_text(text: str) -> str:
+    """
+    비교용 정규화 (NFKC, 소문자, 문장 부호 제거, 공백 하나로)
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = re.sub(r"[^\w\s]", " ", text)
+    return " ".join(text.split())
+
+def text_hash(text: str) -> str:
+    """
+    정규화한 문장의 sha256 (완전 중복 판별용)
+    """
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+def shingles(text: str) -> set:
+    """
+    정규화한 문장의 글자 단위 n-gram 집합 (한국어는 조사가 붙으므로 단어 대신 글자 단위를 사용합니다)
+    """
+    normalized = normalize_text(text)
+    if len(normalized) <= SHINGLE_SIZE:
+        return {normalized}
+    return {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+def minhash(text: str) -> Tuple[int, ...]:
+    hashes = [int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "little") for shingle in shingles(text)]
+    return tuple(
+        min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+def pack_signature(signature: Sequence[int]) -> bytes:
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+def unpack_signature(data: bytes) -> Tuple[int, ...]:
+    return struct.unpack(_SIGNATURE_FORMAT, data)
+
+def lsh_buckets(signature: Sequence[int]) -> List[Tuple[int, int]]:
+    """
+    서명을 밴드별로 나누어 (밴드 번호, 버킷 해시) 목록을 반환하는 함수
+
+    한 밴드라도 버킷이 같으면 유사 중복 후보입니다. 버킷 해시는 BIGINT 에 들어가도록 63비트입니다.
+    """
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(struct.pack(f"<{LSH_ROWS}I", *rows), digest_size=8).digest()
+        buckets.append((band, int.from_bytes(digest, "little") >> 1))
+    return buckets
+
+def similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """
+    두 MinHash 서명으로 추정한 Jaccard 유사도
+    """
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.utils.content_version import get_quiz_version
+
+PUBLIC_CACHE_CONTROL = f"public, max-age={settings.CONTENT_CACHE_MAX_AGE}, must-revalidate"
+PRIVATE_CACHE_CONTROL = f"private, max-age={settings.CONTENT_CACHE_MAX_AGE}, must-revalidate"
+# 정답이 포함된 응답은 공유 캐시에 저장되지 않도록 하고, 브라우저도 매번 ETag 로 확인하게 합니다.
+ANSWER_CACHE_CONTROL = "private, no-cache"
+
+def make_etag(*parts) -> str:
+    """
+    컨텐츠 버전과 요청 파라미터로 strong ETag 를 생성하는 함수
+    """
+    raw = ":".join(str(part) for part in parts)
+    return '"' + hashlib.sha1(raw.encode()).hexdigest() + '"'
+
+def quiz_etag(kind: str, quiz_id: int, *params) -> Optional[str]:
+    """
+    퀴즈 컨텐츠 버전 기반 ETag 를 생성하는 함수 (버전을 알 수 없으면 None)
+    """
+    version = get_quiz_version(quiz_id)
+    if version is None:
+        return None
+    return make_etag(kind, quiz_id, version, *params)
+
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """
+    If-None-Match 헤더가 현재 ETag 와 일치하는지 확인하는 함수
+    """
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match 는 weak comparison 을 사용합니다.
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in tags
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+def set_cache_headers(response: Response, etag: Optional[str], cache_control: str):
+    if etag:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
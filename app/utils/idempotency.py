@@ -0,0 +1,180 @@
+"""
+Idempotency-Key 로 쓰기 요청 재시도를 한 번만 처리하는 도구
+
+- 키는 (정책 이름, 사용자, Idempotency-Key) 마다 Redis 에 첫 성공 응답을 IDEMPOTENCY_TTL_SECONDS 동안 보관합니다.
+  재시도는 채점/DB 쓰기 없이 보관된 응답을 그대로 반환합니다. (Idempotent-Replayed: true 헤더)
+- 처리 중에는 Redis 잠금을 잡으므로, 같은 키로 동시에 들어온 요청은 경쟁하지 않고 첫 응답을 기다립니다.
+  처리가 잠금 시간보다 오래 걸려도 중복 처리되지 않도록 처리하는 동안 잠금 만료 시간을 계속 늘립니다.
+- 같은 키를 다른 요청 본문에 다시 쓰면 422, 기다려도 처리가 끝나지 않으면 409 를 반환합니다.
+- 실패한 요청(예외)은 보관하지 않으므로 같은 키로 다시 시도할 수 있습니다.
+
+Redis 장애 시에는 키 없이 요청한 것과 같이 처리합니다.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+import redis
+from fastapi import HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# KEYS[1]: 잠금, ARGV: 잠금 토큰, 유지 시간(ms) / 내 잠금일 때만 만료 시간을 늘림 (1: 연장, 0: 잠금을 잃음)
+LOCK_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1]: 잠금, ARGV[1]: 잠금 토큰 / 내 잠금일 때만 지움
+LOCK_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+def idempotency_key(name: str, user_id: int, key: str) -> str:
+    return f"idempotency:{name}:{user_id}:{key}"
+
+def request_fingerprint(*parts) -> str:
+    """
+    요청 경로/쿼리/본문으로 만든 지문 (같은 키가 다른 요청에 쓰였는지 확인용)
+    """
+    return hashlib.sha256(json.dumps(jsonable_encoder(parts), sort_keys=True).encode()).hexdigest()
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 별 응답 보관과 처리 중 잠금
+    """
+
+    def __init__(self):
+        self.stats = {
+            "stored": 0, "replayed": 0, "waited": 0, "mismatched": 0, "timeouts": 0, "renewed": 0, "lost": 0, "errors": 0,
+        }
+        self._lock = threading.Lock()
+        self._scripts = {}
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def snapshot_stats(self) -> dict:
+        with self._lock:
+            return dict(self.stats)
+
+    def _run_script(self, source: str, lock_key: str, *args):
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts.setdefault(source, redis_client.register_script(source))
+        return script(keys=[lock_key], args=list(args), client=redis_client.get_client())
+
+    @contextmanager
+    def _keep_lock(self, lock_key: str, token: str):
+        """
+        with 블록 동안 잠금 시간의 1/3 마다 잠금 만료 시간을 늘리는 도구 (백그라운드 스레드)
+        """
+        stop = threading.Event()
+
+        def renew():
+            while not stop.wait(settings.IDEMPOTENCY_LOCK_TIMEOUT_MS / 3000):
+                try:
+                    renewed = self._run_script(LOCK_RENEW_SCRIPT, lock_key, token, settings.IDEMPOTENCY_LOCK_TIMEOUT_MS)
+                except redis.RedisError:
+                    self._count("errors")
+                    continue
+                if not renewed:
+                    logger.warning("Idempotency lock %s was lost while processing", lock_key)
+                    self._count("lost")
+                    return
+                self._count("renewed")
+
+        keeper = threading.Thread(target=renew, name="idempotency-lock", daemon=True)
+        keeper.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            keeper.join()
+
+    def _replay(self, redis_key: str, fingerprint: str, response: Response) -> Optional[Any]:
+        cached = redis_client.get(redis_key)
+        if cached is None:
+            return None
+        entry = json.loads(cached)
+        if entry["fingerprint"] != fingerprint:
+            self._count("mismatched")
+            raise HTTPException(status_code=422, detail="Idempotency-Key 가 다른 요청에 이미 사용되었습니다.")
+        self._count("replayed")
+        response.headers[REPLAYED_HEADER] = "true"
+        return entry["body"]
+
+    def run(self, name: str, user_id: int, key: Optional[str], fingerprint: str, handler: Callable[[], Any], response: Response):
+        """
+        key 가 없으면 handler 를 그대로 실행하고, 있으면 첫 성공 응답을 보관/재사용하는 함수
+        """
+        if key is None:
+            return handler()
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise HTTPException(status_code=400, detail=f"Idempotency-Key 는 1~{MAX_KEY_LENGTH}자여야 합니다.")
+
+        redis_key = idempotency_key(name, user_id, key)
+        lock_key = f"{redis_key}:lock"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + settings.IDEMPOTENCY_LOCK_TIMEOUT_MS / 1000
+        waited = False
+        try:
+            while True:
+                body = self._replay(redis_key, fingerprint, response)
+                if body is not None:
+                    if waited:
+                        self._count("waited")
+                    return body
+                if redis_client.set(lock_key, token, nx=True, px=settings.IDEMPOTENCY_LOCK_TIMEOUT_MS):
+                    break
+                # 같은 키 요청이 처리 중이면 응답이 보관되거나(성공) 잠금이 풀릴 때까지(실패) 기다립니다.
+                if time.monotonic() >= deadline:
+                    self._count("timeouts")
+                    raise HTTPException(
+                        status_code=409, detail="같은 Idempotency-Key 요청이 처리 중입니다.", headers={"Retry-After": "1"},
+                    )
+                waited = True
+                time.sleep(0.05)
+        except redis.RedisError:
+            logger.warning("Redis unavailable, %s request is processed without idempotency key", name)
+            self._count("errors")
+            return handler()
+
+        try:
+            with self._keep_lock(lock_key, token):
+                result = handler()
+            try:
+                redis_client.setex(
+                    redis_key, settings.IDEMPOTENCY_TTL_SECONDS,
+                    json.dumps({"fingerprint": fingerprint, "body": jsonable_encoder(result)}),
+                )
+                self._count("stored")
+            except redis.RedisError:
+                self._count("errors")
+            return result
+        finally:
+            try:
+                self._run_script(LOCK_RELEASE_SCRIPT, lock_key, token)
+            except redis.RedisError:
+                self._count("errors")
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,41 @@
+import threading
+import time
+from contextlib import contextmanager
+
+class InFlightTracker:
+    """
+    진행 중인 요청 수를 세고, 종료 시 모두 끝날 때까지 기다리는 도구
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def track(self):
+        with self._condition:
+            self.count += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.count -= 1
+                if self.count == 0:
+                    self._condition.notify_all()
+
+    def wait_idle(self, timeout: float) -> bool:
+        """
+        진행 중인 요청이 모두 끝나면 True, timeout 초가 지나면 False 를 반환하는 함수
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self.count > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+# 종료 시 채점/저장이 중간에 끊기지 않도록 제출 요청을 추적합니다.
+submissions = InFlightTracker("submissions")
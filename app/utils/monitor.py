@@ -0,0 +1,56 @@
+"""
+퀴즈 진행 현황 스트림 (Server-Sent Events)
+
+대시보드가 몇 개든 워커는 퀴즈마다 MONITOR_INTERVAL 초에 한 번만 Redis 에서 집계를 읽고,
+모든 스트림이 같은 스냅샷을 보냅니다.
+"""
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+class MonitorHub:
+    """
+    퀴즈별 최근 스냅샷을 interval 초 동안 공유하는 도구 (워커별)
+
+    같은 퀴즈를 동시에 읽으면 한 스트림만 loader 를 실행하고 나머지는 그 결과를 사용합니다.
+    """
+
+    def __init__(self, loader: Callable[[int], dict]):
+        self.loader = loader
+        self.stats = {"reads": 0, "shared": 0}
+        self._snapshots: Dict[int, Tuple[float, dict]] = {}
+        self._locks: Dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, quiz_id: int, interval: float):
+        entry = self._snapshots.get(quiz_id)
+        if entry is not None and time.monotonic() - entry[0] < interval:
+            return entry[1]
+        return None
+
+    def get(self, quiz_id: int, interval: float) -> dict:
+        with self._lock:
+            snapshot = self._fresh(quiz_id, interval)
+            if snapshot is not None:
+                self.stats["shared"] += 1
+                return snapshot
+            quiz_lock = self._locks.setdefault(quiz_id, threading.Lock())
+        with quiz_lock:
+            with self._lock:
+                snapshot = self._fresh(quiz_id, interval)
+                if snapshot is not None:
+                    self.stats["shared"] += 1
+                    return snapshot
+            snapshot = self.loader(quiz_id)
+            with self._lock:
+                self._snapshots[quiz_id] = (time.monotonic(), snapshot)
+                self.stats["reads"] += 1
+            return snapshot
+
+    def snapshot_stats(self) -> dict:
+        with self._lock:
+            return {**self.stats, "quizzes": len(self._snapshots)}
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
@@ -0,0 +1,233 @@
+"""
+요청 제한(rate limit)과 과부하 시 요청 거절(admission control)
+
+- 사용자별 요청 제한: Redis 토큰 버킷 (정책마다 RATE_LIMITS 의 "요청 수/초"), 확인마다 Lua 스크립트 한 번 (O(1))
+- 동시 실행 제한: 워커(프로세스)별 진행 중인 요청 수로 판단합니다. DB 커넥션 풀이 워커마다 있기 때문입니다.
+  우선순위가 낮은 요청(관리자 목록 조회)부터 거절하고, 답안 저장/제출은 전체 한도까지 받습니다.
+"""
+import logging
+import math
+import threading
+from contextlib import ExitStack
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import redis
+from fastapi import Depends, HTTPException, Response
+
+from app.core.config import settings
+from app.core.security import get_current_user
+from app.utils.inflight import InFlightTracker
+from app.utils.utils import redis_client
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: 버킷, ARGV: 용량, 초당 충전량 / 반환: {허용 여부, 남은 토큰, 재시도까지 초, 가득 찰 때까지 초}
+# 여러 워커의 시계가 달라도 같은 기준이 되도록 Redis 서버 시각(TIME)을 사용합니다.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens), tostring(retry_after), tostring((capacity - tokens) / rate)}
+"""
+
+PRIORITIES = ("low", "normal", "critical")
+
+class RateLimitResult(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float
+    reset_after: float
+
+def parse_rate(value: str) -> Tuple[int, float]:
+    """
+    "요청 수/초" 형식의 정책을 (용량, 기간 초)로 바꾸는 함수 (예: "10/60" 은 60초에 10번, 최대 10번 연속)
+    """
+    capacity, _, period = value.partition("/")
+    return int(capacity), float(period or 1)
+
+def rate_limit_key(name: str, identity) -> str:
+    return f"ratelimit:{name}:{identity}"
+
+class RateLimiter:
+    """
+    정책 하나의 사용자별 토큰 버킷
+
+    Redis 장애 시에는 요청을 막지 않고(fail open) errors 로만 집계합니다.
+    """
+
+    _script = None
+    _script_lock = threading.Lock()
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stats = {"allowed": 0, "limited": 0, "errors": 0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _get_script(cls):
+        if cls._script is None:
+            with cls._script_lock:
+                if cls._script is None:
+                    cls._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+        return cls._script
+
+    def policy(self) -> Optional[Tuple[int, float]]:
+        value = settings.RATE_LIMITS.get(self.name) if settings.RATE_LIMIT_ENABLED else None
+        return parse_rate(value) if value else None
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def hit(self, identity) -> Optional[RateLimitResult]:
+        """
+        토큰 하나를 사용하는 함수 (정책이 없거나 Redis 장애면 None)
+        """
+        policy = self.policy()
+        if policy is None:
+            return None
+        capacity, period = policy
+        try:
+            allowed, tokens, retry_after, reset_after = self._get_script()(
+                keys=[rate_limit_key(self.name, identity)],
+                args=[capacity, capacity / period],
+                client=redis_client.get_client(),
+            )
+        except redis.RedisError:
+            logger.warning("Redis unavailable, rate limit %s is not applied", self.name)
+            self._count("errors")
+            return None
+        result = RateLimitResult(bool(allowed), capacity, int(float(tokens)), float(retry_after), float(reset_after))
+        self._count("allowed" if result.allowed else "limited")
+        return result
+
+    def snapshot_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats)
+        policy = self.policy()
+        stats["policy"] = f"{policy[0]}/{policy[1]:g}" if policy else None
+        return stats
+
+_limiters: Dict[str, RateLimiter] = {}
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = _limiters.setdefault(name, RateLimiter(name))
+    return limiter
+
+def get_rate_limit_stats() -> dict:
+    return {name: limiter.snapshot_stats() for name, limiter in sorted(_limiters.items())}
+
+def rate_limit(name: str):
+    """
+    사용자별 요청 제한 의존성 (라우트의 dependencies 에 추가)
+
+    남은 요청 수를 X-RateLimit-* 헤더로 알려 주고, 초과하면 429 와 Retry-After 를 반환합니다.
+    """
+    limiter = get_rate_limiter(name)
+
+    def dependency(response: Response, current_user=Depends(get_current_user)):
+        result = limiter.hit(current_user.id)
+        if result is None:
+            return
+        headers = {
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+            "X-RateLimit-Reset": str(math.ceil(result.reset_after)),
+        }
+        if not result.allowed:
+            headers["Retry-After"] = str(max(1, math.ceil(result.retry_after)))
+            raise HTTPException(status_code=429, detail="요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.", headers=headers)
+        response.headers.update(headers)
+
+    return dependency
+
+class AdmissionController(InFlightTracker):
+    """
+    워커의 진행 중인 요청 수(AdmissionMiddleware 가 모든 HTTP 요청을 셈)로 우선순위별 요청을 받을지 정하는 도구
+    """
+
+    def __init__(self):
+        super().__init__("requests")
+        self.peak = 0
+        self.stats = {priority: {"admitted": 0, "shed": 0} for priority in PRIORITIES}
+
+    def limit_for(self, priority: str) -> int:
+        ratio = {
+            "low": settings.ADMISSION_LOW_PRIORITY_RATIO,
+            "normal": settings.ADMISSION_NORMAL_PRIORITY_RATIO,
+        }.get(priority, 1)
+        return max(1, int(settings.ADMISSION_MAX_IN_FLIGHT * ratio))
+
+    def admit(self, priority: str) -> bool:
+        with self._condition:
+            in_flight = self.count
+            self.peak = max(self.peak, in_flight)
+            admitted = in_flight <= self.limit_for(priority)
+            self.stats[priority]["admitted" if admitted else "shed"] += 1
+        return admitted
+
+    def snapshot_stats(self) -> dict:
+        with self._condition:
+            return {
+                "in_flight": self.count,
+                "peak": self.peak,
+                "limits": {priority: self.limit_for(priority) for priority in PRIORITIES},
+                "priorities": {priority: dict(stats) for priority, stats in self.stats.items()},
+            }
+
+admission_controller = AdmissionController()
+
+def admission(priority: str):
+    """
+    과부하 시 요청 거절 의존성 (진행 중인 요청 수가 우선순위별 한도를 넘으면 503)
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"unknown priority: {priority}")
+
+    def dependency():
+        if not admission_controller.admit(priority):
+            raise HTTPException(status_code=503, detail="서버가 혼잡합니다. 잠시 후 다시 시도해 주세요.", headers={"Retry-After": "1"})
+
+    return dependency
+
+class AdmissionMiddleware:
+    """
+    워커의 진행 중인 HTTP 요청 수를 세는 ASGI 미들웨어
+
+    응답을 시작하면(헤더 전송) 끝난 것으로 보므로 진행 현황 스트림 같은 긴 응답은 세지 않습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with ExitStack() as tracking:
+            tracking.enter_context(admission_controller.track())
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    tracking.close()
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
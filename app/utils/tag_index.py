@@ -0,0 +1,183 @@
+import random
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """
+    태그를 소문자로 정리하고 중복을 제거하는 함수
+    """
+    return sorted({tag.strip().lower() for tag in tags or [] if tag and tag.strip()})
+
+def bitmap_positions(bitmap: int) -> List[int]:
+    """
+    비트맵에서 켜진 비트의 위치를 오름차순으로 반환하는 함수
+    """
+    positions = []
+    while bitmap:
+        low = bitmap & -bitmap
+        positions.append(low.bit_length() - 1)
+        bitmap ^= low
+    return positions
+
+class QuizTagIndex:
+    """
+    퀴즈 한 개의 역색인 (태그 -> 문제 비트맵)
+
+    문제마다 위치(비트 번호)를 하나씩 배정하고, 태그별로 해당 문제들의 비트를 켠 정수를 보관합니다.
+    여러 태그를 가진 문제는 비트맵 AND 로 찾으므로 SQL 을 실행하지 않습니다.
+    삭제된 문제의 위치는 재사용하지 않으며, 다시 적재할 때 정리됩니다.
+    """
+
+    __slots__ = ("version", "question_ids", "positions", "members", "bitmaps")
+
+    def __init__(self, version: Optional[int] = None):
+        self.version = version
+        self.question_ids: List[int] = []
+        self.positions: Dict[int, int] = {}
+        self.members = 0
+        self.bitmaps: Dict[str, int] = {}
+
+    def set_tags(self, question_id: int, tags: Iterable[str]):
+        position = self.positions.get(question_id)
+        if position is None:
+            position = self.positions[question_id] = len(self.question_ids)
+            self.question_ids.append(question_id)
+        bit = 1 << position
+        tags = set(normalize_tags(tags))
+        for tag, bitmap in list(self.bitmaps.items()):
+            if bitmap & bit and tag not in tags:
+                self._clear(tag, bit)
+        for tag in tags:
+            self.bitmaps[tag] = self.bitmaps.get(tag, 0) | bit
+        self.members |= bit
+
+    def remove(self, question_id: int):
+        position = self.positions.pop(question_id, None)
+        if position is None:
+            return
+        bit = 1 << position
+        for tag, bitmap in list(self.bitmaps.items()):
+            if bitmap & bit:
+                self._clear(tag, bit)
+        self.members &= ~bit
+
+    def _clear(self, tag: str, bit: int):
+        bitmap = self.bitmaps[tag] & ~bit
+        if bitmap:
+            self.bitmaps[tag] = bitmap
+        else:
+            del self.bitmaps[tag]
+
+    def match(self, tags: Iterable[str]) -> int:
+        """
+        모든 태그를 가진 문제의 비트맵을 반환하는 함수 (태그가 없으면 전체 문제)
+        """
+        bitmap = self.members
+        for tag in normalize_tags(tags):
+            bitmap &= self.bitmaps.get(tag, 0)
+            if not bitmap:
+                break
+        return bitmap
+
+    def count(self, tags: Iterable[str]) -> int:
+        return bin(self.match(tags)).count("1")
+
+    def tag_counts(self) -> Dict[str, int]:
+        return {tag: bin(bitmap).count("1") for tag, bitmap in sorted(self.bitmaps.items())}
+
+    def sample(self, blueprint: List[dict], seed: str) -> List[int]:
+        """
+        출제 구성표 항목마다 조건에 맞는 문제를 count 개씩 뽑는 함수
+
+        앞 항목에서 뽑힌 문제는 뒤 항목에서 제외하며, 후보가 부족하면 있는 만큼만 뽑습니다.
+        같은 seed 이면 항상 같은 결과를 반환합니다.
+        """
+        rng = random.Random(seed)
+        taken = 0
+        selected = []
+        for item in blueprint:
+            candidates = bitmap_positions(self.match(item.get("tags") or []) & ~taken)
+            picked = rng.sample(candidates, min(item["count"], len(candidates)))
+            for position in picked:
+                taken |= 1 << position
+            selected.extend(self.question_ids[position] for position in picked)
+        rng.shuffle(selected)
+        return selected
+
+class TagIndexRegistry:
+    """
+    퀴즈별 역색인을 프로세스 내부에 보관하는 저장소
+
+    역색인은 퀴즈 컨텐츠 버전과 함께 저장합니다.
+    - 같은 워커의 문제 생성/수정/삭제는 apply_question 으로 바로 반영합니다. (버전이 1 만 올랐을 때)
+    - 다른 워커의 변경으로 버전이 달라지면 get 에서 loader 로 한 번에 다시 적재합니다.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[int, QuizTagIndex] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "rebuilds": 0, "incremental_updates": 0}
+
+    def get(
+        self,
+        quiz_id: int,
+        version: Optional[int],
+        loader: Callable[[], Iterable[Tuple[int, Optional[str]]]],
+    ) -> QuizTagIndex:
+        """
+        역색인을 반환하는 함수 (loader 는 (문제 ID, 태그 또는 None) 목록을 반환)
+
+        버전을 알 수 없으면(Redis 장애) 저장하지 않고 매번 다시 적재합니다.
+        """
+        with self._lock:
+            index = self._indexes.get(quiz_id)
+            if index is not None and version is not None and index.version == version:
+                self.stats["hits"] += 1
+                return index
+
+        index = QuizTagIndex(version)
+        tags_by_question: Dict[int, List[str]] = {}
+        for question_id, tag in loader():
+            tags = tags_by_question.setdefault(question_id, [])
+            if tag is not None:
+                tags.append(tag)
+        for question_id in sorted(tags_by_question):
+            index.set_tags(question_id, tags_by_question[question_id])
+
+        with self._lock:
+            self.stats["rebuilds"] += 1
+            if version is not None:
+                self._indexes[quiz_id] = index
+        return index
+
+    def apply_question(self, quiz_id: int, version: Optional[int], question_id: int, tags: Optional[Iterable[str]]):
+        """
+        문제 생성/수정(tags) 또는 삭제(tags=None)를 역색인에 반영하는 함수
+
+        반영할 수 없으면(버전 불일치, Redis 장애) 역색인을 버려 다음 조회 때 다시 적재되도록 합니다.
+        """
+        with self._lock:
+            index = self._indexes.get(quiz_id)
+            if index is None:
+                return
+            if version is None or index.version is None or version != index.version + 1:
+                del self._indexes[quiz_id]
+                return
+            if tags is None:
+                index.remove(question_id)
+            else:
+                index.set_tags(question_id, tags)
+            index.version = version
+            self.stats["incremental_updates"] += 1
+
+    def discard(self, quiz_id: int):
+        with self._lock:
+            self._indexes.pop(quiz_id, None)
+
+    def snapshot_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["quizzes"] = len(self._indexes)
+        return stats
+
+tag_indexes = TagIndexRegistry()
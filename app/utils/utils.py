@@ -22,11 +22,13 @@ def transform_to_quiz_submit(data):
     
     return quiz_request
 
-import redis
 from app.core.config import settings
+from app.db.redis import LazyRedisClient, ResilientRedis, create_redis_client
 
-redis_client = redis.Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    decode_responses=True
-)
\ No newline at end of file
+redis_client = LazyRedisClient(lambda: create_redis_client(settings.REDIS_URL))
+
+def get_redis() -> ResilientRedis:
+    """
+    Redis 클라이언트 의존성 (Depends(get_redis))
+    """
+    return redis_client.get_client()
\ No newline at end of file
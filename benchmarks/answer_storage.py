@@ -0,0 +1,80 @@
+"""
+제출 답안 저장 형식 비교 (선택지당 한 행 vs 압축 답안지)
+
+    python -m benchmarks.answer_storage --attempts 20000 --questions 20 --choices 5
+
+임시 SQLite 파일에 같은 응시들을 두 형식으로 저장한 뒤 dbstat 으로 테이블+인덱스 크기를 비교하고,
+압축 답안지를 정답지와 비교하여 다시 채점하는 데 걸리는 시간(중앙값)을 측정합니다.
+- rows: user_quiz_attempt_answers (제공된 선택지마다 한 행, 인덱스 포함)
+- packed: user_quiz_attempt_snapshots.answer_sheet (응시당 문제 수 + 1 바이트)
+
+스냅샷(문제/선택지 순서)은 두 형식 모두 저장하므로 비교에서 제외합니다.
+"""
+import argparse
+import os
+import random
+import tempfile
+
+from benchmarks.common import configure_env, measure_call
+
+def table_bytes(db, tables) -> int:
+    from sqlalchemy import text
+
+    names = set(tables)
+    for table in tables:
+        names.update(row[0] for row in db.execute(text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"), {"table": table}))
+    rows = db.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all()
+    return sum(size for name, size in rows if name in names)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attempts", type=int, default=20000)
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--choices", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "answer_storage.db")
+    configure_env(DATABASE_URL=f"sqlite:///{path}")
+
+    from sqlalchemy import text
+    from app.db.session import Base, SessionLocal, get_engine
+    from app.models.user import UserQuizAttemptAnswer
+    from app.utils.answer_sheet import answer_key, encode_answer_sheet, score_answer_sheet
+
+    Base.metadata.create_all(bind=get_engine())
+    rng = random.Random(0)
+    layout = [
+        [question, [question * 100 + choice for choice in range(args.choices)]]
+        for question in range(1, args.questions + 1)
+    ]
+    key = answer_key(layout, [choice_ids[0] for _, choice_ids in layout])
+    sheets = []
+    with SessionLocal() as db:
+        # 외래 키는 SQLite 기본 설정에서 검사하지 않으므로 응시/문제 행 없이 답안만 넣습니다.
+        for attempt_id in range(1, args.attempts + 1):
+            db.bulk_insert_mappings(UserQuizAttemptAnswer, [
+                {"user_quiz_attempt_id": attempt_id, "question_id": question_id, "choice_id": choice_id}
+                for question_id, choice_ids in layout for choice_id in choice_ids
+            ])
+            sheets.append(encode_answer_sheet(layout, {question_id: rng.choice(choice_ids) for question_id, choice_ids in layout}))
+        db.execute(
+            text("INSERT INTO user_quiz_attempt_snapshots (attempt_id, quiz_id, payload, answer_sheet) VALUES (:attempt_id, 1, '', :sheet)"),
+            [{"attempt_id": attempt_id, "sheet": sheet} for attempt_id, sheet in enumerate(sheets, start=1)],
+        )
+        db.commit()
+        rows_bytes = table_bytes(db, ["user_quiz_attempt_answers"])
+
+    packed_bytes = sum(len(sheet) for sheet in sheets)
+    elapsed, peak = measure_call(lambda: sum(score_answer_sheet(sheet, key) for sheet in sheets), args.repeat)
+
+    print(f"{args.attempts:,} attempts x {args.questions} questions x {args.choices} choices\n")
+    print("| format | bytes per attempt |")
+    print("|---|---:|")
+    print(f"| rows (table + indexes) | {rows_bytes / args.attempts:,.0f} |")
+    print(f"| packed answer sheet | {packed_bytes / args.attempts:,.0f} |")
+    print(f"\nregrade {args.attempts:,} packed sheets: {elapsed:,.1f} ms (peak {peak:,.0f} KiB)")
+    os.remove(path)
+
+if __name__ == "__main__":
+    main()
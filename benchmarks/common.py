@@ -0,0 +1,41 @@
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def configure_env(**overrides):
+    """
+    app 모듈을 불러오기 전에 필수 설정값을 채우는 함수 (이미 설정된 환경 변수는 유지)
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    defaults = {
+        "BASE_URL": "http://localhost", "REDIS_HOST": "localhost", "REDIS_PORT": "6379",
+        "REDIS_URL": "redis://localhost:6379/0", "DATABASE_URL": "sqlite://", "POSTGRES_USER": "-",
+        "POSTGRES_PASSWORD": "-", "POSTGRES_DB": "-", "SECRET_KEY": "benchmark-secret",
+        "ALGORITHM": "HS256", "ACCESS_TOKEN_EXPIRE_MINUTES": "30", "DB_ECHO": "false",
+    }
+    defaults.update(overrides)
+    for name, value in defaults.items():
+        os.environ.setdefault(name, value)
+
+def measure_call(func, repeat: int = 5):
+    """
+    func 를 repeat 회 실행하여 (중앙값 ms, 최대 메모리 peak KiB) 를 반환하는 함수
+
+    tracemalloc 은 실행 속도를 떨어뜨리므로 메모리는 별도로 한 번 더 실행하여 측정합니다.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
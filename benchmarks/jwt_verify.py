@@ -0,0 +1,89 @@
+"""
+JWT 서명/검증 처리량 벤치마크 (단일 프로세스 = 코어 1개 기준)
+
+    python -m benchmarks.jwt_verify --seconds 2
+
+측정 항목:
+- HS256 / ES256 토큰 발급 (키 객체 캐시 유무)
+- HS256 / ES256 토큰 검증 (키 객체 캐시 유무)
+- 검증된 토큰 LRU 적중 시 (sha256 + dict 조회)
+
+ES256 은 python-jose 의 cryptography 백엔드가 있으면 그것을, 없으면 순수 파이썬 ecdsa 백엔드를 사용합니다.
+(순수 파이썬 백엔드는 수십 배 느리므로 운영 환경에서는 python-jose[cryptography] 를 설치하세요.)
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from jose import jwk, jwt
+
+from benchmarks.common import configure_env
+
+def generate_es256_keys():
+    try:
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        public_pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode()
+        return private_pem, public_pem, "cryptography"
+    except ImportError:
+        from ecdsa import NIST256p, SigningKey
+
+        signing_key = SigningKey.generate(curve=NIST256p)
+        return signing_key.to_pem().decode(), signing_key.get_verifying_key().to_pem().decode(), "ecdsa"
+
+def measure(func, seconds: float) -> float:
+    count = 0
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    while time.perf_counter() < deadline:
+        func()
+        count += 1
+    return count / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="항목별 측정 시간 (초)")
+    args = parser.parse_args()
+
+    configure_env()
+    from app.core.security import VerifiedTokenCache
+
+    claims = {
+        "sub": "1", "role": "user", "active": True, "ver": 0, "typ": "access",
+        "exp": datetime.now(timezone.utc) + timedelta(hours=1),
+    }
+    private_pem, public_pem, backend = generate_es256_keys()
+    keys = {
+        "HS256": ("benchmark-secret", "benchmark-secret"),
+        "ES256": (private_pem, public_pem),
+    }
+
+    print(f"ES256 backend: {backend}, {args.seconds}s per case, 1 process\n")
+    print(f"{'case':<40}{'ops/s':>12}")
+    for algorithm, (sign_raw, verify_raw) in keys.items():
+        sign_key = jwk.construct(sign_raw, algorithm)
+        verify_key = jwk.construct(verify_raw, algorithm)
+        token = jwt.encode(claims, sign_key, algorithm=algorithm)
+
+        cases = {
+            f"{algorithm} encode (raw key)": lambda: jwt.encode(claims, sign_raw, algorithm=algorithm),
+            f"{algorithm} encode (cached key)": lambda: jwt.encode(claims, sign_key, algorithm=algorithm),
+            f"{algorithm} decode (raw key)": lambda: jwt.decode(token, verify_raw, algorithms=[algorithm]),
+            f"{algorithm} decode (cached key)": lambda: jwt.decode(token, verify_key, algorithms=[algorithm]),
+        }
+        cache = VerifiedTokenCache(4096)
+        cache.set(token, jwt.decode(token, verify_key, algorithms=[algorithm]))
+        cases[f"{algorithm} verified-token LRU hit"] = lambda: cache.get(token)
+
+        for name, func in cases.items():
+            print(f"{name:<40}{measure(func, args.seconds):>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+문제 검색(search_questions) 지연 시간 측정
+
+    python -m benchmarks.question_search --questions 1000000
+
+임시 SQLite 파일(FTS5)에 문제 --questions 개를 만든 뒤, 자주 나오는 단어 / 드문 단어 / 두 단어 AND /
+퀴즈 한정 검색의 첫 페이지 응답 시간(중앙값)을 측정합니다.
+Postgres(GIN 인덱스)로 측정하려면 --database-url 을 지정하세요. (빈 데이터베이스여야 합니다)
+
+목표: 문제 100만 개에서 첫 페이지(20건) 중앙값 50ms 이하
+관련도 순 정렬은 일치하는 문서를 모두 채점하므로, 대부분의 문제에 나오는 단어(word0 처럼 불용어에 가까운 단어)는
+일치 건수에 비례하여 느려집니다. (SQLite, 100만 개 기준 드문 단어 약 1ms, word0 약 1.1s)
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import configure_env, measure_call
+
+VOCABULARY = [f"word{i}" for i in range(5000)]
+
+def build_bank(db, questions: int, quizzes: int, chunk_size: int = 10000) -> list:
+    from app.crud.question import sync_search_documents
+    from app.models.question import Question
+    from app.models.quiz import Quiz
+    from app.models.user import User
+
+    rng = random.Random(0)
+    user = User(email="bench@example.com", name="bench", password="-")
+    db.add(user)
+    db.flush()
+    quiz_objects = [Quiz(title=f"bench {i}", user_id=user.id) for i in range(quizzes)]
+    db.add_all(quiz_objects)
+    db.flush()
+    quiz_ids = [quiz.id for quiz in quiz_objects]
+
+    # 자주 나오는 단어(word0~9)와 드문 단어가 섞이도록 지프 분포 비슷하게 뽑습니다.
+    weights = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    for start in range(0, questions, chunk_size):
+        count = min(chunk_size, questions - start)
+        # 대량 생성이라 order 자동 지정(before_insert) 대신 값을 직접 넣습니다.
+        db.bulk_insert_mappings(Question, [
+            {
+                "quiz_id": quiz_ids[(start + i) % quizzes],
+                "text": " ".join(rng.choices(VOCABULARY, weights, k=12)),
+                "order": start + i + 1,
+            }
+            for i in range(count)
+        ])
+        question_ids = [row[0] for row in db.query(Question.id).order_by(Question.id.desc()).limit(count)]
+        sync_search_documents(db, question_ids)
+        db.commit()
+    return quiz_ids
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=100000)
+    parser.add_argument("--quizzes", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    path = None
+    if args.database_url is None:
+        path = os.path.join(tempfile.mkdtemp(), "question_search.db")
+    configure_env(DATABASE_URL=args.database_url or f"sqlite:///{path}")
+
+    from app.crud.question import search_questions
+    from app.db.session import Base, SessionLocal, get_engine
+    import app.models.user  # noqa: F401
+
+    Base.metadata.create_all(bind=get_engine())
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        quiz_ids = build_bank(db, args.questions, args.quizzes)
+    print(f"indexed {args.questions:,} questions in {time.perf_counter() - started:,.1f}s\n")
+
+    cases = (
+        ("frequent term", "word0", None),
+        ("rare term", "word4321", None),
+        ("two terms (AND)", "word1 word2", None),
+        ("frequent term, one quiz", "word0", quiz_ids[0]),
+    )
+    print(f"| query | first page of {args.limit} (ms) | has_more |")
+    print("|---|---:|---|")
+    with SessionLocal() as db:
+        for name, query, quiz_id in cases:
+            elapsed, _ = measure_call(lambda: search_questions(db, query, quiz_id, 0, args.limit), args.repeat)
+            _, has_more = search_questions(db, query, quiz_id, 0, args.limit)
+            print(f"| {name} | {elapsed:,.2f} | {has_more} |")
+
+    if path:
+        os.remove(path)
+
+if __name__ == "__main__":
+    main()
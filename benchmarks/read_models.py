@@ -0,0 +1,93 @@
+"""
+ORM 엔티티 조회와 컬럼 전용 read model(QuestionRow/ChoiceRow) 조회 비교
+
+    python -m benchmarks.read_models --questions 10000 --choices 5
+
+임시 SQLite 파일에 문제 --questions 개(문제당 선택지 --choices 개)짜리 퀴즈를 만든 뒤,
+응시 시작(read_random_questions)과 같은 모양의 dict 를 만드는 데 걸리는 시간(중앙값)과
+tracemalloc 최대 메모리를 비교합니다. Postgres 로 측정하려면 --database-url 을 지정하세요.
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.common import configure_env, measure_call
+
+def build_quiz(db, questions: int, choices: int) -> int:
+    from app.models.choice import Choice
+    from app.models.question import Question
+    from app.models.quiz import Quiz
+    from app.models.user import User
+
+    user = User(email="bench@example.com", name="bench", password="-")
+    db.add(user)
+    db.flush()
+    quiz = Quiz(title="bench", description="bench", user_id=user.id)
+    db.add(quiz)
+    db.flush()
+    # 대량 생성이라 order 자동 지정(before_insert) 대신 값을 직접 넣습니다.
+    db.bulk_insert_mappings(Question, [
+        {"quiz_id": quiz.id, "text": f"문제 {i}", "order": i} for i in range(1, questions + 1)
+    ])
+    question_ids = [row[0] for row in db.query(Question.id).filter(Question.quiz_id == quiz.id).all()]
+    db.bulk_insert_mappings(Choice, [
+        {"question_id": question_id, "text": f"{question_id}-{j}", "is_correct": j == 1, "order": j}
+        for question_id in question_ids for j in range(1, choices + 1)
+    ])
+    db.commit()
+    return quiz.id
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=10000)
+    parser.add_argument("--choices", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    path = None
+    if args.database_url is None:
+        path = os.path.join(tempfile.mkdtemp(), "read_models.db")
+    configure_env(DATABASE_URL=args.database_url or f"sqlite:///{path}")
+
+    from sqlalchemy.orm import joinedload
+
+    from app.crud import quiz as crud_quiz
+    from app.db.session import Base, SessionLocal, get_engine
+    from app.models.question import Question
+
+    Base.metadata.create_all(bind=get_engine())
+    with SessionLocal() as db:
+        quiz_id = build_quiz(db, args.questions, args.choices)
+
+    def orm_entities():
+        with SessionLocal() as db:
+            questions = (
+                db.query(Question).filter(Question.quiz_id == quiz_id)
+                .options(joinedload(Question.choices)).order_by(Question.id).all()
+            )
+            return [
+                {"id": q.id, "text": q.text, "choices": [{"id": c.id, "text": c.text} for c in q.choices]}
+                for q in questions
+            ]
+
+    def read_models():
+        with SessionLocal() as db:
+            return [
+                {"id": q.id, "text": q.text, "choices": [{"id": c.id, "text": c.text} for c in choices]}
+                for q, choices in crud_quiz.read_questions_with_choices_by_quiz(db, quiz_id)
+            ]
+
+    assert orm_entities() == read_models()
+    print(f"{args.questions} questions x {args.choices} choices, median of {args.repeat}\n")
+    print("| path | time (ms) | peak memory (KiB) |")
+    print("|---|---:|---:|")
+    for name, func in (("ORM entities + joinedload", orm_entities), ("QuestionRow/ChoiceRow", read_models)):
+        elapsed, peak = measure_call(func, args.repeat)
+        print(f"| {name} | {elapsed:,.1f} | {peak:,.0f} |")
+
+    if path:
+        os.remove(path)
+
+if __name__ == "__main__":
+    main()
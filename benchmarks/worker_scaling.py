@@ -0,0 +1,98 @@
+"""
+gunicorn 워커 수에 따른 처리량 변화 측정
+
+    python -m benchmarks.worker_scaling --workers 1 2 4 8 --path /api/v1/quiz/1 --token <access_token>
+
+워커 수마다 gunicorn.conf.py 로 서버를 띄운 뒤, 동시 요청 --concurrency 개로 --seconds 초 동안
+--path 를 호출하고 초당 처리량과 지연 시간(p50/p99)을 markdown 표로 출력합니다.
+DB/Redis 는 .env 설정을 그대로 사용하므로 docker compose 의 db, redis 를 먼저 띄워 두세요.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), BIND=f"127.0.0.1:{port}", DB_ECHO="false")
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+def wait_ready(base_url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/docs", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+async def run_load(url: str, headers: dict, concurrency: int, seconds: float):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def user(client: httpx.AsyncClient):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(user(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+    return len(latencies) / elapsed, percentile(0.5), percentile(0.99), errors
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--path", default="/api/v1/quiz/1")
+    parser.add_argument("--token", help="Authorization: Bearer 토큰")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--warmup", type=float, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+
+    print(f"path={args.path} concurrency={args.concurrency} duration={args.seconds}s cpus={os.cpu_count()}\n")
+    print("| workers | req/s | p50 (ms) | p99 (ms) | errors |")
+    print("|---:|---:|---:|---:|---:|")
+    for workers in args.workers:
+        server = start_server(workers, args.port)
+        try:
+            wait_ready(base_url)
+            asyncio.run(run_load(base_url + args.path, headers, args.concurrency, args.warmup))
+            throughput, p50, p99, errors = asyncio.run(
+                run_load(base_url + args.path, headers, args.concurrency, args.seconds)
+            )
+            print(f"| {workers} | {throughput:,.0f} | {p50:.1f} | {p99:.1f} | {errors} |")
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+
+if __name__ == "__main__":
+    main()
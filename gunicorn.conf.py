@@ -0,0 +1,37 @@
+# 운영 환경 실행 설정
+#
+#   poetry run gunicorn -c gunicorn.conf.py app.main:app
+#
+# 워커 수는 WEB_CONCURRENCY (기본값: CPU 코어 수) 로 조정합니다.
+# 워커마다 DB 풀(DB_POOL_SIZE + DB_MAX_OVERFLOW)과 Redis 풀(REDIS_MAX_CONNECTIONS)을 가지므로
+# 전체 연결 수 = 워커 수 x 풀 크기 입니다.
+
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# 앱을 fork 전에 한 번만 import 하여 워커 기동 시간과 메모리(copy-on-write)를 줄입니다.
+preload_app = True
+
+# SIGTERM 수신 후 진행 중인 요청(제출 포함)을 마칠 때까지 기다리는 시간
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("TIMEOUT", 60))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+
+def post_fork(server, worker):
+    """
+    preload 시 부모 프로세스에서 만들어진 DB/Redis 연결을 워커가 공유하지 않도록 버립니다.
+    """
+    from app.db import session
+    from app.utils.utils import redis_client
+
+    if session._engine is not None:
+        session._engine.dispose(close=False)
+    if redis_client.initialized:
+        redis_client.connection_pool.reset()
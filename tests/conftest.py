@@ -0,0 +1,102 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.db.session import Base, get_db
+from app.main import app
+from app.utils.cache import clear_local_caches
+from app.utils.utils import redis_client
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    redis_client 를 프로세스 내부 fakeredis 로 바꾸는 fixture (Lua 스크립트 포함, fakeredis[lua] 필요)
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_client, "_client", client)
+    clear_local_caches()
+    yield client
+    clear_local_caches()
+
+@pytest.fixture
+def session_factory():
+    """
+    테스트마다 새로 만드는 in-memory SQLite 세션 팩토리
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+@pytest.fixture
+def db(session_factory):
+    with session_factory() as session:
+        yield session
+
+@pytest.fixture
+def api(fake_redis, session_factory, monkeypatch):
+    """
+    in-memory SQLite 와 fakeredis 를 사용하는 TestClient (lifespan 의 백그라운드 작업은 실행하지 않음)
+    """
+    def override_get_db():
+        with session_factory() as session:
+            yield session
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_get_db)
+    return TestClient(app)
+
+@pytest.fixture
+def accounts(api):
+    """
+    관리자/사용자 계정과 인증 헤더, 관리자가 만든 샘플 퀴즈(문제 100개 x 선택지 5개)
+    """
+    tag = uuid.uuid4().hex[:8]
+    result = {}
+    for role, is_superuser in (("admin", True), ("user", False)):
+        email = f"{role}{tag}@example.com"
+        created = api.post("/api/v1/user/", json={
+            "email": email, "name": role, "is_active": True, "is_superuser": is_superuser, "password": "password",
+        })
+        assert created.status_code == 201, created.text
+        token = api.post("/api/v1/auth/token/", json={"email": email, "password": "password"}).json()["access_token"]
+        result[f"{role}_id"] = created.json()["id"]
+        result[f"{role}_headers"] = {"Authorization": f"Bearer {token}"}
+    quiz = api.post(
+        "/api/v1/quiz/sample",
+        params={"title": "sample", "description": "sample", "user_id": result["admin_id"]},
+        headers=result["admin_headers"],
+    )
+    assert quiz.status_code == 200, quiz.text
+    result["quiz_id"] = quiz.json()["id"]
+    return result
+
+@pytest.fixture
+def attempt(api, accounts):
+    """
+    사용자가 샘플 퀴즈를 시작한 응시 (응시 ID, 문제 목록, 제출 요청 본문)
+    """
+    quiz_id = accounts["quiz_id"]
+    started = api.get(f"/api/v1/quiz/{quiz_id}/start", headers=accounts["user_headers"])
+    assert started.status_code == 200, started.text
+    data = started.json()
+    attempt_id = next(
+        item["user_quiz_attempt_id"]
+        for item in api.get("/api/v1/quiz/attempts/active", headers=accounts["user_headers"]).json()["attempts"]
+        if item["quiz_id"] == quiz_id
+    )
+    # 선택하지 않은 문제는 응시 중 저장된 답안으로 채점합니다.
+    submitted = [
+        {**question, "choices": [{**choice, "is_selected": False} for choice in question["choices"]]}
+        for question in data["questions"]
+    ]
+    payload = {
+        "user_id": accounts["user_id"],
+        "quiz_attempt_id": attempt_id,
+        "answers": [{"quiz_id": quiz_id, "title": data["title"], "description": data["description"], "questions": submitted}],
+    }
+    return {"quiz_id": quiz_id, "attempt_id": attempt_id, "questions": data["questions"], "payload": payload}
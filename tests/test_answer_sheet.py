@@ -0,0 +1,51 @@
+import pytest
+
+from app.utils.answer_sheet import (
+    SHEET_FORMAT_UINT8, SHEET_FORMAT_UINT16, answer_key, decode_answer_sheet, encode_answer_sheet, expand_answer_sheet,
+    layout_from_arrays, layout_to_arrays, score_answer_sheet,
+)
+
+LAYOUT = [[10, [101, 102, 103]], [20, [201, 202]], [30, [301, 302, 303, 304]]]
+
+def test_round_trip_keeps_answers_and_unanswered():
+    sheet = encode_answer_sheet(LAYOUT, {10: 103, 30: 301})
+    assert sheet[0] == SHEET_FORMAT_UINT8
+    assert len(sheet) == 1 + len(LAYOUT)
+    assert list(decode_answer_sheet(sheet)) == [3, 0, 1]
+    assert expand_answer_sheet(LAYOUT, sheet) == {10: 103, 20: None, 30: 301}
+
+def test_choice_outside_snapshot_is_unanswered():
+    sheet = encode_answer_sheet(LAYOUT, {10: 999, 20: 202})
+    assert expand_answer_sheet(LAYOUT, sheet) == {10: None, 20: 202, 30: None}
+
+def test_switches_to_uint16_past_255_choices():
+    wide = [[1, list(range(1000, 1300))], [2, [5, 6]]]
+    sheet = encode_answer_sheet(wide, {1: 1299, 2: 5})
+    assert sheet[0] == SHEET_FORMAT_UINT16
+    assert len(sheet) == 1 + 2 * len(wide)
+    # 리틀 엔디언 2바이트 칸
+    assert sheet[1:3] == (300).to_bytes(2, "little")
+    assert list(decode_answer_sheet(sheet)) == [300, 1]
+    assert expand_answer_sheet(wide, sheet) == {1: 1299, 2: 5}
+
+    # 255 번째 선택지까지는 1바이트 칸을 씁니다.
+    assert encode_answer_sheet(wide, {1: 1254})[0] == SHEET_FORMAT_UINT8
+
+def test_score_against_answer_key():
+    key = answer_key(LAYOUT, [102, 202, 303, 304])
+    assert list(decode_answer_sheet(key)) == [2, 2, 3]
+    assert score_answer_sheet(encode_answer_sheet(LAYOUT, {10: 102, 20: 201, 30: 303}), key) == 2
+    assert score_answer_sheet(encode_answer_sheet(LAYOUT, {}), key) == 0
+
+def test_invalid_sheets_are_rejected():
+    with pytest.raises(ValueError):
+        decode_answer_sheet(b"")
+    with pytest.raises(ValueError):
+        decode_answer_sheet(bytes([9, 1]))
+    with pytest.raises(ValueError):
+        expand_answer_sheet(LAYOUT, encode_answer_sheet(LAYOUT[:2], {}))
+
+def test_layout_arrays_round_trip():
+    arrays = layout_to_arrays(LAYOUT)
+    assert arrays == ([10, 20, 30], [3, 2, 4], [101, 102, 103, 201, 202, 301, 302, 303, 304])
+    assert layout_from_arrays(*arrays) == LAYOUT
@@ -0,0 +1,51 @@
+from app.core.config import settings
+from app.crud.quiz import attempt_answers_key
+from app.models.user import UserQuizAttemptAnswer
+
+def _answer(api, accounts, attempt, question):
+    response = api.patch(
+        f"/api/v1/quiz/{attempt['quiz_id']}/answer",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json={
+            "quiz_attempt_id": attempt["attempt_id"],
+            "question_id": question["id"],
+            "selected_choice_id": question["choices"][0]["id"],
+        },
+        headers=accounts["user_headers"],
+    )
+    assert response.status_code == 200, response.text
+
+def test_answers_hash_expires_and_is_deleted_after_grading(api, accounts, attempt, fake_redis):
+    key = attempt_answers_key(attempt["quiz_id"], attempt["attempt_id"])
+    _answer(api, accounts, attempt, attempt["questions"][0])
+    assert 0 < fake_redis.ttl(key) <= 1200
+
+    # 다음 답안을 쓰면 만료 시간을 다시 설정합니다.
+    fake_redis.expire(key, 5)
+    _answer(api, accounts, attempt, attempt["questions"][1])
+    assert fake_redis.ttl(key) > 5
+
+    submitted = api.post(
+        f"/api/v1/quiz/{attempt['quiz_id']}/submit",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json=attempt["payload"],
+        headers=accounts["user_headers"],
+    )
+    assert submitted.status_code == 200, submitted.text
+    assert not fake_redis.exists(key)
+
+def test_answer_rows_are_stored_with_created_at_identity(api, accounts, attempt, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "STORE_ANSWER_ROWS", True)
+    submitted = api.post(
+        f"/api/v1/quiz/{attempt['quiz_id']}/submit",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json=attempt["payload"],
+        headers=accounts["user_headers"],
+    )
+    assert submitted.status_code == 200, submitted.text
+
+    with session_factory() as db:
+        rows = db.query(UserQuizAttemptAnswer).filter(UserQuizAttemptAnswer.user_quiz_attempt_id == attempt["attempt_id"]).all()
+        assert len(rows) == sum(len(question["choices"]) for question in attempt["questions"])
+        # 기본 키 (id, created_at) 로 다시 조회할 수 있습니다.
+        assert db.get(UserQuizAttemptAnswer, (rows[0].id, rows[0].created_at)) is rows[0]
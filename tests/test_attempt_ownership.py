@@ -0,0 +1,40 @@
+from app.core.config import settings
+from app.crud.quiz import _start_lock_key
+
+def _other_user_headers(api):
+    api.post("/api/v1/user/", json={
+        "email": "other@example.com", "name": "other", "is_active": True, "is_superuser": False, "password": "password",
+    })
+    token = api.post("/api/v1/auth/token/", json={"email": "other@example.com", "password": "password"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+def test_attempt_belongs_to_the_caller(api, accounts, attempt):
+    other = _other_user_headers(api)
+    question = attempt["questions"][0]
+    answer = api.patch(
+        f"/api/v1/quiz/{attempt['quiz_id']}/answer",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json={"quiz_attempt_id": attempt["attempt_id"], "question_id": question["id"], "selected_choice_id": question["choices"][0]["id"]},
+        headers=other,
+    )
+    assert answer.status_code == 403
+    submit = api.post(
+        f"/api/v1/quiz/{attempt['quiz_id']}/submit",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json=attempt["payload"],
+        headers=other,
+    )
+    assert submit.status_code == 403
+
+    # 다른 사용자는 본인 응시를 새로 시작합니다. (다른 사용자의 응시를 재개하지 않음)
+    started = api.get(f"/api/v1/quiz/{attempt['quiz_id']}/start", headers=other)
+    assert started.status_code == 200
+    assert started.json()["user_quiz_attempt_id"] != attempt["attempt_id"]
+
+def test_start_returns_409_when_lock_is_held(api, accounts, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_LOCK_TIMEOUT_MS", 100)
+    fake_redis.set(_start_lock_key(accounts["quiz_id"], accounts["user_id"]), 1)
+    response = api.get(f"/api/v1/quiz/{accounts['quiz_id']}/start", headers=accounts["user_headers"])
+    assert response.status_code == 409
+    assert response.headers["Retry-After"] == "1"
+    assert api.get("/api/v1/quiz/attempts/active", headers=accounts["user_headers"]).json()["attempts"] == []
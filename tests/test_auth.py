@@ -0,0 +1,27 @@
+from app.crud.user import token_version_key
+
+def _login(api):
+    created = api.post("/api/v1/user/", json={
+        "email": "refresh@example.com", "name": "refresh", "is_active": True, "is_superuser": False, "password": "password",
+    })
+    assert created.status_code == 201, created.text
+    response = api.post("/api/v1/auth/token/", json={"email": "refresh@example.com", "password": "password"})
+    return created.json()["id"], response.json()
+
+def test_refresh_token_reuse_revokes_all_tokens(api, fake_redis):
+    _, tokens = _login(api)
+    rotated = api.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert rotated.status_code == 200
+    access = rotated.json()["access_token"]
+    assert api.get("/api/v1/quiz/attempts/active", headers={"Authorization": f"Bearer {access}"}).status_code == 200
+
+    # 이미 사용된 리프레시 토큰을 다시 쓰면 거부하고, 교체된 토큰까지 모두 무효화합니다.
+    assert api.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).status_code == 401
+    assert api.post("/api/v1/auth/refresh", json={"refresh_token": rotated.json()["refresh_token"]}).status_code == 401
+    assert api.get("/api/v1/quiz/attempts/active", headers={"Authorization": f"Bearer {access}"}).status_code == 401
+
+def test_token_version_cache_expires(api, fake_redis):
+    user_id, tokens = _login(api)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert api.get("/api/v1/quiz/attempts/active", headers=headers).status_code == 200
+    assert 0 < fake_redis.ttl(token_version_key(user_id))
@@ -0,0 +1,86 @@
+import time
+from datetime import datetime, timedelta
+
+import redis
+
+from app.core.config import settings
+from app.crud import quiz as crud_quiz
+from app.crud.quiz import ATTEMPT_DEADLINES_KEY
+from app.models.user import UserQuizAttempt, UserQuizAttemptProgress
+from app.tasks import auto_submit
+
+def _expire(session_factory, attempt_id: int):
+    with session_factory() as session:
+        session.query(UserQuizAttempt).filter(UserQuizAttempt.id == attempt_id).update(
+            {"deadline_at": datetime.now() - timedelta(hours=1)}
+        )
+        session.commit()
+
+def test_failed_auto_submit_is_retried_later(db, fake_redis, monkeypatch):
+    fake_redis.zadd(ATTEMPT_DEADLINES_KEY, {"1:2": time.time() - 3600})
+
+    def fail(db, quiz_id, user_quiz_attempt_id):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(auto_submit, "submit_expired_attempt", fail)
+    assert auto_submit.submit_expired_attempts(db) == 1
+    retry_at = fake_redis.zscore(ATTEMPT_DEADLINES_KEY, "1:2")
+    expected = time.time() + settings.AUTO_SUBMIT_RETRY_SECONDS - settings.AUTO_SUBMIT_GRACE_SECONDS
+    assert retry_at is not None and abs(retry_at - expected) < 5
+    # 재시도 시각 전에는 다시 가져가지 않습니다.
+    assert auto_submit.submit_expired_attempts(db) == 0
+
+def test_overdue_attempt_is_rescheduled_after_redis_flush(api, accounts, attempt, session_factory, fake_redis):
+    _expire(session_factory, attempt["attempt_id"])
+    fake_redis.flushall()
+
+    with session_factory() as db:
+        assert auto_submit.reschedule_overdue_attempts(db) == 1
+        assert auto_submit.reschedule_overdue_attempts(db) == 0
+        assert auto_submit.submit_expired_attempts(db) == 1
+        submitted = db.query(UserQuizAttempt.is_submit).filter(UserQuizAttempt.id == attempt["attempt_id"]).scalar()
+        assert submitted
+        assert auto_submit.reschedule_overdue_attempts(db) == 0
+
+def test_manual_submit_after_deadline_is_rejected(api, accounts, attempt, session_factory):
+    _expire(session_factory, attempt["attempt_id"])
+    response = api.post(
+        f"/api/v1/quiz/{attempt['quiz_id']}/submit",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json=attempt["payload"],
+        headers=accounts["user_headers"],
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "응시 시간이 종료되었습니다."
+
+def test_answer_during_redis_outage_checks_deadline_and_submission(api, accounts, attempt, session_factory, monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise redis.ConnectionError("redis down")
+
+    monkeypatch.setattr(crud_quiz, "read_active_attempt_deadline", unavailable)
+    question = attempt["questions"][0]
+
+    def answer():
+        return api.patch(
+            f"/api/v1/quiz/{attempt['quiz_id']}/answer",
+            params={"user_quiz_attempt_id": attempt["attempt_id"]},
+            json={"quiz_attempt_id": attempt["attempt_id"], "question_id": question["id"], "selected_choice_id": question["choices"][0]["id"]},
+            headers=accounts["user_headers"],
+        )
+
+    # 마감 전에는 Postgres 에 바로 저장합니다.
+    assert answer().status_code == 200
+    with session_factory() as db:
+        assert db.query(UserQuizAttemptProgress).filter(UserQuizAttemptProgress.attempt_id == attempt["attempt_id"]).count() == 1
+
+    _expire(session_factory, attempt["attempt_id"])
+    response = answer()
+    assert response.status_code == 400
+    assert response.json()["detail"] == "응시 시간이 종료되었습니다."
+
+    with session_factory() as db:
+        db.query(UserQuizAttempt).filter(UserQuizAttempt.id == attempt["attempt_id"]).update({"is_submit": True, "deadline_at": None})
+        db.commit()
+    response = answer()
+    assert response.status_code == 400
+    assert response.json()["detail"] == "이미 제출된 응시입니다."
@@ -0,0 +1,35 @@
+from app.crud import choice as crud_choice
+from app.crud import question as crud_question
+from app.models.choice import Choice
+from app.models.question import Question
+from app.models.quiz import Quiz
+from app.utils.content_version import bump_quiz_version
+
+def _question(db):
+    quiz = Quiz(title="quiz", description="quiz")
+    db.add(quiz)
+    db.flush()
+    question = Question(quiz_id=quiz.id, text="before", order=1)
+    question.choices = [Choice(text="a", is_correct=True, order=1)]
+    db.add(question)
+    db.commit()
+    return question
+
+def test_question_and_choice_entries_follow_quiz_version(db, fake_redis):
+    question = _question(db)
+    choice = question.choices[0]
+    assert crud_question.read_question(db, question.id)["text"] == "before"
+    assert crud_choice.get_choice(db, choice.id)["text"] == "a"
+
+    # id 로 무효화하지 않고 퀴즈 버전만 올려도 다시 적재합니다.
+    db.query(Question).filter(Question.id == question.id).update({"text": "after"})
+    db.query(Choice).filter(Choice.id == choice.id).update({"text": "b"})
+    db.commit()
+    assert crud_question.read_question(db, question.id)["text"] == "before"
+    bump_quiz_version(question.quiz_id)
+    assert crud_question.read_question(db, question.id)["text"] == "after"
+    assert crud_choice.get_choice(db, choice.id)["text"] == "b"
+
+def test_missing_question_and_choice(db, fake_redis):
+    assert crud_question.read_question(db, 999999) is None
+    assert crud_choice.get_choice(db, 999999) is None
@@ -0,0 +1,41 @@
+from app.crud.question import find_duplicate_questions, scan_duplicate_questions
+from app.models.quiz import Quiz
+from app.utils.dedup import lsh_buckets, minhash, pack_signature, similarity, text_hash, unpack_signature
+
+BASE = "다음 중 대한민국의 수도는 어디인가요?"
+
+def test_normalized_hash_and_signature_round_trip():
+    assert text_hash("What  is 2+2?") == text_hash("what is 2 2")
+    signature = minhash(BASE)
+    assert unpack_signature(pack_signature(signature)) == signature
+    assert similarity(signature, minhash(BASE + " (2점)")) > 0.8 > similarity(signature, minhash("광합성에 필요한 물질은?"))
+    assert all(0 <= bucket < 1 << 63 for _, bucket in lsh_buckets(signature))
+
+def test_create_rejects_exact_and_reports_near_duplicates(api, accounts):
+    quiz = api.post("/api/v1/quiz/", json={"title": "dedup", "description": "dedup"}, headers=accounts["admin_headers"])
+    quiz_id = quiz.json()["id"]
+
+    def create(text, **params):
+        return api.post("/api/v1/question/", params=params, json={"quiz_id": quiz_id, "text": text}, headers=accounts["admin_headers"])
+
+    first = create(BASE)
+    assert first.status_code == 200, first.text
+    exact = create("다음 중 대한민국의 수도는, 어디인가요")
+    assert exact.status_code == 409
+    assert exact.json()["detail"]["exact"] == [first.json()["question_id"]]
+
+    near = create("다음 중 대한민국의 수도는 어디인가요 (2점)")
+    assert near.status_code == 200
+    assert [item["question_id"] for item in near.json()["near_duplicates"]] == [first.json()["question_id"]]
+    assert create("다음 중 대한민국의 수도는 어디인가요", allow_duplicate=True).status_code == 200
+
+def test_scan_groups_duplicates(db, fake_redis):
+    from app.crud.question import create_question
+    from app.schemas.question import QuestionCreate
+
+    quiz = Quiz(title="scan", description="scan")
+    db.add(quiz)
+    db.commit()
+    ids = [create_question(db, QuestionCreate(quiz_id=quiz.id, text=text)).id for text in (BASE, BASE + "!", "광합성에 필요한 물질은?")]
+    assert scan_duplicate_questions(db, quiz.id) == [{"kind": "exact", "question_ids": ids[:2]}]
+    assert find_duplicate_questions(db, quiz.id, "광합성에 필요한 물질은", exclude_question_id=ids[2])["exact"] == []
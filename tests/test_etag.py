@@ -0,0 +1,21 @@
+from app.utils.content_version import quiz_version_key
+
+def test_questions_with_answers_are_not_publicly_cacheable(api, accounts):
+    response = api.get(f"/api/v1/question/{accounts['quiz_id']}/questions", headers=accounts["user_headers"])
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    cached = api.get(
+        f"/api/v1/question/{accounts['quiz_id']}/questions",
+        headers={**accounts["user_headers"], "If-None-Match": response.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+    assert cached.headers["Cache-Control"] == "private, no-cache"
+
+def test_missing_quiz_is_404_before_etag_check(api, accounts, fake_redis):
+    headers = {**accounts["user_headers"], "If-None-Match": "*"}
+    for path in ("/api/v1/quiz/999999", "/api/v1/question/999999/questions"):
+        assert api.get(path, headers=headers).status_code == 404
+    # 없는 퀴즈 ID 조회로 버전 키가 만들어지지 않음
+    assert fake_redis.get(quiz_version_key(999999)) is None
+    assert api.get(f"/api/v1/quiz/{accounts['quiz_id']}", headers=headers).status_code == 304
@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException, Response
+
+from app.core.config import settings
+from app.utils.idempotency import REPLAYED_HEADER, IdempotencyStore, idempotency_key
+
+@pytest.fixture
+def store(fake_redis):
+    return IdempotencyStore()
+
+def test_retry_replays_first_response(store, fake_redis):
+    calls = []
+
+    def handler():
+        calls.append(1)
+        return {"score": len(calls)}
+
+    first = Response()
+    assert store.run("test", 1, "key", "a", handler, first) == {"score": 1}
+    assert REPLAYED_HEADER not in first.headers
+
+    retried = Response()
+    assert store.run("test", 1, "key", "a", handler, retried) == {"score": 1}
+    assert retried.headers[REPLAYED_HEADER] == "true"
+    assert len(calls) == 1
+    # 처리가 끝나면 잠금을 지웁니다.
+    assert not fake_redis.exists(f"{idempotency_key('test', 1, 'key')}:lock")
+
+    # 키는 사용자마다 따로입니다.
+    assert store.run("test", 2, "key", "a", handler, Response()) == {"score": 2}
+
+def test_key_reused_for_other_request_is_422(store):
+    store.run("test", 1, "key", "a", lambda: {"ok": True}, Response())
+    with pytest.raises(HTTPException) as error:
+        store.run("test", 1, "key", "b", lambda: {"ok": True}, Response())
+    assert error.value.status_code == 422
+    assert store.snapshot_stats()["mismatched"] == 1
+
+def test_failed_request_is_not_stored(store):
+    def failing():
+        raise HTTPException(status_code=400)
+
+    with pytest.raises(HTTPException):
+        store.run("test", 1, "key", "a", failing, Response())
+    assert store.run("test", 1, "key", "a", lambda: {"ok": True}, Response()) == {"ok": True}
+
+def test_request_in_progress_is_409_after_waiting(store, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LOCK_TIMEOUT_MS", 200)
+    fake_redis.set(f"{idempotency_key('test', 1, 'key')}:lock", "other", px=60000)
+
+    with pytest.raises(HTTPException) as error:
+        store.run("test", 1, "key", "a", lambda: {"ok": True}, Response())
+    assert error.value.status_code == 409
+    assert error.value.headers["Retry-After"] == "1"
+
+def test_lock_is_renewed_while_handler_runs(store, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LOCK_TIMEOUT_MS", 150)
+    lock_key = f"{idempotency_key('test', 1, 'key')}:lock"
+    calls = []
+
+    def slow_handler():
+        calls.append(1)
+        time.sleep(0.6)
+        # 잠금 시간이 몇 번 지났어도 잠금이 남아 있습니다.
+        assert fake_redis.exists(lock_key)
+        return {"ok": True}
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(store.run("test", 1, "key", "a", slow_handler, Response())))
+    first.start()
+    time.sleep(0.3)
+    # 잠금이 만료되지 않았으므로 두 번째 요청은 처리하지 않고 기다리다 409 를 받습니다.
+    with pytest.raises(HTTPException) as error:
+        store.run("test", 1, "key", "a", slow_handler, Response())
+    assert error.value.status_code == 409
+    first.join()
+
+    assert results == [{"ok": True}]
+    assert len(calls) == 1
+    assert store.snapshot_stats()["renewed"] >= 2
+    assert not fake_redis.exists(lock_key)
@@ -0,0 +1,50 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# app.main import 에 허용하는 최대 시간 (ms), 느린 CI 에서는 IMPORT_TIME_BUDGET_MS 로 조정합니다.
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", 3000))
+
+CHECK_SCRIPT = """
+import json
+import app.main
+from app.core.security import get_pwd_context
+from app.db import session
+from app.utils.utils import redis_client
+print(json.dumps({
+    "engine": session._engine is not None,
+    "redis": redis_client.initialized,
+    "pwd_context": get_pwd_context.cache_info().currsize > 0,
+}))
+"""
+
+def import_app():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK_SCRIPT],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.rsplit("|", 1)[-1].strip() == "app.main":
+            cumulative_us = int(line.split("|")[1])
+    return json.loads(result.stdout.strip().splitlines()[-1]), cumulative_us
+
+def test_import_time():
+    ####################################################
+    # app.main import 시 DB 엔진, Redis, bcrypt 를 만들지 않는지 검증 #
+    ####################################################
+    created, cumulative_us = import_app()
+    assert created == {"engine": False, "redis": False, "pwd_context": False}
+
+    ###########################################
+    # app.main import 시간이 예산 이내인지 검증 #
+    ###########################################
+    assert cumulative_us is not None
+    assert cumulative_us / 1000 <= IMPORT_TIME_BUDGET_MS, f"app.main import took {cumulative_us / 1000:.0f}ms"
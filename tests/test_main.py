@@ -1,5 +1,3 @@
-import re
-
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -116,21 +114,19 @@ def test_start_quiz():
     # 6 사용자 시험 시작 시 해당 퀴즈에 대한 응시 기록 생성 API 테스트 #
     #######################################################
     quiz_data = start_resp.json()
-    user_quiz_attempt_key = f"quiz:{quiz_id}:user_quiz_attempts:"
-        
-    keys = redis_client.keys(f"{user_quiz_attempt_key}*")
-
-    assert keys, "Redis에 user_quiz_attempt 정보가 없음"
-
-    filtered_keys = [
-        k for k in keys if re.match(r".*:\d+$", k)
-    ]
+    # 응시 등록부에서 진행 중인 응시 조회 (KEYS 사용하지 않음)
+    active_resp = client.get(
+        "/api/v1/quiz/attempts/active",
+        headers={"Authorization": f"Bearer {user_token}"}
+    )
+    assert active_resp.status_code == 200
+    active_attempts = [a for a in active_resp.json()["attempts"] if a["quiz_id"] == quiz_id]
 
-    assert filtered_keys, "숫자로 끝나는 유효한 user_quiz_attempt 키가 없음"
+    assert active_attempts, "응시 등록부에 진행 중인 user_quiz_attempt 정보가 없음"
 
-    # 최신 키 선택
-    latest_key = sorted(filtered_keys)[-1]
-    user_quiz_attempt_id = int(latest_key.split(":")[-1])
+    # 최신 응시 선택
+    user_quiz_attempt_id = max(a["user_quiz_attempt_id"] for a in active_attempts)
+    assert redis_client.exists(f"quiz:{quiz_id}:user_quiz_attempts:{user_quiz_attempt_id}")
     
     
     # 유저가 문제에 대한 답안을 선택 할 때 1번부터 100번 문제에 대해 1,2,3,4,5 돌아가면서 선택
@@ -203,3 +199,10 @@ def test_start_quiz():
 
     assert result["score"] == 20
     assert result["total"] == 100
+
+    # 제출한 응시는 응시 등록부에서 제거됨
+    active_resp = client.get(
+        "/api/v1/quiz/attempts/active",
+        headers={"Authorization": f"Bearer {user_token}"}
+    )
+    assert user_quiz_attempt_id not in [a["user_quiz_attempt_id"] for a in active_resp.json()["attempts"]]
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from app.core.config import settings
+from app.crud.quiz import count_quiz_event, quiz_monitor_key, read_quiz_monitor
+from app.utils.monitor import MonitorHub, sse_event
+
+def test_hub_shares_snapshot_within_interval():
+    calls = []
+    hub = MonitorHub(lambda quiz_id: calls.append(quiz_id) or {"quiz_id": quiz_id, "read": len(calls)})
+
+    assert hub.get(1, 60) == {"quiz_id": 1, "read": 1}
+    assert hub.get(1, 60) == {"quiz_id": 1, "read": 1}
+    # 퀴즈마다 따로 읽고, interval 이 지나면 다시 읽습니다.
+    assert hub.get(2, 60)["read"] == 2
+    assert hub.get(1, 0)["read"] == 3
+    assert hub.snapshot_stats() == {"reads": 3, "shared": 1, "quizzes": 2}
+
+def test_concurrent_streams_read_once():
+    started = threading.Event()
+    calls = []
+
+    def slow_loader(quiz_id):
+        calls.append(quiz_id)
+        started.set()
+        time.sleep(0.2)
+        return {"quiz_id": quiz_id}
+
+    hub = MonitorHub(slow_loader)
+    results = []
+    streams = [threading.Thread(target=lambda: results.append(hub.get(1, 60))) for _ in range(5)]
+    streams[0].start()
+    started.wait(1)
+    for stream in streams[1:]:
+        stream.start()
+    for stream in streams:
+        stream.join()
+
+    # 읽는 중에 들어온 스트림은 기다렸다가 같은 스냅샷을 받습니다.
+    assert calls == [1]
+    assert results == [{"quiz_id": 1}] * 5
+    assert hub.snapshot_stats()["shared"] == 4
+
+def test_sse_event_format():
+    assert sse_event("stats", {"title": "퀴즈", "count": 1}) == 'event: stats\ndata: {"title": "퀴즈", "count": 1}\n\n'
+
+def test_counters_and_per_minute_rates(fake_redis, monkeypatch):
+    # 집계 중에 분이 바뀌지 않도록 시각을 고정합니다.
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    count_quiz_event(1, "started", per_minute="started")
+    count_quiz_event(1, "answered", "answer_writes", per_minute="answers")
+    count_quiz_event(1, "answer_writes", per_minute="answers")
+    assert 0 < fake_redis.ttl(quiz_monitor_key(1)) <= settings.MONITOR_TTL_SECONDS
+
+    monitor = read_quiz_monitor(1, window_minutes=3)
+    assert {name: monitor[name] for name in ("in_progress", "started", "answered", "answer_writes", "submitted")} == {
+        "in_progress": 0, "started": 1, "answered": 1, "answer_writes": 2, "submitted": 0,
+    }
+    per_minute = monitor["per_minute"]
+    assert len(per_minute["minutes"]) == 3
+    # 마지막 칸이 현재 분입니다.
+    assert per_minute["started"] == [0, 0, 1]
+    assert per_minute["answers"] == [0, 0, 2]
+    assert per_minute["submitted"] == [0, 0, 0]
+
+def test_monitor_api_counts_started_attempt(api, accounts, attempt, monkeypatch):
+    # 워커의 공유 스냅샷(quiz_monitor_hub)에 다른 테스트의 값이 남아 있어도 다시 읽습니다.
+    monkeypatch.setattr(settings, "MONITOR_INTERVAL", 0)
+    response = api.get(f"/api/v1/quiz/{attempt['quiz_id']}/monitor", headers=accounts["admin_headers"])
+    assert response.status_code == 200, response.text
+    assert (response.json()["in_progress"], response.json()["started"]) == (1, 1)
+    assert api.get(f"/api/v1/quiz/{attempt['quiz_id']}/monitor", headers=accounts["user_headers"]).status_code in (401, 403)
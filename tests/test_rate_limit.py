@@ -0,0 +1,65 @@
+import pytest
+
+from app.core.config import settings
+from app.utils.rate_limit import AdmissionController, RateLimiter, parse_rate, rate_limit_key
+
+@pytest.fixture
+def limiter(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setitem(settings.RATE_LIMITS, "test", "3/60")
+    return RateLimiter("test")
+
+def test_parse_rate():
+    assert parse_rate("10/60") == (10, 60.0)
+    assert parse_rate("5") == (5, 1.0)
+
+def test_bucket_is_exhausted_after_capacity(limiter, fake_redis):
+    results = [limiter.hit(1) for _ in range(4)]
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert [result.remaining for result in results] == [2, 1, 0, 0]
+    # 60초에 3번이므로 토큰 하나가 다시 차는 데 20초
+    assert results[-1].retry_after == pytest.approx(20, abs=0.5)
+    # 버킷은 가득 찰 때까지만 보관합니다.
+    assert 0 < fake_redis.ttl(rate_limit_key("test", 1)) <= 61
+
+    # 사용자마다 버킷이 따로 있습니다.
+    assert limiter.hit(2).allowed
+    assert limiter.stats == {"allowed": 4, "limited": 1, "errors": 0}
+
+def test_bucket_refills_with_elapsed_time(limiter, fake_redis):
+    for _ in range(3):
+        assert limiter.hit(1).allowed
+    assert not limiter.hit(1).allowed
+
+    # 마지막 확인 시각을 40초 앞당기면 토큰 두 개가 다시 찹니다.
+    key = rate_limit_key("test", 1)
+    fake_redis.hset(key, "ts", str(float(fake_redis.hget(key, "ts")) - 40))
+    assert [limiter.hit(1).allowed for _ in range(3)] == [True, True, False]
+
+    # 오래 지나도 용량 이상으로는 차지 않습니다.
+    fake_redis.hset(key, "ts", str(float(fake_redis.hget(key, "ts")) - 3600))
+    assert [limiter.hit(1).allowed for _ in range(4)] == [True, True, True, False]
+
+def test_disabled_policy_does_not_limit(limiter, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    assert limiter.hit(1) is None
+
+def test_admission_sheds_low_priority_first(monkeypatch):
+    monkeypatch.setattr(settings, "ADMISSION_MAX_IN_FLIGHT", 10)
+    monkeypatch.setattr(settings, "ADMISSION_LOW_PRIORITY_RATIO", 0.5)
+    monkeypatch.setattr(settings, "ADMISSION_NORMAL_PRIORITY_RATIO", 0.8)
+    controller = AdmissionController()
+
+    def admitted_at(in_flight):
+        controller.count = in_flight
+        return {priority: controller.admit(priority) for priority in ("low", "normal", "critical")}
+
+    assert admitted_at(5) == {"low": True, "normal": True, "critical": True}
+    assert admitted_at(6) == {"low": False, "normal": True, "critical": True}
+    assert admitted_at(9) == {"low": False, "normal": False, "critical": True}
+    assert admitted_at(11) == {"low": False, "normal": False, "critical": False}
+
+    stats = controller.snapshot_stats()
+    assert stats["limits"] == {"low": 5, "normal": 8, "critical": 10}
+    assert stats["priorities"]["low"] == {"admitted": 1, "shed": 3}
+    assert stats["peak"] == 11
@@ -0,0 +1,54 @@
+import pytest
+import redis
+from redis.client import Pipeline
+from redis.exceptions import TimeoutError
+
+from app.db.redis import CircuitBreaker, RedisCircuitOpenError, create_redis_client
+
+@pytest.fixture
+def failing_client(monkeypatch):
+    """
+    모든 명령이 타임아웃 나는 클라이언트와 서버로 보낸 명령 목록
+    """
+    sent = []
+
+    def timeout(self, *args, **options):
+        sent.append(args)
+        raise TimeoutError("timeout")
+
+    monkeypatch.setattr(redis.Redis, "execute_command", timeout)
+    monkeypatch.setattr(Pipeline, "execute", lambda self, raise_on_error=True: timeout(self, "EXEC"))
+    client = create_redis_client("redis://localhost:1/0")
+    client.retry_attempts = 2
+    client.breaker = CircuitBreaker(failure_threshold=100, reset_timeout=60)
+    return client, sent
+
+def test_only_idempotent_commands_are_retried(failing_client):
+    client, sent = failing_client
+    for call in (
+        lambda: client.get("key"),
+        lambda: client.setex("key", 10, "value"),
+        lambda: client.incr("key"),
+        lambda: client.hincrby("hash", "field"),
+        lambda: client.set("key", "value", nx=True),
+        lambda: client.evalsha("sha", 0),
+    ):
+        with pytest.raises(TimeoutError):
+            call()
+    assert [args[0] for args in sent] == ["GET"] * 3 + ["SETEX"] * 3 + ["INCRBY", "HINCRBY", "SET", "EVALSHA"]
+
+def test_pipeline_goes_through_breaker(failing_client):
+    client, sent = failing_client
+    client.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        pipe = client.pipeline(transaction=False)
+        pipe.get("key")
+        with pytest.raises(TimeoutError):
+            pipe.execute()
+    assert client.breaker.state == CircuitBreaker.OPEN
+
+    pipe = client.pipeline(transaction=False)
+    pipe.get("key")
+    with pytest.raises(RedisCircuitOpenError):
+        pipe.execute()
+    assert len(sent) == 2
@@ -0,0 +1,69 @@
+from app.core.config import settings
+from app.crud.quiz import (
+    REGISTRATIONS_LOADED_BIT, is_user_registered, load_registrations, quiz_registrations_key, quiz_registrations_version_key,
+    register_user_for_quiz, unregister_user_from_quiz,
+)
+from app.models.user import UserQuizRegistration
+
+def _start(api, accounts, headers):
+    return api.get(f"/api/v1/quiz/{accounts['quiz_id']}/start", headers=headers)
+
+def test_start_checks_registration_of_current_user(api, accounts, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "REQUIRE_REGISTRATION", True)
+    assert _start(api, accounts, accounts["user_headers"]).status_code == 403
+
+    registered = api.post(f"/api/v1/quiz/quizzes/{accounts['quiz_id']}/register", headers=accounts["user_headers"])
+    assert registered.status_code == 200, registered.text
+    assert _start(api, accounts, accounts["user_headers"]).status_code == 200
+    # 다른 사용자의 ID 를 쿼리로 넘겨도 요청한 사용자 기준으로 확인합니다.
+    response = api.get(
+        f"/api/v1/quiz/{accounts['quiz_id']}/start", params={"user_id": accounts["user_id"]}, headers=accounts["admin_headers"],
+    )
+    assert response.status_code == 403
+
+def test_bitmap_is_built_once_and_answers_without_db(db, accounts, fake_redis):
+    quiz_id = accounts["quiz_id"]
+    register_user_for_quiz(db, accounts["user_id"], quiz_id)
+    fake_redis.delete(quiz_registrations_key(quiz_id))
+
+    # 비트맵이 없으면 DB 에서 다시 만듭니다.
+    assert is_user_registered(db, quiz_id, accounts["user_id"])
+    key = quiz_registrations_key(quiz_id)
+    assert fake_redis.getbit(key, REGISTRATIONS_LOADED_BIT) == 1
+    assert fake_redis.bitcount(key) == 2
+
+    # 이후에는 DB 가 아닌 비트맵으로 답합니다.
+    db.query(UserQuizRegistration).delete()
+    db.commit()
+    assert is_user_registered(db, quiz_id, accounts["user_id"])
+    assert not is_user_registered(db, quiz_id, accounts["admin_id"])
+
+def test_register_and_unregister_update_bitmap(db, accounts, fake_redis):
+    quiz_id = accounts["quiz_id"]
+    assert load_registrations(db, quiz_id) == 0
+
+    register_user_for_quiz(db, accounts["admin_id"], quiz_id)
+    assert fake_redis.getbit(quiz_registrations_key(quiz_id), accounts["admin_id"]) == 1
+    unregister_user_from_quiz(db, accounts["admin_id"], quiz_id)
+    assert fake_redis.getbit(quiz_registrations_key(quiz_id), accounts["admin_id"]) == 0
+    assert fake_redis.get(quiz_registrations_version_key(quiz_id)) == "2"
+
+def test_rebuild_is_discarded_when_registrations_change(db, accounts, fake_redis, monkeypatch):
+    quiz_id = accounts["quiz_id"]
+    register_user_for_quiz(db, accounts["user_id"], quiz_id)
+    fake_redis.delete(quiz_registrations_key(quiz_id))
+
+    # 비트맵을 만드는 중에 등록이 바뀌면 오래된 비트맵으로 바꾸지 않습니다.
+    original_query = db.query
+
+    def query_and_register(*entities):
+        fake_redis.incr(quiz_registrations_version_key(quiz_id))
+        monkeypatch.setattr(db, "query", original_query)
+        return original_query(*entities)
+
+    monkeypatch.setattr(db, "query", query_and_register)
+    assert load_registrations(db, quiz_id) is None
+    assert not fake_redis.exists(quiz_registrations_key(quiz_id))
+    assert fake_redis.keys(f"{quiz_registrations_key(quiz_id)}:building:*") == []
+
+    assert load_registrations(db, quiz_id) == 1
@@ -0,0 +1,101 @@
+from app.models.choice import Choice
+from app.models.user import UserQuizScore
+from app.tasks.regrade import (
+    answer_key_fingerprint, load_answer_key, read_checkpoint, regrade_checkpoint_key, regrade_quiz, save_checkpoint,
+)
+
+# 정답을 바꾼 뒤 제출한 선택지가 정답인 문제 수
+CORRECTED = 3
+
+def _submit_first_choices(api, accounts, attempt):
+    """
+    모든 문제에서 첫 번째 선택지를 골라 제출
+    """
+    payload = attempt["payload"]
+    for question in payload["answers"][0]["questions"]:
+        question["choices"][0]["is_selected"] = True
+    submitted = api.post(
+        f"/api/v1/quiz/{attempt['quiz_id']}/submit",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json=payload,
+        headers=accounts["user_headers"],
+    )
+    assert submitted.status_code == 200, submitted.text
+
+def _change_answer_key(db, attempt):
+    """
+    앞의 CORRECTED 개 문제만 제출한 선택지가 정답이 되도록 정답을 바꿈
+    """
+    first_ids = {question["choices"][0]["id"] for question in attempt["questions"][:CORRECTED]}
+    question_ids = [question["id"] for question in attempt["questions"]]
+    for choice in db.query(Choice).filter(Choice.question_id.in_(question_ids)):
+        choice.is_correct = choice.id in first_ids
+    db.commit()
+
+def _score(db, attempt):
+    return db.query(UserQuizScore.score).filter(UserQuizScore.user_quiz_attempt_id == attempt["attempt_id"]).scalar()
+
+def test_regrade_updates_changed_scores_and_clears_checkpoint(api, accounts, attempt, db, fake_redis):
+    _submit_first_choices(api, accounts, attempt)
+    _change_answer_key(db, attempt)
+
+    stats = regrade_quiz(db, attempt["quiz_id"], batch_size=1)
+    assert stats == {"quiz_id": attempt["quiz_id"], "attempts": 1, "updated": 1, "skipped": 0}
+    db.expire_all()
+    assert _score(db, attempt) == CORRECTED
+    assert fake_redis.get(regrade_checkpoint_key(attempt["quiz_id"])) is None
+
+    # 다시 실행해도 점수가 같으면 고치지 않습니다.
+    assert regrade_quiz(db, attempt["quiz_id"])["updated"] == 0
+
+def test_regrade_resumes_after_checkpoint(api, accounts, attempt, db, fake_redis):
+    _submit_first_choices(api, accounts, attempt)
+    before = _score(db, attempt)
+    _change_answer_key(db, attempt)
+    fingerprint = answer_key_fingerprint(load_answer_key(db, attempt["quiz_id"])[0])
+    save_checkpoint(attempt["quiz_id"], fingerprint, attempt["attempt_id"])
+    assert read_checkpoint(attempt["quiz_id"], fingerprint) == attempt["attempt_id"]
+
+    # 기록된 응시까지는 이미 채점했으므로 건너뜁니다.
+    assert regrade_quiz(db, attempt["quiz_id"])["attempts"] == 0
+    assert _score(db, attempt) == before
+
+    # --restart 는 기록을 무시합니다.
+    assert regrade_quiz(db, attempt["quiz_id"], resume=False)["updated"] == 1
+
+def test_checkpoint_with_other_fingerprint_is_ignored(api, accounts, attempt, db, fake_redis):
+    _submit_first_choices(api, accounts, attempt)
+    save_checkpoint(attempt["quiz_id"], "stale", attempt["attempt_id"])
+    _change_answer_key(db, attempt)
+
+    # 기록 후 정답이 바뀌었으므로 처음부터 다시 채점합니다.
+    fingerprint = answer_key_fingerprint(load_answer_key(db, attempt["quiz_id"])[0])
+    assert read_checkpoint(attempt["quiz_id"], fingerprint) == 0
+    stats = regrade_quiz(db, attempt["quiz_id"])
+    assert (stats["attempts"], stats["updated"]) == (1, 1)
+    db.expire_all()
+    assert _score(db, attempt) == CORRECTED
+
+def test_regrade_keeps_submit_score_with_several_selected_choices(api, accounts, attempt, db, fake_redis):
+    # 문제마다 선택지를 모두 고르면 제출된 순서의 첫 선택지만 답안지에 저장하고 그 선택지로 채점합니다.
+    payload = attempt["payload"]
+    for question in payload["answers"][0]["questions"]:
+        question["choices"].reverse()
+        for choice in question["choices"]:
+            choice["is_selected"] = True
+    submitted = api.post(
+        f"/api/v1/quiz/{attempt['quiz_id']}/submit",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json=payload,
+        headers=accounts["user_headers"],
+    )
+    assert submitted.status_code == 200, submitted.text
+    score = _score(db, attempt)
+    stored_ids = {question["choices"][0]["id"] for question in payload["answers"][0]["questions"]}
+    correct_ids = set(load_answer_key(db, attempt["quiz_id"])[0])
+    assert score == len(stored_ids & correct_ids)
+
+    # 정답이 그대로면 다시 채점해도 점수가 바뀌지 않습니다.
+    assert regrade_quiz(db, attempt["quiz_id"], resume=False)["updated"] == 0
+    db.expire_all()
+    assert _score(db, attempt) == score
@@ -0,0 +1,46 @@
+from collections import Counter
+
+import pytest
+
+from app.crud import quiz as crud_quiz
+from app.crud.quiz import _allocate_quotas, read_random_questions, sample_question_ids
+
+ENTRIES = [[question_id, "easy" if question_id <= 70 else "hard", 1 + question_id % 3] for question_id in range(1, 101)]
+
+def test_same_seed_same_questions():
+    first = sample_question_ids(ENTRIES, 10, "quiz:1:attempt:1")
+    assert first == sample_question_ids(ENTRIES, 10, "quiz:1:attempt:1")
+    assert first != sample_question_ids(ENTRIES, 10, "quiz:1:attempt:2")
+    assert len(set(first)) == 10
+
+def test_asking_for_all_questions_keeps_order():
+    assert sample_question_ids(ENTRIES, 200, "seed") == list(range(1, 101))
+
+def test_stratified_sampling_follows_category_ratio():
+    selected = sample_question_ids(ENTRIES, 10, "seed", stratify_by="category")
+    categories = Counter("easy" if question_id <= 70 else "hard" for question_id in selected)
+    assert categories == {"easy": 7, "hard": 3}
+    assert selected == sample_question_ids(ENTRIES, 10, "seed", stratify_by="category")
+
+def test_quotas_use_largest_remainder():
+    assert _allocate_quotas({"a": 5, "b": 3, "c": 2}, 4) == {"a": 2, "b": 1, "c": 1}
+    assert sum(_allocate_quotas({1: 34, 2: 33, 3: 33}, 10).values()) == 10
+
+def test_sampled_start_reads_only_selected_questions(api, accounts, db, monkeypatch):
+    requested = []
+    by_ids = crud_quiz.read_questions_with_choices_by_ids
+
+    def read_by_ids(db, quiz_id, question_ids):
+        requested.append(list(question_ids))
+        return by_ids(db, quiz_id, question_ids)
+
+    def read_whole_bank(*args, **kwargs):
+        pytest.fail("sampled start must not read the whole question bank")
+
+    monkeypatch.setattr(crud_quiz, "read_questions_with_choices_by_ids", read_by_ids)
+    monkeypatch.setattr(crud_quiz, "read_questions_with_choices_by_quiz", read_whole_bank)
+    result = read_random_questions(db, accounts["user_id"], accounts["quiz_id"], num_questions=10)
+
+    assert requested == [[question["id"] for question in result["questions"]]]
+    assert len(result["questions"]) == 10
+    assert all(len(question["choices"]) == 5 for question in result["questions"])
@@ -0,0 +1,35 @@
+from app.crud.choice import update_choice
+from app.crud.question import create_question, search_questions
+from app.models.choice import Choice
+from app.models.quiz import Quiz
+from app.schemas.choice import ChoiceUpdate
+from app.schemas.question import QuestionCreate
+
+def _quiz(db, texts):
+    quiz = Quiz(title="quiz", description="quiz")
+    db.add(quiz)
+    db.commit()
+    return quiz.id, [create_question(db, QuestionCreate(quiz_id=quiz.id, text=text)).id for text in texts]
+
+def test_search_ranks_matches_and_pages(db, fake_redis):
+    quiz_id, ids = _quiz(db, ["python list comprehension", "python python generator", "java streams"])
+    other_quiz, _ = _quiz(db, ["python decorators"])
+
+    results, has_more = search_questions(db, "python", quiz_id=quiz_id)
+    assert {result["question_id"] for result in results} == set(ids[:2]) and not has_more
+    assert results[0]["rank"] >= results[1]["rank"]
+
+    page, has_more = search_questions(db, "python", limit=2)
+    assert len(page) == 2 and has_more
+    assert search_questions(db, "python java")[0] == []
+    # FTS5 연산자는 검색어로만 취급합니다.
+    assert search_questions(db, 'python" OR "java')[0] == []
+
+def test_choice_text_is_searchable(db, fake_redis):
+    _, (question_id,) = _quiz(db, ["capital of france"])
+    choice = Choice(question_id=question_id, text="lyon", is_correct=False, order=1)
+    db.add(choice)
+    db.commit()
+    update_choice(db, choice.id, ChoiceUpdate(text="paris"))
+    assert [result["question_id"] for result in search_questions(db, "paris")[0]] == [question_id]
+    assert search_questions(db, "lyon")[0] == []
@@ -0,0 +1,47 @@
+from app.utils.tag_index import QuizTagIndex, TagIndexRegistry, normalize_tags
+
+def _index():
+    index = QuizTagIndex(version=1)
+    index.set_tags(1, ["Algebra", "easy"])
+    index.set_tags(2, ["algebra", "hard"])
+    index.set_tags(3, ["geometry", "easy"])
+    index.set_tags(4, [])
+    return index
+
+def test_match_and_counts():
+    index = _index()
+    assert normalize_tags([" Easy", "easy", ""]) == ["easy"]
+    assert index.count(["algebra", "easy"]) == 1
+    assert index.count([]) == 4
+    assert index.count(["missing"]) == 0
+    assert index.tag_counts() == {"algebra": 2, "easy": 2, "geometry": 1, "hard": 1}
+
+    index.set_tags(1, ["geometry"])
+    index.remove(3)
+    assert index.tag_counts() == {"algebra": 1, "geometry": 1, "hard": 1}
+    assert index.count([]) == 3
+
+def test_blueprint_sampling_does_not_repeat_questions():
+    index = _index()
+    blueprint = [{"tags": ["easy"], "count": 2}, {"tags": ["algebra"], "count": 2}]
+    selected = index.sample(blueprint, "seed")
+    assert sorted(selected) == [1, 2, 3]
+    assert selected == index.sample(blueprint, "seed")
+
+def test_registry_patches_next_version_and_rebuilds_otherwise():
+    registry = TagIndexRegistry()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return [(1, "easy"), (2, None)]
+
+    index = registry.get(7, 10, loader)
+    assert registry.get(7, 10, loader) is index and len(loads) == 1
+
+    registry.apply_question(7, 11, 2, ["easy"])
+    assert registry.get(7, 11, loader).count(["easy"]) == 2 and len(loads) == 1
+
+    # 버전이 건너뛰면(다른 워커의 변경) 버리고 다시 적재합니다.
+    registry.apply_question(7, 13, 3, ["easy"])
+    assert registry.get(7, 13, loader).count(["easy"]) == 1 and len(loads) == 2
@@ -0,0 +1,38 @@
+from app.crud.quiz import validate_quiz, validate_quizzes
+from app.crud.question import delete_question
+from app.models.choice import Choice
+from app.models.question import Question
+from app.models.quiz import Quiz
+
+def _quiz(db, orders):
+    quiz = Quiz(title="quiz", description="quiz")
+    db.add(quiz)
+    db.flush()
+    questions = []
+    for order in orders:
+        question = Question(quiz_id=quiz.id, text=f"question {order}", order=order)
+        question.choices = [Choice(text="a", is_correct=True, order=1), Choice(text="b", is_correct=False, order=2)]
+        db.add(question)
+        db.flush()
+        questions.append(question)
+    # 삽입 시 순번을 자동으로 매기므로 원하는 순번으로 다시 맞춥니다.
+    for question, order in zip(questions, orders):
+        question.order = order
+    db.commit()
+    return quiz.id
+
+def test_deleted_question_is_a_single_gap(db, fake_redis):
+    quiz_id = _quiz(db, [1, 2, 3, 4, 5])
+    assert validate_quiz(db, quiz_id)["valid"]
+
+    second = db.query(Question.id).filter(Question.quiz_id == quiz_id, Question.order == 2).scalar()
+    delete_question(db, second)
+    violations = validate_quizzes(db, [quiz_id])[quiz_id]["violations"]
+    assert [violation["type"] for violation in violations] == ["order_gap"]
+
+def test_duplicate_and_leading_gap(db, fake_redis):
+    duplicate = _quiz(db, [1, 2, 2, 3])
+    leading = _quiz(db, [2, 3, 4])
+    results = validate_quizzes(db, [duplicate, leading])
+    assert [violation["type"] for violation in results[duplicate]["violations"]] == ["order_duplicate"]
+    assert [violation["type"] for violation in results[leading]["violations"]] == ["order_gap"]
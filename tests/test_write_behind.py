@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy import text
+
+from app.crud.quiz import ANSWERS_DIRTY_KEY, attempt_answers_key
+from app.models.user import UserQuizAttemptProgress
+from app.tasks import write_behind
+from app.tasks.write_behind import WriteBehindWorker, flush_dirty_answers
+
+def _answer(api, accounts, attempt, question, choice_index=0, headers=None):
+    return api.patch(
+        f"/api/v1/quiz/{attempt['quiz_id']}/answer",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json={
+            "quiz_attempt_id": attempt["attempt_id"],
+            "question_id": question["id"],
+            "selected_choice_id": question["choices"][choice_index]["id"],
+        },
+        headers=headers or accounts["user_headers"],
+    )
+
+def _progress(db, attempt_id):
+    db.expire_all()
+    return {
+        row.question_id: row.choice_id
+        for row in db.query(UserQuizAttemptProgress).filter(UserQuizAttemptProgress.attempt_id == attempt_id)
+    }
+
+def test_dirty_attempts_are_upserted_and_removed(api, accounts, attempt, db, fake_redis):
+    first, second = attempt["questions"][:2]
+    assert _answer(api, accounts, attempt, first).status_code == 200
+    assert _answer(api, accounts, attempt, second, 1).status_code == 200
+
+    assert flush_dirty_answers(db) == 1
+    assert _progress(db, attempt["attempt_id"]) == {first["id"]: first["choices"][0]["id"], second["id"]: second["choices"][1]["id"]}
+    assert not fake_redis.exists(ANSWERS_DIRTY_KEY)
+    assert flush_dirty_answers(db) == 0
+
+def test_later_write_overwrites_choice(api, accounts, attempt, db, fake_redis):
+    question = attempt["questions"][0]
+    _answer(api, accounts, attempt, question, 0)
+    flush_dirty_answers(db)
+    _answer(api, accounts, attempt, question, 2)
+    flush_dirty_answers(db)
+    assert _progress(db, attempt["attempt_id"]) == {question["id"]: question["choices"][2]["id"]}
+
+def test_answer_outside_attempt_layout_is_rejected(api, accounts, attempt, fake_redis):
+    question, other = attempt["questions"][:2]
+    response = api.patch(
+        f"/api/v1/quiz/{attempt['quiz_id']}/answer",
+        params={"user_quiz_attempt_id": attempt["attempt_id"]},
+        json={"quiz_attempt_id": attempt["attempt_id"], "question_id": question["id"], "selected_choice_id": other["choices"][0]["id"]},
+        headers=accounts["user_headers"],
+    )
+    assert response.status_code == 400
+    assert not fake_redis.exists(attempt_answers_key(attempt["quiz_id"], attempt["attempt_id"]))
+    assert not fake_redis.exists(ANSWERS_DIRTY_KEY)
+
+def test_bad_attempt_does_not_block_batch(api, accounts, attempt, db, fake_redis):
+    db.execute(text("PRAGMA foreign_keys=ON"))
+    question = attempt["questions"][0]
+    _answer(api, accounts, attempt, question)
+    # 응시 중 삭제된 선택지의 답안은 옮기지 않습니다.
+    fake_redis.hset(attempt_answers_key(attempt["quiz_id"], attempt["attempt_id"]), attempt["questions"][1]["id"], 999999)
+    # 없는 응시는 FK 위반으로 저장에 실패합니다.
+    fake_redis.hset(attempt_answers_key(attempt["quiz_id"], 999999), question["id"], question["choices"][0]["id"])
+    fake_redis.sadd(ANSWERS_DIRTY_KEY, f"{attempt['quiz_id']}:999999")
+
+    assert flush_dirty_answers(db) == 1
+    assert _progress(db, attempt["attempt_id"]) == {question["id"]: question["choices"][0]["id"]}
+    # 실패한 응시만 다음 주기에 다시 처리합니다.
+    assert fake_redis.smembers(ANSWERS_DIRTY_KEY) == {f"{attempt['quiz_id']}:999999"}
+
+def test_failed_flush_puts_members_back(api, accounts, attempt, db, fake_redis, monkeypatch):
+    _answer(api, accounts, attempt, attempt["questions"][0])
+
+    commit = db.commit
+
+    def fail():
+        raise RuntimeError("commit failed")
+
+    monkeypatch.setattr(db, "commit", fail)
+    with pytest.raises(RuntimeError):
+        flush_dirty_answers(db)
+    assert fake_redis.smembers(ANSWERS_DIRTY_KEY) == {f"{attempt['quiz_id']}:{attempt['attempt_id']}"}
+
+    monkeypatch.setattr(db, "commit", commit)
+    assert flush_dirty_answers(db) == 1
+    assert len(_progress(db, attempt["attempt_id"])) == 1
+
+def test_worker_drains_dirty_set_in_batches(api, accounts, attempt, db, session_factory, fake_redis, monkeypatch):
+    started = api.get(f"/api/v1/quiz/{attempt['quiz_id']}/start", headers=accounts["admin_headers"]).json()
+    other = {"quiz_id": attempt["quiz_id"], "attempt_id": started["user_quiz_attempt_id"]}
+    _answer(api, accounts, attempt, attempt["questions"][0])
+    _answer(api, accounts, other, started["questions"][0], headers=accounts["admin_headers"])
+
+    monkeypatch.setattr(write_behind, "SessionLocal", session_factory)
+    WriteBehindWorker(interval=60, batch_size=1).run_once()
+    assert not fake_redis.exists(ANSWERS_DIRTY_KEY)
+    assert len(_progress(db, attempt["attempt_id"])) == len(_progress(db, other["attempt_id"])) == 1